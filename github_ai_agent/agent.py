@@ -14,6 +14,7 @@ workflow for issue resolution.
 import json
 import logging
 import warnings
+from contextvars import ContextVar
 from dataclasses import dataclass
 from typing import Annotated, Any, Dict, List, Optional, TypedDict
 
@@ -21,7 +22,6 @@ from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
 from langchain_core.tools import Tool
 from langchain_openai import ChatOpenAI
 from langgraph.checkpoint.memory import MemorySaver
-from langgraph.graph import END
 from langgraph.graph.message import add_messages
 from langgraph.prebuilt import create_react_agent
 
@@ -29,7 +29,6 @@ from .github_client import GitHubClient
 from .config import get_system_prompt, get_human_message_template, get_tool_description
 from .mcp_client import MCPClient
 from .logging_utils import (
-    Colors,
     log_agent_action,
     log_llm_interaction,
     log_tool_usage,
@@ -38,6 +37,21 @@ from .logging_utils import (
 
 logger = logging.getLogger(__name__)
 
+# Suppress MCP SDK cleanup warnings (harmless asyncio shutdown issue). Installed
+# once at import rather than on every agent construction.
+warnings.filterwarnings(
+    "ignore",
+    category=RuntimeWarning,
+    message=".*unhandled exception during asyncio.run.*",
+)
+
+# Per-issue tool context. Context variables keep concurrent process_issue calls
+# (one per worker thread) from seeing each other's branch and issue number.
+_current_branch: ContextVar[Optional[str]] = ContextVar("current_branch", default=None)
+_current_issue_number: ContextVar[Optional[int]] = ContextVar(
+    "current_issue_number", default=None
+)
+
 
 # ============================================================================
 # STATE MANAGEMENT
@@ -98,6 +112,22 @@ class IssueProcessingResult:
     error_message: Optional[str] = None
 
 
+@dataclass
+class IssueContext:
+    """
+    Read-only inputs for processing an issue, prepared before any writes.
+
+    Attributes:
+        issue: GitHub issue object
+        issue_data: Issue fields passed to the agent state
+        messages: System and human messages that start the conversation
+    """
+
+    issue: Any
+    issue_data: Dict[str, Any]
+    messages: List[BaseMessage]
+
+
 # ============================================================================
 # MAIN AGENT CLASS
 # ============================================================================
@@ -167,10 +197,6 @@ class GitHubIssueAgent:
         self.mcp_client = None
         if enable_mcp:
             try:
-                # Suppress MCP SDK cleanup warnings (harmless asyncio shutdown issue)
-                warnings.filterwarnings("ignore", category=RuntimeWarning, 
-                                      message=".*unhandled exception during asyncio.run.*")
-                
                 self.mcp_client = MCPClient(mcp_config_file)
                 log_agent_action("MCP client initialized", "MCP_INIT")
             except Exception as e:
@@ -279,7 +305,7 @@ class GitHubIssueAgent:
 
             try:
                 # Retrieve the current branch context
-                current_branch = getattr(self, "_current_branch", None)
+                current_branch = _current_branch.get()
                 if not current_branch:
                     error_msg = "No branch available for file creation"
                     log_error(error_msg, "ACTION")
@@ -308,7 +334,7 @@ class GitHubIssueAgent:
                 )
 
                 # Generate contextual commit message
-                current_issue_number = getattr(self, "_current_issue_number", "unknown")
+                current_issue_number = _current_issue_number.get() or "unknown"
                 commit_message = (
                     f"Create {filename} as requested in issue #{current_issue_number}"
                 )
@@ -358,7 +384,7 @@ class GitHubIssueAgent:
 
             try:
                 # Retrieve the current branch context
-                current_branch = getattr(self, "_current_branch", None)
+                current_branch = _current_branch.get()
                 if not current_branch:
                     error_msg = "No branch available for listing repository"
                     log_error(error_msg, "ACTION")
@@ -399,7 +425,7 @@ class GitHubIssueAgent:
 
             try:
                 # Retrieve the current branch context
-                current_branch = getattr(self, "_current_branch", None)
+                current_branch = _current_branch.get()
                 if not current_branch:
                     error_msg = "No branch available for reading file"
                     log_error(error_msg, "ACTION")
@@ -467,14 +493,14 @@ class GitHubIssueAgent:
                     )
 
                 # Retrieve the current branch context
-                current_branch = getattr(self, "_current_branch", None)
+                current_branch = _current_branch.get()
                 if not current_branch:
                     error_msg = "No branch available for editing file"
                     log_error(error_msg, "ACTION")
                     return json.dumps({"success": False, "error": error_msg})
 
                 # Generate contextual commit message
-                current_issue_number = getattr(self, "_current_issue_number", "unknown")
+                current_issue_number = _current_issue_number.get() or "unknown"
                 commit_message = (
                     f"Edit {filename} as requested in issue #{current_issue_number}"
                 )
@@ -512,7 +538,7 @@ class GitHubIssueAgent:
             except Exception as e:
                 error_msg = f"Error editing file: {e}"
                 log_tool_usage("edit_file_in_repo", error_msg, "ERROR")
-                current_branch = getattr(self, "_current_branch", "unknown")
+                current_branch = _current_branch.get() or "unknown"
                 return json.dumps(
                     {
                         "success": False,
@@ -538,14 +564,14 @@ class GitHubIssueAgent:
                     )
 
                 # Retrieve the current branch context
-                current_branch = getattr(self, "_current_branch", None)
+                current_branch = _current_branch.get()
                 if not current_branch:
                     error_msg = "No branch available for deleting file"
                     log_error(error_msg, "ACTION")
                     return json.dumps({"success": False, "error": error_msg})
 
                 # Generate contextual commit message
-                current_issue_number = getattr(self, "_current_issue_number", "unknown")
+                current_issue_number = _current_issue_number.get() or "unknown"
                 commit_message = (
                     f"Delete {filename} as requested in issue #{current_issue_number}"
                 )
@@ -581,7 +607,7 @@ class GitHubIssueAgent:
             except Exception as e:
                 error_msg = f"Error deleting file: {e}"
                 log_tool_usage("delete_file_from_repo", error_msg, "ERROR")
-                current_branch = getattr(self, "_current_branch", "unknown")
+                current_branch = _current_branch.get() or "unknown"
                 return json.dumps(
                     {
                         "success": False,
@@ -664,9 +690,9 @@ class GitHubIssueAgent:
         4. Handle file creation and pull request generation
         5. Update the original issue with results
 
-        The method uses LangGraph's streaming capabilities to monitor the
-        agent's reasoning process and provides comprehensive error handling
-        for robust operation.
+        Steps 1-2 are available separately as ``setup_context`` and steps 3-5
+        as ``apply_changes``, so callers can overlap the read-only setup with
+        branch creation.
 
         Args:
             issue_number: GitHub issue number to process
@@ -678,76 +704,128 @@ class GitHubIssueAgent:
             IssueProcessingResult containing success status and relevant metadata
         """
         try:
-            log_agent_action(f"Starting to process issue #{issue_number}", "START")
-
-            # ================================================================
-            # STEP 1: Fetch Issue Data
-            # ================================================================
-            log_agent_action(f"Fetching issue #{issue_number} from GitHub", "FETCH")
-            issue = self.github_client.get_issue(issue_number)
-            if not issue:
-                error_msg = f"Issue #{issue_number} not found"
-                log_error(error_msg, "ISSUE_NOT_FOUND")
-                return IssueProcessingResult(success=False, error_message=error_msg)
+            context = self.setup_context(issue_number, additional_context)
+        except Exception as e:
+            error_msg = f"Error processing issue #{issue_number}: {e}"
+            log_error(error_msg, "EXCEPTION")
+            logger.error(error_msg, exc_info=True)
+            return IssueProcessingResult(success=False, error_message=str(e))
 
-            log_agent_action(
-                f"Successfully fetched issue #{issue_number}: {issue.title}"
+        if context is None:
+            return IssueProcessingResult(
+                success=False, error_message=f"Issue #{issue_number} not found"
             )
 
-            # ================================================================
-            # STEP 2: Prepare Issue Context
-            # ================================================================
-            issue_data = {
-                "number": issue.number,
-                "title": issue.title,
-                "body": issue.body or "",
-                "user": issue.user.login if issue.user else "unknown",
-                "labels": [label.name for label in issue.labels],
-            }
+        return self.apply_changes(context, branch_name, draft_pr_number)
 
-            log_agent_action(
-                f"Issue data prepared - Title: {issue_data['title']}, User: {issue_data['user']}, Labels: {issue_data['labels']}"
-            )
+    def setup_context(
+        self, issue_number: int, additional_context: Optional[str] = None
+    ) -> Optional[IssueContext]:
+        """
+        Gather the read-only inputs for processing an issue.
 
-            # ================================================================
-            # STEP 3: Prepare Agent Messages
-            # ================================================================
-            log_agent_action("Creating system and human messages", "MESSAGE_PREP")
-
-            # System message provides the agent's role and capabilities
-            system_message = SystemMessage(content=self._get_system_prompt())
-
-            # Human message provides the specific issue context and instructions
-            human_message = HumanMessage(
-                content=get_human_message_template(
-                    target_owner=self.github_client.target_owner,
-                    target_repo=self.github_client.target_repo,
-                    issue_number=issue.number,
-                    issue_title=issue.title,
-                    issue_description=issue.body or "No description provided",
-                    additional_context=additional_context,
-                )
-            )
+        Fetches the issue and builds the system and human messages. Nothing is
+        written to the repository, so this can run while the working branch is
+        still being created.
 
-            log_agent_action(
-                "Messages created, preparing to invoke agent", "MESSAGE_READY"
+        Args:
+            issue_number: GitHub issue number to process
+            additional_context: Additional context for the agent (e.g., PR comments)
+
+        Returns:
+            IssueContext for the issue, or None if the issue was not found
+        """
+        log_agent_action(f"Starting to process issue #{issue_number}", "START")
+
+        # ================================================================
+        # STEP 1: Fetch Issue Data
+        # ================================================================
+        log_agent_action(f"Fetching issue #{issue_number} from GitHub", "FETCH")
+        issue = self.github_client.get_issue(issue_number)
+        if not issue:
+            error_msg = f"Issue #{issue_number} not found"
+            log_error(error_msg, "ISSUE_NOT_FOUND")
+            return None
+
+        log_agent_action(f"Successfully fetched issue #{issue_number}: {issue.title}")
+
+        # ================================================================
+        # STEP 2: Prepare Issue Context
+        # ================================================================
+        issue_data = {
+            "number": issue.number,
+            "title": issue.title,
+            "body": issue.body or "",
+            "user": issue.user.login if issue.user else "unknown",
+            "labels": [label.name for label in issue.labels],
+        }
+
+        log_agent_action(
+            f"Issue data prepared - Title: {issue_data['title']}, User: {issue_data['user']}, Labels: {issue_data['labels']}"
+        )
+
+        # ================================================================
+        # STEP 3: Prepare Agent Messages
+        # ================================================================
+        log_agent_action("Creating system and human messages", "MESSAGE_PREP")
+
+        # System message provides the agent's role and capabilities
+        system_message = SystemMessage(content=self._get_system_prompt())
+
+        # Human message provides the specific issue context and instructions
+        human_message = HumanMessage(
+            content=get_human_message_template(
+                target_owner=self.github_client.target_owner,
+                target_repo=self.github_client.target_repo,
+                issue_number=issue.number,
+                issue_title=issue.title,
+                issue_description=issue.body or "No description provided",
+                additional_context=additional_context,
             )
+        )
 
+        log_agent_action("Messages created, preparing to invoke agent", "MESSAGE_READY")
+
+        return IssueContext(
+            issue=issue,
+            issue_data=issue_data,
+            messages=[system_message, human_message],
+        )
+
+    def apply_changes(
+        self,
+        context: IssueContext,
+        branch_name: Optional[str] = None,
+        draft_pr_number: Optional[int] = None,
+    ) -> IssueProcessingResult:
+        """
+        Run the ReAct agent for a prepared issue and publish its changes.
+
+        Args:
+            context: Inputs gathered by ``setup_context``
+            branch_name: Pre-created branch name (if None, assumes one exists)
+            draft_pr_number: Pre-created draft PR number (if provided, will be updated to ready)
+
+        Returns:
+            IssueProcessingResult containing success status and relevant metadata
+        """
+        issue = context.issue
+        try:
             # ================================================================
             # STEP 4: Set Tool Context
             # ================================================================
-            # These temporary instance variables provide context to the tool
-            # during execution. They're cleaned up after processing.
-            self._current_branch = branch_name
-            self._current_issue_number = issue.number
+            # These context variables provide context to the tools during
+            # execution. They're cleaned up after processing.
+            _current_branch.set(branch_name)
+            _current_issue_number.set(issue.number)
 
             # ================================================================
             # STEP 5: Execute ReAct Agent
             # ================================================================
             # Initialize the agent state with all necessary context
             initial_state = AgentState(
-                messages=[system_message, human_message],
-                issue_data=issue_data,
+                messages=list(context.messages),
+                issue_data=context.issue_data,
                 generated_content=None,
                 branch_name=branch_name,
                 pr_created=False,
@@ -771,11 +849,11 @@ class GitHubIssueAgent:
             # STEP 6: Process Results
             # ================================================================
             return self._process_agent_results(
-                final_state, issue, branch_name, issue_number, draft_pr_number
+                final_state, issue, branch_name, issue.number, draft_pr_number
             )
 
         except Exception as e:
-            error_msg = f"Error processing issue #{issue_number}: {e}"
+            error_msg = f"Error processing issue #{issue.number}: {e}"
             log_error(error_msg, "EXCEPTION")
             logger.error(error_msg, exc_info=True)
             return IssueProcessingResult(success=False, error_message=str(e))
@@ -916,11 +994,9 @@ class GitHubIssueAgent:
         # ================================================================
         # Cleanup Temporary State
         # ================================================================
-        # Clean up temporary instance variables used by tools
-        if hasattr(self, "_current_branch"):
-            delattr(self, "_current_branch")
-        if hasattr(self, "_current_issue_number"):
-            delattr(self, "_current_issue_number")
+        # Clean up temporary context variables used by tools
+        _current_branch.set(None)
+        _current_issue_number.set(None)
 
         # ================================================================
         # Create Fallback File if Needed
@@ -1,5 +1,6 @@
 """Configuration management for the GitHub AI Agent."""
 
+import functools
 import os
 from typing import Optional, Dict, Any
 
@@ -40,6 +41,9 @@ class Settings(BaseSettings):
         default="Test-AI-Agent",
         description="GitHub username to filter issues by assignee",
     )
+    issue_label: str = Field(
+        default="AI Agent", description="Label that marks issues for the AI Agent"
+    )
 
     # OpenAI settings
     openai_api_key: str = Field(..., description="OpenAI API key")
@@ -47,17 +51,59 @@ class Settings(BaseSettings):
 
     # Agent settings
     poll_interval: int = Field(default=300, description="Polling interval in seconds")
+    max_poll_interval: int = Field(
+        default=1800,
+        description="Longest polling interval in seconds after backing off on idle polls",
+    )
     max_iterations: int = Field(default=20, description="Maximum agent iterations")
     recursion_limit: int = Field(
         default=50, description="Maximum recursion limit for LangGraph agent"
     )
+    max_concurrency: int = Field(
+        default=3, description="Maximum number of issues processed concurrently"
+    )
+    setup_concurrency: int = Field(
+        default=4,
+        description="Maximum number of issues whose branch and draft PR are set up concurrently",
+    )
+    async_concurrency: int = Field(
+        default=8, description="Maximum concurrent GitHub API page requests"
+    )
+
+    # Webhook settings
+    webhook_enabled: bool = Field(
+        default=False,
+        description="Receive GitHub issue events via webhook in daemon mode",
+    )
+    webhook_secret: Optional[str] = Field(
+        default=None, description="Secret used to validate webhook deliveries"
+    )
+    webhook_host: str = Field(
+        default="0.0.0.0", description="Interface the webhook server binds to"
+    )
+    webhook_port: int = Field(default=8080, description="Webhook server port")
+    webhook_fallback_interval: int = Field(
+        default=600,
+        description="Fallback polling interval in seconds when webhooks are enabled",
+    )
+
+    # State settings
+    processed_db_path: str = Field(
+        default="processed.db",
+        description="SQLite database recording processed issues across restarts",
+    )
 
     # Logging
     log_level: str = Field(default="INFO", description="Logging level")
 
 
+@functools.lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get application settings."""
+    """Get application settings.
+
+    Settings are parsed and validated once; later calls return the same
+    instance. Use ``get_settings.cache_clear()`` to reload them.
+    """
     return Settings()
 
 
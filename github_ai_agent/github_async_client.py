@@ -0,0 +1,892 @@
+"""Async GitHub API client for non-blocking issue polling and branch setup."""
+
+import asyncio
+import importlib.util
+import logging
+import random
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple, cast
+
+import httpx
+
+from .github_client import find_issue_reference
+from .logging_utils import log_error, log_github_action
+
+logger = logging.getLogger(__name__)
+
+GITHUB_API_URL = "https://api.github.com"
+
+# HTTP/2 multiplexes concurrent requests over a single connection, but needs
+# the optional ``h2`` package; fall back to HTTP/1.1 keep-alive without it.
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Pause all requests once fewer than this many remain in the rate-limit window
+RATE_LIMIT_BUFFER = 100
+# Retries for rate-limited requests, backing off 1, 2, 4, 8, 16 s plus jitter
+MAX_RETRIES = 5
+# Responses kept for ETag revalidation; 304 replies don't count against the
+# rate limit and carry no body
+ETAG_CACHE_SIZE = 256
+# How long create_branch waits for concurrent calls to join the same batch
+BRANCH_BATCH_WINDOW = 0.05
+
+# Branches created for issues are named AGENT_BRANCH_PREFIX + issue number
+AGENT_BRANCH_PREFIX = "ai-agent/issue-"
+
+# Fields of the base branch head commit needed to start a new branch
+_BASE_REF_FIELDS = """
+    id
+    ref(qualifiedName: $base) {
+      target { oid ... on Commit { tree { oid } } }
+    }
+"""
+
+# Labeled issues together with the repository id and base branch head commit,
+# so branch creation needs no further lookups
+LABELED_ISSUES_QUERY = (
+    """
+query($owner: String!, $name: String!, $label: String!, $states: [IssueState!],
+      $since: DateTime, $base: String!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    issues(first: 100, labels: [$label], states: $states, after: $cursor,
+           filterBy: {since: $since}) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        number
+        title
+        body
+        updatedAt
+        labels(first: 20) { nodes { name } }
+        assignees(first: 10) { nodes { login } }
+      }
+    }
+"""
+    + _BASE_REF_FIELDS
+    + """
+  }
+}
+"""
+)
+
+# Open pull requests with their recent comments, so the follow-up check needs
+# no per-PR requests
+OPEN_PRS_WITH_COMMENTS_QUERY = """
+query($owner: String!, $name: String!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    pullRequests(states: OPEN, first: 50, after: $cursor) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        number
+        title
+        body
+        closingIssuesReferences(first: 1) { nodes { number } }
+        comments(last: 50) {
+          nodes { databaseId body createdAt updatedAt author { login } }
+        }
+      }
+    }
+  }
+}
+"""
+
+# Head branches of open pull requests, used to tell which issues have work in
+# flight
+OPEN_PR_HEADS_QUERY = """
+query($owner: String!, $name: String!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    pullRequests(states: OPEN, first: 100, after: $cursor) {
+      pageInfo { hasNextPage endCursor }
+      nodes { headRefName }
+    }
+  }
+}
+"""
+
+BASE_REF_QUERY = (
+    """
+query($owner: String!, $name: String!, $base: String!) {
+  repository(owner: $owner, name: $name) {
+"""
+    + _BASE_REF_FIELDS
+    + """
+  }
+}
+"""
+)
+
+CREATE_REF_MUTATION = """
+mutation($repositoryId: ID!, $name: String!, $oid: GitObjectID!) {
+  createRef(input: {repositoryId: $repositoryId, name: $name, oid: $oid}) {
+    ref { name }
+  }
+}
+"""
+
+
+def _create_refs_mutation(count: int) -> str:
+    """Build a mutation creating ``count`` refs as aliases ``b0`` .. ``bN``.
+
+    Branch names are passed as ``$name0`` .. ``$nameN`` variables, all refs
+    point at ``$oid`` in repository ``$repositoryId``.
+    """
+    names = ", ".join(f"$name{i}: String!" for i in range(count))
+    fields = "\n".join(
+        f"  b{i}: createRef(input: {{repositoryId: $repositoryId, name: $name{i}, "
+        f"oid: $oid}}) {{ ref {{ name }} }}"
+        for i in range(count)
+    )
+    return f"mutation($repositoryId: ID!, $oid: GitObjectID!, {names}) {{\n{fields}\n}}"
+
+
+_GRAPHQL_STATES = {
+    "open": ["OPEN"],
+    "closed": ["CLOSED"],
+    "all": ["OPEN", "CLOSED"],
+}
+
+
+class GitHubGraphQLError(Exception):
+    """Raised when a GitHub GraphQL response contains errors."""
+
+
+@dataclass
+class IssueSummary:
+    """Issue fields needed to pick up and process an issue."""
+
+    number: int
+    title: str
+    body: str = ""
+    labels: List[str] = field(default_factory=list)
+    assignees: List[str] = field(default_factory=list)
+    updated_at: str = ""
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "IssueSummary":
+        """Build a summary from a REST API issue payload."""
+        return cls(
+            number=data["number"],
+            title=data.get("title", ""),
+            body=data.get("body") or "",
+            labels=[label["name"] for label in data.get("labels", [])],
+            assignees=[user["login"] for user in data.get("assignees", [])],
+            updated_at=data.get("updated_at") or "",
+        )
+
+    @classmethod
+    def from_graphql(cls, node: Dict[str, Any]) -> "IssueSummary":
+        """Build a summary from a GraphQL issue node."""
+        return cls(
+            number=node["number"],
+            title=node.get("title", ""),
+            body=node.get("body") or "",
+            labels=[label["name"] for label in node["labels"]["nodes"]],
+            assignees=[user["login"] for user in node["assignees"]["nodes"]],
+            updated_at=node.get("updatedAt") or "",
+        )
+
+
+@dataclass
+class BaseCommit:
+    """Head commit of the branch new agent branches start from."""
+
+    repository_id: str
+    oid: str
+    tree_oid: str
+
+
+class AsyncGitHubClient:
+    """Async GitHub REST client sharing one connection pool across requests."""
+
+    def __init__(
+        self,
+        token: str,
+        target_owner: str,
+        target_repo: str,
+        base_url: str = GITHUB_API_URL,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        max_concurrent_requests: int = 8,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """Initialize the async GitHub client.
+
+        Args:
+            token: GitHub API token
+            target_owner: Repository owner
+            target_repo: Repository name
+            base_url: GitHub API base URL
+            max_connections: Maximum number of open connections
+            max_keepalive_connections: Maximum number of idle pooled connections
+            max_concurrent_requests: Maximum number of pages fetched in parallel
+            transport: Optional transport override (used in tests)
+        """
+        self.target_owner = target_owner
+        self.target_repo = target_repo
+        self._page_semaphore = asyncio.Semaphore(max_concurrent_requests)
+        # Rate-limit state shared by all concurrent requests on this token
+        self._rate_limit_lock = asyncio.Lock()
+        self._rate_limit_remaining: Optional[int] = None
+        self._rate_limit_reset: float = 0.0
+        # Per-poll caches for branch creation, keyed by base branch name
+        self._base_commits: Dict[str, BaseCommit] = {}
+        self._wip_commits: Dict[str, str] = {}
+        self._wip_commit_lock = asyncio.Lock()
+        # Last 200 response per GET URL and params, revalidated via ETag
+        self._etag_cache: "OrderedDict[Tuple[Any, ...], httpx.Response]" = OrderedDict()
+        # Branches waiting to be created in the next batch, keyed by base branch
+        self._pending_branches: Dict[str, Dict[str, "asyncio.Future[bool]"]] = {}
+        self._batch_tasks: Set["asyncio.Task[None]"] = set()
+        self.client = httpx.AsyncClient(
+            base_url=base_url,
+            http2=HTTP2_AVAILABLE and transport is None,
+            headers={
+                "Authorization": f"Bearer {token}",
+                "Accept": "application/vnd.github+json",
+                "User-Agent": "GitHub-AI-Agent/1.0",
+                "X-GitHub-Api-Version": "2022-11-28",
+            },
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+            timeout=httpx.Timeout(30.0),
+            transport=transport,
+        )
+
+    @property
+    def repo_path(self) -> str:
+        """REST path of the target repository."""
+        return f"/repos/{self.target_owner}/{self.target_repo}"
+
+    async def _request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a request, respecting GitHub's primary and secondary rate limits.
+
+        Requests wait for the rate-limit window to reset when the remaining
+        budget drops below ``RATE_LIMIT_BUFFER``. Rate-limited responses (403 or
+        429) are retried up to ``MAX_RETRIES`` times, honouring ``Retry-After``
+        and otherwise backing off exponentially with jitter.
+
+        Args:
+            method: HTTP method
+            url: Request URL, relative to the API base URL
+            **kwargs: Additional arguments passed to ``httpx.AsyncClient.request``
+
+        Returns:
+            The final response
+        """
+        for attempt in range(MAX_RETRIES + 1):
+            async with self._rate_limit_lock:
+                if (
+                    self._rate_limit_remaining is not None
+                    and self._rate_limit_remaining < RATE_LIMIT_BUFFER
+                ):
+                    wait = self._rate_limit_reset - time.time()
+                    if wait > 0:
+                        log_github_action(
+                            f"Rate limit nearly exhausted, waiting {wait:.0f}s",
+                            "RATE_LIMIT",
+                        )
+                        await asyncio.sleep(wait)
+                    self._rate_limit_remaining = None
+
+            response = await self.client.request(method, url, **kwargs)
+            self._update_rate_limit(response)
+
+            if attempt == MAX_RETRIES or not self._is_rate_limited(response):
+                return response
+
+            delay = self._retry_delay(response, attempt)
+            log_github_action(
+                f"Rate limited on {method} {url}, retrying in {delay:.1f}s "
+                f"({attempt + 1}/{MAX_RETRIES})",
+                "RATE_LIMIT",
+            )
+            await asyncio.sleep(delay)
+
+        return response
+
+    async def _get(self, url: str, params: Dict[str, Any]) -> httpx.Response:
+        """Send a conditional GET, reusing the cached response on 304.
+
+        Responses carrying an ``ETag`` are cached (up to ``ETAG_CACHE_SIZE``)
+        and later requests for the same URL and params send ``If-None-Match``.
+        An unchanged resource then costs one bodiless round-trip and no
+        rate-limit budget.
+
+        Args:
+            url: Request URL, relative to the API base URL
+            params: Query parameters
+
+        Returns:
+            The fresh response, or the cached one if the resource is unchanged
+        """
+        key = (url, tuple(sorted(params.items())))
+        cached = self._etag_cache.get(key)
+        headers = {"If-None-Match": cached.headers["ETag"]} if cached else None
+
+        response = await self._request("GET", url, params=params, headers=headers)
+
+        if response.status_code == 304 and cached is not None:
+            self._etag_cache.move_to_end(key)
+            return cached
+        if response.status_code == 200 and "ETag" in response.headers:
+            self._etag_cache[key] = response
+            self._etag_cache.move_to_end(key)
+            if len(self._etag_cache) > ETAG_CACHE_SIZE:
+                self._etag_cache.popitem(last=False)
+        return response
+
+    def _update_rate_limit(self, response: httpx.Response) -> None:
+        """Record the rate-limit budget reported by a response."""
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        reset = response.headers.get("X-RateLimit-Reset")
+        if remaining is not None:
+            self._rate_limit_remaining = int(remaining)
+        if reset is not None:
+            self._rate_limit_reset = float(reset)
+
+    @staticmethod
+    def _is_rate_limited(response: httpx.Response) -> bool:
+        """Return True if the response is a primary or secondary rate limit."""
+        if response.status_code == 429:
+            return True
+        return response.status_code == 403 and (
+            "Retry-After" in response.headers
+            or response.headers.get("X-RateLimit-Remaining") == "0"
+        )
+
+    @staticmethod
+    def _retry_delay(response: httpx.Response, attempt: int) -> float:
+        """Seconds to wait before retrying a rate-limited request."""
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None:
+            return float(retry_after)
+        if response.headers.get("X-RateLimit-Remaining") == "0":
+            reset = float(response.headers.get("X-RateLimit-Reset", 0))
+            if reset > time.time():
+                return reset - time.time()
+        delay: float = 2**attempt + random.uniform(0, 1)
+        return delay
+
+    async def _graphql(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a GraphQL query and return its data.
+
+        Args:
+            query: GraphQL query or mutation
+            variables: Query variables
+
+        Returns:
+            The ``data`` member of the response
+
+        Raises:
+            GitHubGraphQLError: If the response reports errors
+        """
+        response = await self._request(
+            "POST", "/graphql", json={"query": query, "variables": variables}
+        )
+        response.raise_for_status()
+        payload = response.json()
+        if payload.get("errors"):
+            raise GitHubGraphQLError(
+                "; ".join(error.get("message", "") for error in payload["errors"])
+            )
+        return cast(Dict[str, Any], payload["data"])
+
+    def _cache_base_commit(self, from_branch: str, repository: Dict[str, Any]) -> None:
+        """Remember the base branch head returned alongside a query."""
+        target = (repository.get("ref") or {}).get("target")
+        if target:
+            self._base_commits[from_branch] = BaseCommit(
+                repository_id=repository["id"],
+                oid=target["oid"],
+                tree_oid=target["tree"]["oid"],
+            )
+
+    def clear_branch_cache(self) -> None:
+        """Forget cached base commits so the next branch starts from the latest head."""
+        self._base_commits.clear()
+        self._wip_commits.clear()
+
+    async def get_issues_with_label(
+        self,
+        label: str,
+        state: str = "open",
+        from_branch: str = "main",
+        since: Optional[str] = None,
+    ) -> List[IssueSummary]:
+        """Get issues with a specific label.
+
+        Uses a single GraphQL query per 100 issues that also returns the head
+        commit of ``from_branch``, which is cached for ``create_branch``.
+
+        Args:
+            label: Label to filter by
+            state: Issue state ('open', 'closed', 'all')
+            from_branch: Branch new agent branches will be created from
+            since: Only return issues updated at or after this ISO 8601 time
+
+        Returns:
+            List of issues with the specified label
+        """
+        issues: List[IssueSummary] = []
+        variables: Dict[str, Any] = {
+            "owner": self.target_owner,
+            "name": self.target_repo,
+            "label": label,
+            "states": _GRAPHQL_STATES.get(state, ["OPEN"]),
+            "since": since,
+            "base": f"refs/heads/{from_branch}",
+            "cursor": None,
+        }
+
+        try:
+            while True:
+                data = await self._graphql(LABELED_ISSUES_QUERY, variables)
+                repository = data["repository"]
+                self._cache_base_commit(from_branch, repository)
+
+                connection = repository["issues"]
+                issues.extend(
+                    IssueSummary.from_graphql(node) for node in connection["nodes"]
+                )
+                if not connection["pageInfo"]["hasNextPage"]:
+                    return issues
+                variables["cursor"] = connection["pageInfo"]["endCursor"]
+        except (httpx.HTTPError, GitHubGraphQLError) as e:
+            log_error(f"Error fetching issues: {e}")
+            return []
+
+    async def get_processing_issue_numbers(self) -> Optional[Set[int]]:
+        """Get the numbers of issues that have an open agent pull request.
+
+        One GraphQL query per 100 open PRs replaces a per-issue comment scan.
+
+        Returns:
+            Issue numbers whose ``ai-agent/issue-<n>`` branch has an open PR, or
+            None if the GraphQL API is unavailable so callers can fall back
+        """
+        numbers: Set[int] = set()
+        variables: Dict[str, Any] = {
+            "owner": self.target_owner,
+            "name": self.target_repo,
+            "cursor": None,
+        }
+
+        try:
+            while True:
+                data = await self._graphql(OPEN_PR_HEADS_QUERY, variables)
+                connection = data["repository"]["pullRequests"]
+                for node in connection["nodes"]:
+                    head = node["headRefName"]
+                    suffix = head[len(AGENT_BRANCH_PREFIX) :]
+                    if head.startswith(AGENT_BRANCH_PREFIX) and suffix.isdigit():
+                        numbers.add(int(suffix))
+                if not connection["pageInfo"]["hasNextPage"]:
+                    return numbers
+                variables["cursor"] = connection["pageInfo"]["endCursor"]
+        except (httpx.HTTPError, GitHubGraphQLError) as e:
+            log_error(f"Error listing open agent pull requests: {e}")
+            return None
+
+    async def get_open_prs_with_recent_comments(
+        self, since_timestamp: Optional[str] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Get open PRs that have recent comments with one GraphQL query per 50 PRs.
+
+        Returns the same PR data as the REST based ``GitHubClient`` method, but
+        each PR's comments and related issue come with the PR list itself. The
+        last 50 comments of each PR are considered.
+
+        Args:
+            since_timestamp: ISO timestamp to get comments since (optional)
+
+        Returns:
+            List of PR data with recent comments and related issue info, or
+            None if the GraphQL API is unavailable so callers can fall back to REST
+        """
+        since_dt = (
+            datetime.fromisoformat(since_timestamp.replace("Z", "+00:00"))
+            if since_timestamp
+            else None
+        )
+        prs_with_comments: List[Dict[str, Any]] = []
+        variables: Dict[str, Any] = {
+            "owner": self.target_owner,
+            "name": self.target_repo,
+            "cursor": None,
+        }
+
+        try:
+            while True:
+                data = await self._graphql(OPEN_PRS_WITH_COMMENTS_QUERY, variables)
+                connection = data["repository"]["pullRequests"]
+                for node in connection["nodes"]:
+                    pr_data = self._pr_with_comments(node, since_dt)
+                    if pr_data:
+                        prs_with_comments.append(pr_data)
+                if not connection["pageInfo"]["hasNextPage"]:
+                    return prs_with_comments
+                variables["cursor"] = connection["pageInfo"]["endCursor"]
+        except (httpx.HTTPError, GitHubGraphQLError) as e:
+            log_error(f"Error getting open PRs with recent comments via GraphQL: {e}")
+            return None
+
+    @staticmethod
+    def _pr_with_comments(
+        node: Dict[str, Any], since_dt: Optional[datetime]
+    ) -> Optional[Dict[str, Any]]:
+        """Build PR data from a GraphQL pull request node.
+
+        Returns None if the PR has no comments after ``since_dt``.
+        """
+        recent_comments = []
+        for comment in node["comments"]["nodes"]:
+            created_at = datetime.fromisoformat(
+                comment["createdAt"].replace("Z", "+00:00")
+            )
+            if since_dt and created_at <= since_dt:
+                continue
+            recent_comments.append(
+                {
+                    "id": comment.get("databaseId"),
+                    "body": comment.get("body"),
+                    "created_at": created_at,
+                    "updated_at": datetime.fromisoformat(
+                        comment["updatedAt"].replace("Z", "+00:00")
+                    ),
+                    "author": (comment.get("author") or {}).get("login", "Unknown"),
+                    "pr_number": node["number"],
+                }
+            )
+
+        if not recent_comments:
+            return None
+
+        closing_issues = node["closingIssuesReferences"]["nodes"]
+        related_issue = (
+            closing_issues[0]["number"]
+            if closing_issues
+            else find_issue_reference(node.get("body"), node.get("title"))
+        )
+        return {
+            "pr_number": node["number"],
+            "title": node.get("title"),
+            "body": node.get("body"),
+            "related_issue": related_issue,
+            "recent_comments": recent_comments,
+        }
+
+    async def get_issues_assigned_to(
+        self, assignee: str, state: str = "open", since: Optional[str] = None
+    ) -> List[IssueSummary]:
+        """Get issues assigned to a specific user.
+
+        Args:
+            assignee: GitHub username to filter by
+            state: Issue state ('open', 'closed', 'all')
+            since: Only return issues updated at or after this ISO 8601 time
+
+        Returns:
+            List of issues assigned to the specified user
+        """
+        issues: List[IssueSummary] = []
+        try:
+            async for page in self._iter_issue_pages(
+                self._assignee_params(assignee, state, since)
+            ):
+                issues.extend(page)
+            return issues
+        except httpx.HTTPError as e:
+            log_error(f"Error fetching issues assigned to {assignee}: {e}")
+            return []
+
+    async def iter_issues_assigned_to(
+        self, assignee: str, state: str = "open", since: Optional[str] = None
+    ) -> AsyncIterator[IssueSummary]:
+        """Yield issues assigned to a specific user as their pages arrive.
+
+        Lets callers start work on the first issues while later pages are
+        still downloading. An HTTP error is raised after the issues already
+        fetched have been yielded, so callers can tell the list is partial.
+
+        Args:
+            assignee: GitHub username to filter by
+            state: Issue state ('open', 'closed', 'all')
+            since: Only return issues updated at or after this ISO 8601 time
+
+        Yields:
+            Issues assigned to the specified user
+
+        Raises:
+            httpx.HTTPError: If a page could not be fetched
+        """
+        async for page in self._iter_issue_pages(
+            self._assignee_params(assignee, state, since)
+        ):
+            for issue in page:
+                yield issue
+
+    @staticmethod
+    def _assignee_params(
+        assignee: str, state: str, since: Optional[str]
+    ) -> Dict[str, Any]:
+        """Query parameters for listing issues assigned to a user."""
+        params: Dict[str, Any] = {"state": state, "assignee": assignee}
+        if since:
+            params["since"] = since
+        return params
+
+    async def _iter_issue_pages(
+        self, params: Dict[str, Any]
+    ) -> AsyncIterator[List[IssueSummary]]:
+        """Yield pages of repository issues matching the query, without PRs.
+
+        The first page reveals the page count through its ``Link: rel="last"``
+        header; the remaining pages are then fetched concurrently and yielded
+        in completion order.
+        """
+        url = f"{self.repo_path}/issues"
+        params = {**params, "per_page": 100}
+
+        def parse(items: List[Dict[str, Any]]) -> List[IssueSummary]:
+            return [
+                IssueSummary.from_api(item)
+                for item in items
+                if "pull_request" not in item
+            ]
+
+        first = await self._get(url, {**params, "page": 1})
+        first.raise_for_status()
+        yield parse(first.json())
+
+        last_url = first.links.get("last", {}).get("url")
+        last_page = int(httpx.URL(last_url).params.get("page", 1)) if last_url else 1
+        if last_page <= 1:
+            return
+
+        async def fetch_page(page: int) -> List[Dict[str, Any]]:
+            async with self._page_semaphore:
+                response = await self._get(url, {**params, "page": page})
+            response.raise_for_status()
+            return cast(List[Dict[str, Any]], response.json())
+
+        tasks = [
+            asyncio.create_task(fetch_page(page)) for page in range(2, last_page + 1)
+        ]
+        try:
+            for next_page in asyncio.as_completed(tasks):
+                yield parse(await next_page)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _get_base_commit(self, from_branch: str) -> BaseCommit:
+        """Return the head commit of ``from_branch``, using the cache if possible."""
+        if from_branch not in self._base_commits:
+            data = await self._graphql(
+                BASE_REF_QUERY,
+                {
+                    "owner": self.target_owner,
+                    "name": self.target_repo,
+                    "base": f"refs/heads/{from_branch}",
+                },
+            )
+            self._cache_base_commit(from_branch, data["repository"])
+            if from_branch not in self._base_commits:
+                raise GitHubGraphQLError(f"Branch '{from_branch}' not found")
+        return self._base_commits[from_branch]
+
+    async def _get_wip_commit(self, base: BaseCommit) -> str:
+        """Return an empty "AI Agent WIP" commit on top of ``base``.
+
+        The commit is created once per base head and shared by every branch
+        created from it.
+        """
+        async with self._wip_commit_lock:
+            if base.oid not in self._wip_commits:
+                commit = await self._request(
+                    "POST",
+                    f"{self.repo_path}/git/commits",
+                    json={
+                        "message": "AI Agent WIP",
+                        "tree": base.tree_oid,
+                        "parents": [base.oid],
+                    },
+                )
+                commit.raise_for_status()
+                self._wip_commits[base.oid] = commit.json()["sha"]
+            return self._wip_commits[base.oid]
+
+    async def create_branch(self, branch_name: str, from_branch: str = "main") -> bool:
+        """Create a new branch starting with an empty "AI Agent WIP" commit.
+
+        Calls made within ``BRANCH_BATCH_WINDOW`` of each other are coalesced
+        and created together by :meth:`create_branches` in one round-trip.
+
+        Args:
+            branch_name: Name of the new branch
+            from_branch: Branch to create from
+
+        Returns:
+            True if successful, False otherwise
+        """
+        pending = self._pending_branches.get(from_branch)
+        if pending is None:
+            pending = self._pending_branches[from_branch] = {}
+            task = asyncio.create_task(self._flush_branch_batch(from_branch))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+
+        future = pending.get(branch_name)
+        if future is None:
+            future = pending[branch_name] = asyncio.get_running_loop().create_future()
+        # Shielded so one cancelled caller does not fail the whole batch
+        return await asyncio.shield(future)
+
+    async def _flush_branch_batch(self, from_branch: str) -> None:
+        """Create all branches queued for ``from_branch`` after the batch window."""
+        await asyncio.sleep(BRANCH_BATCH_WINDOW)
+        pending = self._pending_branches.pop(from_branch)
+        try:
+            results = await self.create_branches(list(pending), from_branch)
+            for branch_name, future in pending.items():
+                future.set_result(results[branch_name])
+        except Exception as e:
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            for future in pending.values():
+                if not future.done():
+                    future.cancel()
+
+    async def create_branches(
+        self, branch_names: List[str], from_branch: str = "main"
+    ) -> Dict[str, bool]:
+        """Create several branches with one aliased ``createRef`` mutation.
+
+        Branches that fail in the batch, other than ones that already exist,
+        are retried one at a time.
+
+        Args:
+            branch_names: Names of the new branches
+            from_branch: Branch to create from
+
+        Returns:
+            Mapping of branch name to True if successful, False otherwise
+        """
+        if len(branch_names) == 1:
+            branch_name = branch_names[0]
+            return {branch_name: await self._create_branch(branch_name, from_branch)}
+
+        aliases = {f"b{i}": name for i, name in enumerate(branch_names)}
+        payload: Dict[str, Any] = {}
+        try:
+            log_github_action(
+                f"Creating {len(branch_names)} branches in {self.target_owner}/{self.target_repo} from '{from_branch}'"
+            )
+            base = await self._get_base_commit(from_branch)
+            wip_sha = await self._get_wip_commit(base)
+
+            variables: Dict[str, Any] = {
+                "repositoryId": base.repository_id,
+                "oid": wip_sha,
+            }
+            for i, name in enumerate(branch_names):
+                variables[f"name{i}"] = f"refs/heads/{name}"
+
+            response = await self._request(
+                "POST",
+                "/graphql",
+                json={
+                    "query": _create_refs_mutation(len(branch_names)),
+                    "variables": variables,
+                },
+            )
+            response.raise_for_status()
+            payload = response.json()
+        except (httpx.HTTPError, GitHubGraphQLError) as e:
+            log_error(f"Batched branch creation failed, retrying one by one: {e}")
+
+        # Mutation results are partial: each alias succeeds or fails on its own
+        data = payload.get("data") or {}
+        existing = {
+            (error.get("path") or [None])[0]
+            for error in payload.get("errors", [])
+            if "already exists" in error.get("message", "")
+        }
+
+        results: Dict[str, bool] = {}
+        retry: List[str] = []
+        for alias, name in aliases.items():
+            if data.get(alias) or alias in existing:
+                results[name] = True
+            else:
+                retry.append(name)
+
+        if retry:
+            retried = await asyncio.gather(
+                *(self._create_branch(name, from_branch) for name in retry)
+            )
+            results.update(zip(retry, retried))
+
+        created = len(branch_names) - len(retry)
+        if created:
+            log_github_action(
+                f"Created {created} of {len(branch_names)} branches in one request"
+            )
+        return results
+
+    async def _create_branch(self, branch_name: str, from_branch: str) -> bool:
+        """Create a single branch starting with an empty "AI Agent WIP" commit.
+
+        With the base head cached by the issue query, this is a single
+        ``createRef`` mutation. A branch that already exists counts as success.
+
+        Args:
+            branch_name: Name of the new branch
+            from_branch: Branch to create from
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            log_github_action(
+                f"Creating branch '{branch_name}' in {self.target_owner}/{self.target_repo} from '{from_branch}'"
+            )
+            base = await self._get_base_commit(from_branch)
+            wip_sha = await self._get_wip_commit(base)
+
+            try:
+                await self._graphql(
+                    CREATE_REF_MUTATION,
+                    {
+                        "repositoryId": base.repository_id,
+                        "name": f"refs/heads/{branch_name}",
+                        "oid": wip_sha,
+                    },
+                )
+            except GitHubGraphQLError as e:
+                if "already exists" not in str(e):
+                    raise
+                log_github_action(
+                    f"Branch '{branch_name}' already exists in {self.target_owner}/{self.target_repo}"
+                )
+                return True
+
+            log_github_action(
+                f"Successfully created branch '{branch_name}' in {self.target_owner}/{self.target_repo}"
+            )
+            return True
+        except (httpx.HTTPError, GitHubGraphQLError) as e:
+            log_error(
+                f"Error creating branch '{branch_name}' in {self.target_owner}/{self.target_repo}: {e}"
+            )
+            return False
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self.client.aclose()
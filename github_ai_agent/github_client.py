@@ -1,10 +1,13 @@
 """GitHub API client for polling issues and creating pull requests."""
 
+import functools
 import logging
+import re
 import jwt
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set
 from pathlib import Path
+from urllib.parse import quote
 
 import requests
 from github import Github
@@ -13,10 +16,85 @@ from github.PullRequest import PullRequest
 from github.Repository import Repository
 from github.GithubException import GithubException
 
-from .logging_utils import log_github_action, log_info, log_error
+from .logging_utils import log_github_action, log_error
 
 logger = logging.getLogger(__name__)
 
+# Chunk size used when streaming raw file contents
+RAW_CHUNK_SIZE = 64 * 1024
+
+
+def find_issue_reference(body: Optional[str], title: Optional[str]) -> Optional[int]:
+    """Find the issue a pull request refers to in its body or title.
+
+    Args:
+        body: Pull request body
+        title: Pull request title
+
+    Returns:
+        Referenced issue number if found, None otherwise
+    """
+    # Check PR body for issue references
+    pr_body = body or ""
+
+    # Look for common patterns that reference issues
+    patterns = [
+        r"#(\d+)",  # Simple #123 pattern
+        r"issue[s]?\s*#(\d+)",  # "issue #123" or "issues #123"
+        r"closes?\s*#(\d+)",  # "closes #123" or "close #123"
+        r"fixes?\s*#(\d+)",  # "fixes #123" or "fix #123"
+        r"resolves?\s*#(\d+)",  # "resolves #123" or "resolve #123"
+        r"related\s*issue:\s*#(\d+)",  # "Related Issue: #123"
+    ]
+
+    for pattern in patterns:
+        matches = re.findall(pattern, pr_body, re.IGNORECASE)
+        if matches:
+            # Return the first match as an integer
+            return int(matches[0])
+
+    # Also check PR title for issue references
+    pr_title = title or ""
+    title_patterns = [
+        r"issue[s]?\s*#?(\d+)",  # "Issue 123" or "Issue #123"
+        r"#(\d+)",  # Simple #123 pattern
+    ]
+
+    for pattern in title_patterns:
+        matches = re.findall(pattern, pr_title, re.IGNORECASE)
+        if matches:
+            return int(matches[0])
+
+    return None
+
+
+@functools.lru_cache(maxsize=256)
+def _is_ai_agent_login(comment_author: str) -> bool:
+    """Classify a login by AI agent username patterns.
+
+    Cached per login, since the same few authors comment on every PR.
+    """
+    author = comment_author.lower()
+
+    # Check for common AI agent username patterns
+    ai_patterns = [
+        "ai-agent",
+        "test-ai-agent",
+        "bot",
+        "github-actions",
+        "dependabot",
+    ]
+
+    for pattern in ai_patterns:
+        if pattern in author:
+            return True
+
+    # Check for [bot] suffix
+    if author.endswith("[bot]"):
+        return True
+
+    return False
+
 
 class GitHubClient:
     """GitHub API client for the AI Agent."""
@@ -29,6 +107,7 @@ class GitHubClient:
         app_id: Optional[str] = None,
         private_key_file: Optional[str] = None,
         use_github_app: bool = False,
+        agent_logins: Iterable[str] = (),
     ):
         """Initialize the GitHub client.
 
@@ -38,11 +117,19 @@ class GitHubClient:
             token: GitHub API token
             app_id: GitHub App ID (for App authentication fallback)
             private_key_file: Path to GitHub App private key file
+            agent_logins: Logins the AI agent comments as, besides the
+                pattern-matched bot accounts
         """
         self.target_owner = target_owner
         self.target_repo = target_repo
+        # Known AI agent logins, lowercased, resolved once for O(1) lookups
+        self.agent_logins: FrozenSet[str] = frozenset(
+            login.lower() for login in agent_logins
+        )
         self._repo: Optional[Repository] = None
         self.auth_method = None
+        # Access token of the authenticated client, shared with the async client
+        self.token: Optional[str] = None
 
         # Try token authentication first
         if token and not use_github_app:
@@ -54,6 +141,7 @@ class GitHubClient:
                 _ = test_repo.full_name
                 log_github_action("✅ GitHub token authentication successful")
                 self.auth_method = "token"
+                self.token = token
                 return
             except Exception as e:
                 log_error(f"❌ GitHub token authentication failed: {e}")
@@ -273,6 +361,7 @@ class GitHubClient:
 
             # Create GitHub client with installation access token
             github_client = Github(access_token)
+            self.token = access_token
             log_github_action("Successfully authenticated GitHub App as installation")
             return github_client
 
@@ -683,6 +772,19 @@ class GitHubClient:
             log_error(f"Error fetching pull requests: {e}")
             return []
 
+    def list_agent_branches(self) -> Optional[Set[str]]:
+        """List the branches created for issues with a single matching-refs call.
+
+        Returns:
+            Names of all ``ai-agent/issue-*`` branches, or None on error
+        """
+        try:
+            refs = self.repo.get_git_matching_refs("heads/ai-agent/issue-")
+            return {ref.ref[len("refs/heads/") :] for ref in refs}
+        except GithubException as e:
+            log_error(f"Error listing agent branches: {e}")
+            return None
+
     def close_pull_request(self, pr_number: int) -> bool:
         """Close a pull request.
 
@@ -818,14 +920,16 @@ class GitHubClient:
             log_github_action(
                 f"Reading file '{file_path}' from {self.target_owner}/{self.target_repo} on branch '{branch}'"
             )
-            file_obj = self.repo.get_contents(file_path, ref=branch)
+            content = self._download_raw_file(file_path, branch)
+            if content is None:
+                file_obj = self.repo.get_contents(file_path, ref=branch)
 
-            # Handle the case where it's a directory (should not happen with correct usage)
-            if file_obj.type != "file":
-                log_error(f"Path '{file_path}' is not a file")
-                return None
+                # Handle the case where it's a directory (should not happen with correct usage)
+                if file_obj.type != "file":
+                    log_error(f"Path '{file_path}' is not a file")
+                    return None
 
-            content = file_obj.decoded_content.decode("utf-8")
+                content = file_obj.decoded_content.decode("utf-8")
             log_github_action(
                 f"Successfully read file '{file_path}' ({len(content)} characters)"
             )
@@ -837,6 +941,56 @@ class GitHubClient:
             )
             return None
 
+    def _download_raw_file(self, file_path: str, branch: str) -> Optional[str]:
+        """Stream a file's raw content, skipping the base64 JSON envelope.
+
+        Args:
+            file_path: Path to the file in the repository
+            branch: Branch to read from
+
+        Returns:
+            File content, or None if the raw download is unavailable (no
+            token, a directory, or an unexpected response)
+
+        Raises:
+            GithubException: If the file does not exist
+        """
+        if not self.token:
+            return None
+
+        try:
+            response = requests.get(
+                f"https://api.github.com/repos/{self.target_owner}/{self.target_repo}"
+                f"/contents/{quote(file_path)}",
+                params={"ref": branch},
+                headers={
+                    "Authorization": f"Bearer {self.token}",
+                    "Accept": "application/vnd.github.raw+json",
+                    "User-Agent": "GitHub-AI-Agent/1.0",
+                    "X-GitHub-Api-Version": "2022-11-28",
+                },
+                stream=True,
+                timeout=30,
+            )
+            with response:
+                if response.status_code == 404:
+                    raise GithubException(404, {"message": "Not Found"}, None)
+                # Directories are listed as JSON even when raw content is asked for
+                content_type = response.headers.get("Content-Type", "")
+                if response.status_code != 200 or content_type.startswith(
+                    "application/json"
+                ):
+                    return None
+
+                buffer = bytearray()
+                for chunk in response.iter_content(RAW_CHUNK_SIZE):
+                    buffer.extend(chunk)
+        except requests.RequestException as e:
+            logger.debug(f"Raw download of '{file_path}' failed: {e}")
+            return None
+
+        return buffer.decode("utf-8")
+
     def create_empty_commit(self, branch_name: str, message: str) -> bool:
         """Create an empty commit on a branch.
 
@@ -981,40 +1135,7 @@ class GitHubClient:
             if not pr:
                 return None
 
-            # Check PR body for issue references
-            pr_body = pr.body or ""
-
-            # Look for common patterns that reference issues
-            import re
-
-            patterns = [
-                r"#(\d+)",  # Simple #123 pattern
-                r"issue[s]?\s*#(\d+)",  # "issue #123" or "issues #123"
-                r"closes?\s*#(\d+)",  # "closes #123" or "close #123"
-                r"fixes?\s*#(\d+)",  # "fixes #123" or "fix #123"
-                r"resolves?\s*#(\d+)",  # "resolves #123" or "resolve #123"
-                r"related\s*issue:\s*#(\d+)",  # "Related Issue: #123"
-            ]
-
-            for pattern in patterns:
-                matches = re.findall(pattern, pr_body, re.IGNORECASE)
-                if matches:
-                    # Return the first match as an integer
-                    return int(matches[0])
-
-            # Also check PR title for issue references
-            pr_title = pr.title or ""
-            title_patterns = [
-                r"issue[s]?\s*#?(\d+)",  # "Issue 123" or "Issue #123"
-                r"#(\d+)",  # Simple #123 pattern
-            ]
-
-            for pattern in title_patterns:
-                matches = re.findall(pattern, pr_title, re.IGNORECASE)
-                if matches:
-                    return int(matches[0])
-
-            return None
+            return find_issue_reference(pr.body, pr.title)
 
         except GithubException as e:
             log_error(f"Error finding related issue for PR {pr_number}: {e}")
@@ -1079,26 +1200,9 @@ class GitHubClient:
         Returns:
             True if the comment is likely from an AI agent, False otherwise
         """
-        author = comment_author.lower()
-
         # Skip the current user check since get_current_user_login() is disabled
-        # to avoid 403 errors - rely on pattern-based detection instead
-
-        # Check for common AI agent username patterns
-        ai_patterns = [
-            "ai-agent",
-            "test-ai-agent",
-            "bot",
-            "github-actions",
-            "dependabot",
-        ]
-
-        for pattern in ai_patterns:
-            if pattern in author:
-                return True
-
-        # Check for [bot] suffix
-        if author.endswith("[bot]"):
-            return True
-
-        return False
+        # to avoid 403 errors - rely on the configured logins and pattern-based
+        # detection instead
+        return comment_author.lower() in self.agent_logins or _is_ai_agent_login(
+            comment_author
+        )
@@ -0,0 +1,56 @@
+"""Compact JSON helpers that use orjson when it is installed."""
+
+import json
+from typing import Any, Callable, Optional, Union
+
+try:  # Optional fast JSON codec, see the "speedups" extra
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps(
+    value: Any,
+    sort_keys: bool = False,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> str:
+    """Serialize a value as compact JSON.
+
+    Values orjson cannot encode, such as integers wider than 64 bits, fall
+    back to the standard library encoder.
+
+    Args:
+        value: JSON-serializable value
+        sort_keys: Whether to sort the keys of objects
+        default: Called for values that are not JSON-serializable
+
+    Returns:
+        The JSON document as a string
+    """
+    if orjson is not None:
+        try:
+            option = orjson.OPT_SORT_KEYS if sort_keys else None
+            return orjson.dumps(value, default=default, option=option).decode()
+        except TypeError:  # orjson.JSONEncodeError subclasses TypeError
+            pass
+    return json.dumps(
+        value,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        sort_keys=sort_keys,
+        default=default,
+    )
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse a JSON document.
+
+    Args:
+        data: JSON document as UTF-8 bytes or a string
+
+    Returns:
+        The decoded value
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
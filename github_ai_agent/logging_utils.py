@@ -1,8 +1,14 @@
 """Enhanced logging utilities with color support."""
 
+import asyncio
+import atexit
 import json
+import logging
+import os
+import sys
+import threading
 from datetime import datetime
-from typing import Any
+from typing import Any, List
 
 
 # ANSI color codes for console output
@@ -45,6 +51,115 @@ class Colors:
     BULLET = "•"
 
 
+# Strip ANSI escapes once at import when output is captured (pipe, file, CI log)
+# so every log_* call emits plain text without any per-call branching.
+# Set FORCE_COLOR to keep colors in non-interactive environments.
+if not sys.stdout.isatty() and not os.environ.get("FORCE_COLOR"):
+    for _name in dir(Colors):
+        _value = getattr(Colors, _name)
+        if not _name.startswith("_") and isinstance(_value, str) and "\033" in _value:
+            setattr(Colors, _name, "")
+
+
+class ConsoleFormatter(logging.Formatter):
+    """Render console records as ``[HH:MM:SS] icon message`` in color.
+
+    The icon and color travel on the record (via ``extra``), so the message is
+    only interpolated and decorated when a handler actually emits it.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(datefmt="%H:%M:%S")
+
+    def format(self, record: logging.LogRecord) -> str:
+        icon = getattr(record, "icon", "ℹ️")
+        color = getattr(record, "color", Colors.INFO)
+        return (
+            f"{Colors.DIM}[{self.formatTime(record, self.datefmt)}]{Colors.RESET} "
+            f"{icon} {color}{record.getMessage()}{Colors.RESET}"
+        )
+
+
+class BufferedConsole:
+    """Coalesce console output into few large writes to stdout.
+
+    Text is collected in memory and written once more than ``max_buffer``
+    characters are pending, when ``flush`` is called (periodically by the
+    daemon and at exit), or immediately when ``buffered`` is False.
+    """
+
+    def __init__(self, buffered: bool, max_buffer: int = 4096):
+        self.buffered = buffered
+        self.max_buffer = max_buffer
+        self._chunks: List[str] = []
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def write(self, text: str) -> None:
+        with self._lock:
+            self._chunks.append(text)
+            self._size += len(text)
+            if not self.buffered or self._size >= self.max_buffer:
+                self._flush_locked()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if not self._chunks:
+            return
+        # Resolve stdout at write time so redirection/capture is honoured
+        sys.stdout.write("".join(self._chunks))
+        sys.stdout.flush()
+        self._chunks.clear()
+        self._size = 0
+
+
+# Interactive terminals see every line immediately; captured output (pipe,
+# file, CI log) is batched into 4 KiB writes
+console = BufferedConsole(buffered=not sys.stdout.isatty())
+atexit.register(console.flush)
+
+
+class ConsoleHandler(logging.Handler):
+    """Logging handler that writes formatted records to the shared console."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            console.write(self.format(record) + "\n")
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        console.flush()
+
+
+async def flush_console_periodically(interval: float = 1.0) -> None:
+    """Flush buffered console output every ``interval`` seconds until cancelled."""
+    try:
+        while True:
+            await asyncio.sleep(interval)
+            console.flush()
+    finally:
+        console.flush()
+
+
+def _print(text: str = "") -> None:
+    """Write a line to the shared console."""
+    console.write(f"{text}\n")
+
+
+# Logger behind the log_* helpers. It follows the root logger's level (set
+# from LOG_LEVEL) but writes through its own handler and formatter.
+console_logger = logging.getLogger("github_ai_agent.console")
+console_logger.propagate = False
+if not console_logger.handlers:
+    _console_handler = ConsoleHandler()
+    _console_handler.setFormatter(ConsoleFormatter())
+    console_logger.addHandler(_console_handler)
+
+
 def pretty_print_json(data: Any) -> str:
     """Pretty print JSON data for logging."""
     if isinstance(data, str):
@@ -61,6 +176,19 @@ def pretty_print_json(data: Any) -> str:
             return str(data)
 
 
+# Colors for emphasised agent action types, resolved once at import (after any
+# ANSI stripping above) instead of being rebuilt on every call
+_AGENT_ACTION_COLORS = {
+    "SUCCESS": Colors.SUCCESS_BOLD,
+    "COMPLETE": Colors.SUCCESS_BOLD,
+    "ERROR": Colors.ERROR_BOLD,
+    "FAILED": Colors.ERROR_BOLD,
+    "APP_START": Colors.AGENT_BOLD,
+    "APP_INIT": Colors.AGENT_BOLD,
+    "ISSUE_START": Colors.AGENT_BOLD,
+}
+
+
 def get_timestamp():
     """Get a formatted timestamp."""
     return datetime.now().strftime("%H:%M:%S")
@@ -69,64 +197,35 @@ def get_timestamp():
 def print_separator(char="─", length=80, color=None):
     """Print a visual separator line."""
     if color:
-        print(f"{color}{char * length}{Colors.RESET}")
+        _print(f"{color}{char * length}{Colors.RESET}")
     else:
-        print(f"{Colors.BORDER}{char * length}{Colors.RESET}")
+        _print(f"{Colors.BORDER}{char * length}{Colors.RESET}")
 
 
-def log_agent_action(message: str, action_type: str = "ACTION"):
-    """Log agent actions with enhanced formatting and color coding."""
-    timestamp = get_timestamp()
+def log_agent_action(message: str, action_type: str = "ACTION", *args: Any):
+    """Log agent actions with enhanced formatting and color coding.
 
-    # Special handling for different action types
-    icon_map = {
-        "APP_START": "🚀",
-        "APP_INIT": "⚙️",
-        "CLIENT_INIT": "🔗",
-        "AGENT_INIT": "🤖",
-        "POLL": "👀",
-        "NEW_ISSUES": "📝",
-        "ISSUE_START": "🎯",
-        "BRANCH_CREATE_EARLY": "🌿",
-        "SUCCESS": "✅",
-        "FAILED": "❌",
-        "ERROR": "💥",
-        "COMPLETE": "🏁",
-        "MODE": "⚡",
-        "RUN_ONCE": "▶️",
-        "DAEMON_START": "🔄",
-        "SHUTDOWN": "🛑",
-    }
-
-    icon = icon_map.get(action_type, "🤖")
-    icon = "🤖"
-    # Format based on action importance
-    if action_type in ["SUCCESS", "COMPLETE"]:
-        color = Colors.SUCCESS_BOLD
-        border_color = Colors.SUCCESS
-    elif action_type in ["ERROR", "FAILED"]:
-        color = Colors.ERROR_BOLD
-        border_color = Colors.ERROR
-    elif action_type in ["APP_START", "APP_INIT", "ISSUE_START"]:
-        color = Colors.AGENT_BOLD
-        border_color = Colors.AGENT
-    else:
-        color = Colors.AGENT
-        border_color = Colors.AGENT
-
-    # Print formatted message
-    print(
-        f"{Colors.DIM}[{timestamp}]{Colors.RESET} {icon} {color}{message}{Colors.RESET}"
+    ``message`` may use %-style placeholders filled lazily from ``args``.
+    """
+    console_logger.info(
+        message,
+        *args,
+        extra={
+            "icon": "🤖",
+            "color": _AGENT_ACTION_COLORS.get(action_type, Colors.AGENT),
+        },
     )
 
 
-def log_github_action(message: str, action_type: str = "GITHUB"):
-    """Log GitHub-specific actions."""
-    timestamp = get_timestamp()
-    icon = "🐙"  # GitHub octopus
+def log_github_action(message: str, action_type: str = "GITHUB", *args: Any):
+    """Log GitHub-specific actions.
 
-    print(
-        f"{Colors.DIM}[{timestamp}]{Colors.RESET} {icon} {Colors.GITHUB}{message}{Colors.RESET}"
+    ``message`` may use %-style placeholders filled lazily from ``args``.
+    """
+    console_logger.info(
+        message,
+        *args,
+        extra={"icon": "🐙", "color": Colors.GITHUB},  # GitHub octopus
     )
 
 
@@ -171,16 +270,16 @@ def log_llm_interaction(message, interaction_type: str = "RESPONSE"):
         display_message = str(message)
 
     # Print header
-    print(
+    _print(
         f"{Colors.DIM}[{timestamp}]{Colors.RESET} {icon} {color}{interaction_type}{Colors.RESET}"
     )
 
     # Print content with proper indentation
     for line in display_message.split("\n"):
-        print(f"    {line}")
+        _print(f"    {line}")
 
     # Print separator for readability
-    print(f"{Colors.DIM}{'─' * 50}{Colors.RESET}")
+    _print(f"{Colors.DIM}{'─' * 50}{Colors.RESET}")
 
 
 def log_tool_usage(tool_name: str, message: str, type: str = "INFO"):
@@ -201,46 +300,51 @@ def log_tool_usage(tool_name: str, message: str, type: str = "INFO"):
     elif "error" in type.lower() or "failed" in type.lower():
         color = Colors.ERROR
         icon = "❌"
-    print(
+    _print(
         f"{Colors.DIM}[{timestamp}]{Colors.RESET} {icon} {Colors.TOOL_BOLD}TOOL {tool_name} {color}{truncated_message}{Colors.RESET}"
     )
 
 
-def log_error(message: str, error_type: str = "ERROR"):
-    """Log errors with prominent formatting."""
-    timestamp = get_timestamp()
-    icon = "💥" if error_type == "ERROR" else "⚠️"
+def log_error(message: str, error_type: str = "ERROR", *args: Any):
+    """Log errors with prominent formatting.
 
-    print(
-        f"{Colors.DIM}[{timestamp}]{Colors.RESET} {icon} {Colors.ERROR_BOLD}{message}{Colors.RESET}"
+    ``message`` may use %-style placeholders filled lazily from ``args``.
+    """
+    icon = "💥" if error_type == "ERROR" else "⚠️"
+    console_logger.error(
+        message, *args, extra={"icon": icon, "color": Colors.ERROR_BOLD}
     )
 
 
-def log_info(message: str, info_type: str = "INFO"):
-    """Log general information with clean formatting."""
-    timestamp = get_timestamp()
+def log_info(message: str, info_type: str = "INFO", *args: Any):
+    """Log general information with clean formatting.
+
+    ``message`` may use %-style placeholders filled lazily from ``args``; no
+    formatting happens when INFO is disabled.
+    """
+    if not console_logger.isEnabledFor(logging.INFO):
+        return
 
     # Choose appropriate icon and color based on content
-    if "successfully" in message.lower() or "created" in message.lower():
+    lowered = message.lower()
+    if "successfully" in lowered or "created" in lowered:
         icon = "✅"
         color = Colors.SUCCESS
-    elif "repository" in message.lower() or "github" in message.lower():
+    elif "repository" in lowered or "github" in lowered:
         icon = "🐙"
         color = Colors.GITHUB
-    elif "file" in message.lower():
+    elif "file" in lowered:
         icon = "📄"
         color = Colors.INFO
     else:
         icon = "ℹ️"
         color = Colors.INFO
 
-    print(
-        f"{Colors.DIM}[{timestamp}]{Colors.RESET} {icon} {color}{message}{Colors.RESET}"
-    )
+    console_logger.info(message, *args, extra={"icon": icon, "color": color})
 
 
 def log_section_start(title: str):
     """Log the start of a major section with visual emphasis."""
     print_separator("═", 60, Colors.AGENT)
-    print(f"{Colors.AGENT_BOLD}🎯 {title.upper()}{Colors.RESET}")
+    _print(f"{Colors.AGENT_BOLD}🎯 {title.upper()}{Colors.RESET}")
     print_separator("─", 60, Colors.AGENT)
@@ -1,14 +1,38 @@
 """Main application for the GitHub AI Agent."""
 
+import argparse
+import asyncio
+import functools
 import logging
-import sys
+import signal
+import threading
 import time
 import warnings
-from typing import Set, Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from operator import itemgetter
+from string import Template
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Set,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import httpx
+from github.GithubException import GithubException
+from github.Issue import Issue
 
-from .agent import GitHubIssueAgent
 from .logging_utils import (
     Colors,
+    ConsoleHandler,
+    _print,
+    flush_console_periodically,
     log_info,
     log_section_start,
     log_github_action,
@@ -17,14 +41,25 @@ from .logging_utils import (
 )
 from .config import get_settings
 from .github_client import GitHubClient
-
-
-# Configure clean logging - disable the default verbose logging
-logging.basicConfig(
-    level=logging.WARNING,  # Set to WARNING to reduce noise
-    format="%(message)s",  # Simple format
-    handlers=[logging.StreamHandler(sys.stdout)],
-)
+from .github_async_client import AsyncGitHubClient, IssueSummary
+from .json_utils import dumps
+from .processed_issues import ProcessedIssues
+from .webhook import WebhookServer
+
+if TYPE_CHECKING:
+    from .agent import GitHubIssueAgent
+
+
+# Configure clean logging - disable the default verbose logging. Only install
+# the handler once, so re-imports and embedding hosts don't double each line.
+# Records go through the shared console, keeping them in order with log_*
+# output when stdout is buffered.
+if not logging.getLogger().handlers:
+    logging.basicConfig(
+        level=logging.WARNING,  # Set to WARNING to reduce noise
+        format="%(message)s",  # Simple format
+        handlers=[ConsoleHandler()],
+    )
 
 # Suppress noisy loggers
 logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -40,28 +75,150 @@ warnings.filterwarnings("ignore", category=RuntimeWarning,
 
 
 # Create a custom filter to hide LangGraph debug output
+# Prefixes of the verbose LangGraph state messages hidden from the console
+LANGGRAPH_SKIP_PREFIXES = ("[values]", "[updates]")
+
+
 class LangGraphFilter(logging.Filter):
     def filter(self, record):
-        # Hide verbose LangGraph state messages
-        if hasattr(record, "getMessage"):
+        # Hide verbose LangGraph state messages. The unformatted template is
+        # checked first so most records are never %-formatted here; only a
+        # template starting with a placeholder needs the formatted message.
+        message = record.msg
+        if not isinstance(message, str) or message.startswith("%"):
             message = record.getMessage()
-            if message.startswith("[values]") or message.startswith("[updates]"):
-                return False
-        return True
+        return not message.startswith(LANGGRAPH_SKIP_PREFIXES)
 
 
-# Apply the filter to the root logger
+# Apply the filter to the root logger handlers, once per handler
 for handler in logging.getLogger().handlers:
-    handler.addFilter(LangGraphFilter())
+    if not any(isinstance(f, LangGraphFilter) for f in handler.filters):
+        handler.addFilter(LangGraphFilter())
 
 logger = logging.getLogger(__name__)
 
+# Comment and pull request bodies, built once at import time
+DRAFT_PR_BODY_TEMPLATE = Template(
+    """🤖 **AI Agent is processing this issue**
+
+This is a draft pull request that was automatically created when the AI Agent started processing issue #${issue_number}.
+
+## Issue Details
+**Title**: ${issue_title}
+**Status**: 🔄 In Progress
+
+## Progress
+- ✅ Branch created: `${branch_name}`
+- ✅ Draft PR created  
+- 🔄 AI Agent processing...
+- ⏳ Waiting for completion...
+
+---
+*This PR will be updated automatically when the AI Agent completes processing the issue.*
+
+**Related Issue**: #${issue_number}
+"""
+)
+
+DRAFT_COMMENT_TEMPLATE = Template(
+    """🤖 **AI Agent Started Processing**
+
+I've started processing this issue and created a draft pull request to track progress:
+
+📋 **Draft PR**: #${pr_number}
+🌿 **Branch**: `${branch_name}`
+
+I'll update you when the processing is complete!"""
+)
+
+REPROCESS_COMMENT_TEMPLATE = Template(
+    """🤖 **AI Agent Re-processing Issue**
+
+I noticed new unaddressed comments on the related pull request #${pr_number} and I'm re-processing this issue to address them.
+
+**Unaddressed Comments:**
+${comments_context}
+
+I'll update the pull request with any necessary changes."""
+)
+
+PR_UPDATE_COMMENT_TEMPLATE = Template(
+    """🤖 **AI Agent Updated PR**
+
+I've processed the recent unaddressed comments and updated this pull request accordingly.
+
+**Processed Comments:**
+${comments_context}
+
+Please review the updated changes."""
+)
+
+# Growth of the daemon's poll interval after each poll that found no work
+IDLE_BACKOFF_FACTOR = 1.5
+
+# Polling yields issue summaries, webhook deliveries load full PyGithub issues
+AnyIssue = Union[IssueSummary, Issue]
+
+# Latest unaddressed PR comments passed to the agent, and their maximum length
+FOLLOW_UP_CONTEXT_COMMENTS = 10
+MAX_CONTEXT_COMMENT_CHARS = 2048
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _format_comments(
+    comments: List[Dict[str, Any]], max_chars: Optional[int] = None
+) -> str:
+    """Render PR comments as Markdown, optionally truncating each body.
+
+    Args:
+        comments: Comment dictionaries with author, created_at and body
+        max_chars: Maximum characters kept from each comment body
+
+    Returns:
+        The comments separated by blank lines
+    """
+    return "\n\n".join(
+        f"**Comment by {comment['author']} on {comment['created_at']}:**\n"
+        f"{(comment['body'] or '')[:max_chars]}"
+        for comment in comments
+    )
+
+
+def _to_ns(value: Any) -> int:
+    """Convert a comment timestamp to integer epoch nanoseconds.
+
+    Args:
+        value: ``datetime`` or ISO 8601 string; naive values are taken as UTC
+
+    Returns:
+        Nanoseconds since the Unix epoch
+    """
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    delta = value - _EPOCH
+    ns: int = (delta.days * 86_400 + delta.seconds) * 1_000_000_000 + (
+        delta.microseconds * 1_000
+    )
+    return ns
+
+
+def _ns_to_iso(ns: int) -> str:
+    """Format epoch nanoseconds as the ISO 8601 UTC string GitHub expects."""
+    return datetime.fromtimestamp(ns / 1e9, tz=timezone.utc).isoformat()
+
 
 class GitHubAIAgentApp:
     """Main application for the GitHub AI Agent."""
 
-    def __init__(self):
-        """Initialize the application."""
+    def __init__(self, args: Optional[argparse.Namespace] = None):
+        """Initialize the application.
+
+        Args:
+            args: Parsed command line arguments, see :func:`parse_args`
+        """
         log_section_start("GitHub AI Agent Initialization")
 
         self.settings = get_settings()
@@ -71,7 +228,10 @@ class GitHubAIAgentApp:
         log_info(f"Max iterations: {self.settings.max_iterations}")
 
         # Check if --force-app-auth is provided
-        force_app_auth = len(sys.argv) > 1 and "--force-app-auth" in sys.argv
+        force_app_auth = bool(args and args.force_app_auth)
+
+        # The assignee the agent works as also authors the agent's comments
+        agent_logins = [self.settings.issue_assignee]
 
         # Initialize GitHub client using GitHub App authentication as first option only if --force-app-auth is provided
         if (
@@ -85,6 +245,7 @@ class GitHubAIAgentApp:
                 app_id=self.settings.github_app_id,
                 private_key_file=self.settings.github_app_private_key_file,
                 use_github_app=True,
+                agent_logins=agent_logins,
             )
             log_github_action("Authenticated via GitHub App (forced)", "CLIENT_INIT")
         elif (
@@ -94,6 +255,7 @@ class GitHubAIAgentApp:
                 target_owner=self.settings.target_owner,
                 target_repo=self.settings.target_repo,
                 token=self.settings.github_ai_agent_token,
+                agent_logins=agent_logins,
             )
             log_github_action("Authenticated via AI Agent Token", "CLIENT_INIT")
         elif (
@@ -103,6 +265,7 @@ class GitHubAIAgentApp:
                 target_owner=self.settings.target_owner,
                 target_repo=self.settings.target_repo,
                 token=self.settings.github_token,
+                agent_logins=agent_logins,
             )
             log_github_action("Authenticated via Personal Token", "CLIENT_INIT")
         else:
@@ -110,223 +273,668 @@ class GitHubAIAgentApp:
                 "Either GitHub AI Agent token (GITHUB_AI_AGENT_TOKEN) or GitHub token (GITHUB_TOKEN) must be provided"
             )
 
-        self.agent = GitHubIssueAgent(
-            github_client=self.github_client,
-            openai_api_key=self.settings.openai_api_key,
-            model=self.settings.openai_model,
-            max_iterations=self.settings.max_iterations,
-            recursion_limit=self.settings.recursion_limit,
-            mcp_config_file="mcp_config.json",
-            enable_mcp=True,
+        # Async client used for polling and branch setup, sharing one
+        # connection pool across concurrent requests
+        if not self.github_client.token:
+            raise ValueError(
+                "GitHub authentication did not provide an access token for the async client"
+            )
+        self.async_github_client = AsyncGitHubClient(
+            token=self.github_client.token,
+            target_owner=self.settings.target_owner,
+            target_repo=self.settings.target_repo,
+            max_concurrent_requests=self.settings.async_concurrency,
+        )
+
+        # The agent (LangGraph, OpenAI and MCP) is created on first use
+        self._agent: Optional["GitHubIssueAgent"] = None
+        self._agent_lock = threading.Lock()
+
+        # Dedicated pool for long-running agent work (LLM + tool calls), so it
+        # never starves the default executor used for short GitHub API calls.
+        # One extra worker serves the PR follow-up check.
+        self.agent_executor = ThreadPoolExecutor(
+            max_workers=self.settings.max_concurrency + 1,
+            thread_name_prefix="agent",
         )
 
-        self.processed_issues: Set[int] = set()
-        self.last_pr_comment_check: Optional[str] = None
+        # Persisted so a restarted daemon does not re-process finished issues
+        self.processed_issues = ProcessedIssues(
+            db_path=self.settings.processed_db_path,
+            repo=f"{self.settings.target_owner}/{self.settings.target_repo}",
+        )
+        # ISO 8601 'since' watermarks for the incremental issue queries; the
+        # first poll is a full scan so no open issue is missed at startup
+        self._issue_watermarks: Dict[str, Optional[str]] = {
+            "assigned": None,
+            "labeled": None,
+        }
+        # Branch and draft PR setup for new issues runs ahead of the agent,
+        # which is limited separately to max_concurrency issues at a time
+        self._setup_semaphore = asyncio.Semaphore(self.settings.setup_concurrency)
+        self._agent_semaphore = asyncio.Semaphore(self.settings.max_concurrency)
+        # Issues currently claimed by a processing task, guarded by the lock
+        self._issues_in_progress: Set[int] = set()
+        self._processed_issues_lock = asyncio.Lock()
+        # Epoch nanoseconds of the last PR comment check
+        self.last_pr_comment_check: Optional[int] = None
         print_separator()
 
-    def poll_and_process_issues(self) -> None:
-        """Poll for new issues and process them."""
+    @property
+    def agent(self) -> "GitHubIssueAgent":
+        """The issue agent, created on first use.
+
+        Importing and building the agent pulls in LangGraph, OpenAI and the
+        MCP servers, so runs that find no work never pay for it. Building it
+        blocks, so async code reaches it through :meth:`_call_agent` on the
+        agent executor.
+        """
+        agent = self._agent
+        if agent is not None:
+            return agent
+        with self._agent_lock:
+            # Another thread may have created the agent while this one waited
+            if self._agent is None:
+                from .agent import GitHubIssueAgent
+
+                self._agent = GitHubIssueAgent(
+                    github_client=self.github_client,
+                    openai_api_key=self.settings.openai_api_key,
+                    model=self.settings.openai_model,
+                    max_iterations=self.settings.max_iterations,
+                    recursion_limit=self.settings.recursion_limit,
+                    mcp_config_file="mcp_config.json",
+                    enable_mcp=True,
+                )
+            return self._agent
+
+    async def poll_and_process_issues(self) -> int:
+        """Poll for new issues and process them concurrently.
+
+        Assigned issues are streamed page by page, so processing of the first
+        issues starts while later pages are still downloading. The "being
+        processed" checks for all streamed issues run concurrently.
+
+        Returns:
+            Number of issues picked up for processing
+        """
         log_section_start("Scanning for Issues")
 
+        # Start new branches from the latest head of main on every poll
+        self.async_github_client.clear_branch_cache()
+
+        # Issues with an open agent PR, fetched once while issues stream in
+        processing_task = asyncio.create_task(
+            self.async_github_client.get_processing_issue_numbers()
+        )
+
+        async def process_if_unprocessed(issue: IssueSummary) -> Optional[bool]:
+            # Filter out already processed issues and issues being processed
+            processing = await processing_task
+            if processing is None:
+                unprocessed = await asyncio.to_thread(self._is_unprocessed, issue)
+            else:
+                unprocessed = self._is_unprocessed(issue, processing)
+            if not unprocessed:
+                return None
+            log_info("Found assigned issue #%d", "NEW_ISSUES", issue.number)
+            return await self.process_issue_async(issue)
+
         log_info(
-            f"Looking for issues assigned to '{self.settings.issue_assignee}'", "POLL"
+            "Looking for issues assigned to '%s'", "POLL", self.settings.issue_assignee
         )
 
-        # Get issues assigned to the specified user
-        issues = self.github_client.get_issues_assigned_to(self.settings.issue_assignee)
+        # Stream issues assigned to the specified user, updated since the last
+        # poll, and check and start each one as soon as it arrives
+        issues: List = []
+        tasks: List[asyncio.Task] = []
+        # Pages arrive out of order, so a failed page may hide issues older
+        # than those seen; the watermark must then stay where it is
+        complete = True
+        try:
+            async for issue in self.async_github_client.iter_issues_assigned_to(
+                self.settings.issue_assignee, since=self._issue_watermarks["assigned"]
+            ):
+                issues.append(issue)
+                tasks.append(asyncio.create_task(process_if_unprocessed(issue)))
+        except httpx.HTTPError as e:
+            complete = False
+            log_error(
+                "Error fetching issues assigned to %s: %s",
+                "ERROR",
+                self.settings.issue_assignee,
+                e,
+            )
+
+        outcomes = await asyncio.gather(*tasks, return_exceptions=True)
 
-        # Filter out already processed issues and issues being processed
-        all_issues_count = len(issues)
-        new_issues = [
-            issue
-            for issue in issues
-            if issue.number not in self.processed_issues
-            and not self.github_client.is_issue_being_processed(issue.number)
-        ]
+        # Skipped issues report None, everything else was picked up; split
+        # and count them in one pass
+        processed: List[Tuple[Any, Any]] = []
+        skipped_count = 0
+        for issue, outcome in zip(issues, outcomes):
+            if outcome is None:
+                skipped_count += 1
+            else:
+                processed.append((issue, outcome))
+
+        # Query whose watermark may advance once the selected issues succeed
+        advance: Optional[Tuple[str, List]] = (
+            ("assigned", issues) if complete else None
+        )
 
-        skipped_count = all_issues_count - len(new_issues)
         if skipped_count > 0:
             log_info(
-                f"Skipped {skipped_count} issues (already processed or being processed)",
+                "Skipped %d issues (already processed or being processed)",
                 "FILTER",
+                skipped_count,
             )
 
-        if not new_issues:
+        if not processed:
+            # Every assigned issue is done or in progress, nothing to revisit
+            if complete:
+                self._advance_watermark("assigned", issues)
+
             log_info(
-                "No assigned issues found, checking for 'AI Agent' labeled issues",
+                "No assigned issues found, checking for '%s' labeled issues",
                 "POLL",
+                self.settings.issue_label,
             )
 
-            # Look for issues with 'AI Agent' label
-            labeled_issues = self.github_client.get_issues_with_label("AI Agent")
-            all_labeled_count = len(labeled_issues)
+            # Look for issues with the configured label
+            labeled_issues = await self.async_github_client.get_issues_with_label(
+                self.settings.issue_label, since=self._issue_watermarks["labeled"]
+            )
 
             # Filter out already processed issues and issues being processed and take only the first one
-            unprocessed_labeled = [
-                issue
-                for issue in labeled_issues
-                if issue.number not in self.processed_issues
-                and not self.github_client.is_issue_being_processed(issue.number)
-            ]
+            unprocessed_labeled = await self._filter_unprocessed(
+                labeled_issues, await processing_task
+            )
 
-            skipped_labeled_count = all_labeled_count - len(unprocessed_labeled)
+            skipped_labeled_count = len(labeled_issues) - len(unprocessed_labeled)
             if skipped_labeled_count > 0:
                 log_info(
-                    f"Skipped {skipped_labeled_count} labeled issues (already processed or being processed)",
+                    "Skipped %d labeled issues (already processed or being processed)",
                     "FILTER",
+                    skipped_labeled_count,
                 )
 
-            if unprocessed_labeled:
-                new_issues = [unprocessed_labeled[0]]  # Take only the first issue
-                log_info(
-                    f"Found issue #{new_issues[0].number} with 'AI Agent' label", "POLL"
-                )
-            else:
+            if not unprocessed_labeled:
+                self._advance_watermark("labeled", labeled_issues)
                 log_info("No new issues to process")
 
-                return
+                return 0
 
-        log_info(f"Discovered {len(new_issues)} unprocessed issues", "NEW_ISSUES")
-        print_separator()
+            issue = unprocessed_labeled[0]  # Take only the first issue
+            # Keep the watermark while other labeled issues are still waiting
+            advance = (
+                ("labeled", labeled_issues) if len(unprocessed_labeled) == 1 else None
+            )
+            log_info(
+                "Found issue #%d with '%s' label",
+                "POLL",
+                issue.number,
+                self.settings.issue_label,
+            )
+            print_separator()
 
-        # Process new issues first
-        for issue in new_issues:
             try:
-                log_section_start(
-                    f"Processing Issue #{issue.number} Title: {issue.title}"
+                labeled_outcome: Any = await self.process_issue_async(issue)
+            except Exception as e:
+                labeled_outcome = e
+            processed = [(issue, labeled_outcome)]
+
+        log_info("Picked up %d unprocessed issues", "NEW_ISSUES", len(processed))
+
+        for issue, outcome in processed:
+            if isinstance(outcome, BaseException):
+                log_error(
+                    "Unexpected error processing issue #%d: %s",
+                    "ERROR",
+                    issue.number,
+                    outcome,
                 )
 
-                # Create branch immediately after detecting new issue
-                branch_name = f"ai-agent/issue-{issue.number}"
+        # Failed issues stay behind the watermark so the next poll retries them
+        if advance and all(outcome is True for _, outcome in processed):
+            self._advance_watermark(*advance)
+
+        return len(processed)
+
+    def _advance_watermark(self, query: str, issues: List) -> None:
+        """Move a query's ``since`` watermark to the newest issue update seen.
+
+        The maximum observed ``updated_at`` is used rather than the current
+        time, so updates made while the poll was running are not missed.
+        """
+        latest = max((issue.updated_at for issue in issues), default="")
+        current = self._issue_watermarks[query]
+        if latest and (current is None or latest > current):
+            self._issue_watermarks[query] = latest
+
+    def _is_unprocessed(
+        self, issue: IssueSummary, processing: Optional[Set[int]] = None
+    ) -> bool:
+        """Return True if the issue is neither processed nor being processed.
+
+        With ``processing`` (issues with an open agent PR) the check is local.
+        Otherwise the remote "being processed" check runs for issues missing
+        from the processed store. A positive result is recorded there, since
+        the marker comment stays on the issue, so the issue is never checked
+        remotely again, not even after a restart.
+
+        Args:
+            issue: Issue to check
+            processing: Numbers of issues known to be in progress, if available
+        """
+        if (
+            issue.number in self.processed_issues
+            or issue.number in self._issues_in_progress
+        ):
+            return False
 
-                if self.github_client.create_branch(branch_name):
-                    # Create draft PR immediately after branch creation
-                    draft_pr_title = (
-                        f"[DRAFT] Processing Issue #{issue.number}: {issue.title}"
-                    )
-                    draft_pr_body = f"""🤖 **AI Agent is processing this issue**
+        if processing is not None:
+            return issue.number not in processing
 
-This is a draft pull request that was automatically created when the AI Agent started processing issue #{issue.number}.
+        if self.github_client.is_issue_being_processed(issue.number):
+            self.processed_issues.add(issue.number)
+            return False
 
-## Issue Details
-**Title**: {issue.title}
-**Status**: 🔄 In Progress
+        return True
 
-## Progress
-- ✅ Branch created: `{branch_name}`
-- ✅ Draft PR created  
-- 🔄 AI Agent processing...
-- ⏳ Waiting for completion...
+    async def _filter_unprocessed(
+        self, issues: List, processing: Optional[Set[int]] = None
+    ) -> List:
+        """Return the issues that are neither processed nor being processed.
+
+        Without ``processing`` the remote "being processed" checks for all
+        issues run concurrently.
+        """
+        if processing is not None:
+            return [
+                issue for issue in issues if self._is_unprocessed(issue, processing)
+            ]
 
----
-*This PR will be updated automatically when the AI Agent completes processing the issue.*
+        checks = await asyncio.gather(
+            *(asyncio.to_thread(self._is_unprocessed, issue) for issue in issues)
+        )
+        return [issue for issue, unprocessed in zip(issues, checks) if unprocessed]
+
+    async def process_issue_async(self, issue: AnyIssue) -> bool:
+        """Process an issue, claiming it for the duration.
+
+        Args:
+            issue: GitHub issue to process
+
+        Returns:
+            True if the issue was processed successfully, False if it failed or
+            was already claimed by another task
+        """
+        async with self._processed_issues_lock:
+            if (
+                issue.number in self.processed_issues
+                or issue.number in self._issues_in_progress
+            ):
+                return False
+            self._issues_in_progress.add(issue.number)
 
-**Related Issue**: #{issue.number}
-"""
+        try:
+            success = await self.process_new_issue(issue)
+        finally:
+            async with self._processed_issues_lock:
+                self._issues_in_progress.discard(issue.number)
 
-                    draft_pr = self.github_client.create_pull_request(
-                        title=draft_pr_title,
-                        body=draft_pr_body,
-                        head=branch_name,
-                        base="main",
-                        draft=True,
-                    )
+        if success:
+            async with self._processed_issues_lock:
+                self.processed_issues.add(issue.number)
+        return success
 
-                    if draft_pr:
-                        log_github_action(
-                            f"Created draft PR #{draft_pr.number}", "DRAFT_PR"
-                        )
-
-                        # Comment on the issue about the draft PR
-                        draft_comment = f"🤖 **AI Agent Started Processing**\n\nI've started processing this issue and created a draft pull request to track progress:\n\n📋 **Draft PR**: #{draft_pr.number}\n🌿 **Branch**: `{branch_name}`\n\nI'll update you when the processing is complete!"
-
-                        self.github_client.add_comment_to_issue(
-                            issue.number, draft_comment
-                        )
-
-                        # Now process the issue with the pre-created branch and draft PR
-                        result = self.agent.process_issue(
-                            issue.number, branch_name, draft_pr.number
-                        )
-
-                        if result.success:
-                            log_github_action(
-                                f"Issue completed! Updated PR #{result.pr_number} to ready",
-                                "SUCCESS",
-                            )
-                            self.processed_issues.add(issue.number)
-                        else:
-                            log_github_action(
-                                f"Processing failed: {result.error_message}", "FAILED"
-                            )
-                    else:
-                        log_github_action(
-                            f"Draft PR creation failed for issue #{issue.number}",
-                            "FAILED",
-                        )
-                        continue
-                else:
-                    log_github_action(
-                        f"Branch creation failed for issue #{issue.number}", "FAILED"
-                    )
-                    continue
+    async def process_new_issue(self, issue: AnyIssue) -> bool:
+        """Create the working branch and draft PR for an issue, then process it.
 
-                print_separator()
+        Setup of up to ``setup_concurrency`` issues and agent work on up to
+        ``max_concurrency`` issues run at the same time, so new issues are
+        prepared while earlier ones are still being processed.
 
-            except Exception as e:
+        Args:
+            issue: GitHub issue to process
+
+        Returns:
+            True if the issue was processed successfully, False otherwise
+        """
+        try:
+            log_section_start(f"Processing Issue #{issue.number} Title: {issue.title}")
+
+            async with self._setup_semaphore:
+                setup = await self._setup_issue(issue)
+            if setup is None:
+                return False
+            branch_name, context, draft_pr = setup
+
+            # Now process the issue with the pre-created branch and draft PR
+            async with self._agent_semaphore:
+                result = await self._run_agent_work(
+                    self._call_agent,
+                    "apply_changes",
+                    context,
+                    branch_name,
+                    draft_pr.number,
+                )
+
+            if result.success:
                 log_github_action(
-                    f"Unexpected error processing issue #{issue.number}: {e}", "ERROR"
+                    f"Issue completed! Updated PR #{result.pr_number} to ready",
+                    "SUCCESS",
                 )
-                print_separator()
+            else:
+                log_github_action(
+                    f"Processing failed: {result.error_message}", "FAILED"
+                )
+
+            print_separator()
+            return bool(result.success)
 
-    def run_once(self) -> None:
+        except Exception as e:
+            log_github_action(
+                f"Unexpected error processing issue #{issue.number}: {e}", "ERROR"
+            )
+            print_separator()
+            return False
+
+    async def _setup_issue(self, issue: AnyIssue) -> Optional[Tuple[str, Any, Any]]:
+        """Create the working branch, agent context and draft PR for an issue.
+
+        Args:
+            issue: GitHub issue to set up
+
+        Returns:
+            Tuple of branch name, agent context and draft PR, or None on failure
+        """
+        # Create branch immediately after detecting new issue, overlapping
+        # it with the agent's read-only setup (issue fetch, prompt build)
+        branch_name = f"ai-agent/issue-{issue.number}"
+
+        branch_created, context = await asyncio.gather(
+            self.async_github_client.create_branch(branch_name),
+            self._run_agent_work(self._call_agent, "setup_context", issue.number),
+        )
+
+        if not branch_created:
+            log_github_action(
+                f"Branch creation failed for issue #{issue.number}", "FAILED"
+            )
+            return None
+
+        if context is None:
+            log_github_action(
+                f"Could not load issue #{issue.number} for processing", "FAILED"
+            )
+            return None
+
+        # Create draft PR immediately after branch creation
+        draft_pr_title = f"[DRAFT] Processing Issue #{issue.number}: {issue.title}"
+        draft_pr_body = DRAFT_PR_BODY_TEMPLATE.substitute(
+            issue_number=issue.number,
+            issue_title=issue.title,
+            branch_name=branch_name,
+        )
+
+        draft_pr = await asyncio.to_thread(
+            self.github_client.create_pull_request,
+            title=draft_pr_title,
+            body=draft_pr_body,
+            head=branch_name,
+            base="main",
+            draft=True,
+        )
+
+        if not draft_pr:
+            log_github_action(
+                f"Draft PR creation failed for issue #{issue.number}",
+                "FAILED",
+            )
+            return None
+
+        log_github_action(f"Created draft PR #{draft_pr.number}", "DRAFT_PR")
+
+        # Comment on the issue about the draft PR
+        draft_comment = DRAFT_COMMENT_TEMPLATE.substitute(
+            pr_number=draft_pr.number, branch_name=branch_name
+        )
+
+        await asyncio.to_thread(
+            self.github_client.add_comment_to_issue, issue.number, draft_comment
+        )
+
+        return branch_name, context, draft_pr
+
+    async def run(self, daemon: bool = False) -> None:
+        """Run the agent in single-run or daemon mode, then shut down.
+
+        Args:
+            daemon: Whether to run continuously instead of once
+        """
+        try:
+            if daemon:
+                await self.run_daemon()
+            else:
+                await self.run_once()
+        finally:
+            await self.shutdown()
+
+    async def _run_agent_work(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run blocking agent work on the dedicated agent executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.agent_executor, functools.partial(func, *args)
+        )
+
+    def _call_agent(self, method: str, *args: Any) -> Any:
+        """Call an agent method, creating the agent first if needed.
+
+        Runs on the agent executor, so building the agent never blocks the
+        event loop.
+        """
+        return getattr(self.agent, method)(*args)
+
+    async def shutdown(self) -> None:
+        """Close async clients and executors opened by the application."""
+        await self.async_github_client.aclose()
+        self.agent_executor.shutdown(wait=False, cancel_futures=True)
+
+    async def run_once(self) -> None:
         """Run the agent once to process current issues."""
         log_section_start("Single Run Mode")
-        self.poll_and_process_issues()
-        self.check_pr_follow_up_comments()
+        await self.poll_and_process_issues()
+        await self.check_pr_follow_up_comments()
         log_info("Single run completed", "COMPLETE")
 
-    def run_daemon(self) -> None:
-        """Run the agent as a daemon, continuously polling for issues."""
-        log_section_start(f"Daemon Mode - Polling every {self.settings.poll_interval}s")
+    async def run_daemon(self) -> None:
+        """Run the agent as a daemon, continuously polling for issues.
+
+        When webhooks are enabled, issues delivered by the webhook server are
+        processed as they arrive and polling only runs as a low-frequency
+        fallback. The interval grows by ``IDLE_BACKOFF_FACTOR`` after every
+        poll that finds no work, up to ``max_poll_interval``, and resets once
+        work is found. SIGTERM or :meth:`stop` end the loop without waiting
+        out the current sleep.
+        """
+        interval: float
+        if self.settings.webhook_enabled:
+            interval = self.settings.webhook_fallback_interval
+            log_section_start(
+                f"Daemon Mode - Webhook on port {self.settings.webhook_port}, "
+                f"fallback polling every {interval}s"
+            )
+        else:
+            interval = self.settings.poll_interval
+            log_section_start(f"Daemon Mode - Polling every {interval}s")
+
+        base_interval = interval
+        max_interval = max(self.settings.max_poll_interval, base_interval)
+
+        server: Optional[WebhookServer] = None
+        workers: List[asyncio.Task] = []
+        # Buffered console output is written out at least once a second
+        flusher = asyncio.create_task(flush_console_periodically())
+
+        self._stop_event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        try:
+            loop.add_signal_handler(signal.SIGTERM, self.stop)
+        except (NotImplementedError, RuntimeError):
+            pass  # Signal handlers are unavailable on this platform or thread
 
         try:
-            while True:
-                self.poll_and_process_issues()
-                self.check_pr_follow_up_comments()
-                log_info(f"Sleeping for {self.settings.poll_interval} seconds...")
-                time.sleep(self.settings.poll_interval)
+            if self.settings.webhook_enabled:
+                server, workers = await self._start_webhook_server()
+
+            while not self._stop_event.is_set():
+                found = await self.poll_and_process_issues()
+                found += await self.check_pr_follow_up_comments()
+
+                # Back off while the repository is idle
+                if found:
+                    interval = base_interval
+                else:
+                    interval = min(interval * IDLE_BACKOFF_FACTOR, max_interval)
+
+                log_info("Sleeping for %.0f seconds...", "POLL", interval)
+                try:
+                    await asyncio.wait_for(self._stop_event.wait(), timeout=interval)
+                except asyncio.TimeoutError:
+                    pass
+
+            log_info("Daemon stopped", "SHUTDOWN")
 
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, asyncio.CancelledError):
             log_info("Daemon stopped by user", "SHUTDOWN")
         except Exception as e:
             log_info(f"Daemon error: {e}", "ERROR")
             logger.error(f"Daemon error: {e}", exc_info=True)
             raise
+        finally:
+            try:
+                loop.remove_signal_handler(signal.SIGTERM)
+            except (NotImplementedError, RuntimeError):
+                pass
+            flusher.cancel()
+            for worker in workers:
+                worker.cancel()
+            if server:
+                await server.stop()
+
+    def stop(self) -> None:
+        """Ask the daemon loop to stop once the current poll has finished."""
+        stop_event = getattr(self, "_stop_event", None)
+        if stop_event is not None:
+            stop_event.set()
+
+    async def _start_webhook_server(
+        self,
+    ) -> Tuple[WebhookServer, List[asyncio.Task]]:
+        """Start the webhook server and the workers consuming its queue.
+
+        ``max_concurrency`` workers share the queue, so one slow issue does not
+        hold up the deliveries queued behind it.
+
+        Returns:
+            The running server and its worker tasks
+        """
+        if not self.settings.webhook_secret:
+            raise ValueError(
+                "WEBHOOK_SECRET must be provided when WEBHOOK_ENABLED is set"
+            )
+
+        queue: asyncio.Queue[int] = asyncio.Queue()
+
+        server = WebhookServer(
+            secret=self.settings.webhook_secret,
+            queue=queue,
+            label=self.settings.issue_label,
+            assignee=self.settings.issue_assignee,
+            host=self.settings.webhook_host,
+            port=self.settings.webhook_port,
+        )
+        await server.start()
+        workers = [
+            asyncio.create_task(self._webhook_worker(queue))
+            for _ in range(max(1, self.settings.max_concurrency))
+        ]
+        return server, workers
+
+    async def _webhook_worker(self, queue: "asyncio.Queue[int]") -> None:
+        """Process issue numbers delivered by the webhook server."""
+        while True:
+            issue_number = await queue.get()
+            try:
+                if (
+                    issue_number in self.processed_issues
+                    or issue_number in self._issues_in_progress
+                ):
+                    continue
+
+                if await asyncio.to_thread(
+                    self.github_client.is_issue_being_processed, issue_number
+                ):
+                    continue
+
+                issue = await asyncio.to_thread(
+                    self.github_client.get_issue, issue_number
+                )
+                if issue:
+                    await self.process_issue_async(issue)
+            except Exception as e:
+                log_error(f"Error handling webhook for issue #{issue_number}: {e}")
+            finally:
+                queue.task_done()
+
+    async def check_pr_follow_up_comments(self) -> int:
+        """Check for follow-up comments on open PRs and re-process related issues.
+
+        The related issues and branches of all PRs needing follow-up are looked
+        up concurrently before the issues are re-processed one by one.
 
-    def check_pr_follow_up_comments(self) -> None:
-        """Check for follow-up comments on open PRs and re-process related issues."""
+        Returns:
+            Number of PRs with unaddressed comments
+        """
         log_section_start("Checking PR Follow-up Comments")
 
         # Get current timestamp to use for next check
-        from datetime import datetime
-
-        current_time = datetime.utcnow().isoformat() + "Z"
+        current_time = time.time_ns()
+        since_timestamp = (
+            _ns_to_iso(self.last_pr_comment_check)
+            if self.last_pr_comment_check is not None
+            else None
+        )
 
-        # Get PRs with recent comments
-        prs_with_comments = self.github_client.get_open_prs_with_recent_comments(
-            since_timestamp=self.last_pr_comment_check
+        # Get PRs with recent comments in one GraphQL round-trip, falling back
+        # to per-PR REST calls if GraphQL is unavailable
+        prs_with_comments = (
+            await self.async_github_client.get_open_prs_with_recent_comments(
+                since_timestamp=since_timestamp
+            )
         )
+        if prs_with_comments is None:
+            prs_with_comments = await asyncio.to_thread(
+                self.github_client.get_open_prs_with_recent_comments,
+                since_timestamp=since_timestamp,
+            )
 
         if not prs_with_comments:
             log_info("No follow-up comments found on open PRs", "PR_COMMENTS")
             self.last_pr_comment_check = current_time
-            return
+            return 0
 
         log_info(
             f"Found {len(prs_with_comments)} PRs with recent comments", "PR_COMMENTS"
         )
 
+        # (PR number, related issue, chronologically sorted comments,
+        # unaddressed user comments)
+        follow_ups: List[
+            Tuple[int, int, List[Dict[str, Any]], List[Dict[str, Any]]]
+        ] = []
         for pr_data in prs_with_comments:
             pr_number = pr_data["pr_number"]
             related_issue = pr_data["related_issue"]
@@ -339,12 +947,18 @@ This is a draft pull request that was automatically created when the AI Agent st
                 )
                 continue
 
-            # Filter out comments from the AI agent itself to avoid loops
-            user_comments = [
-                comment
-                for comment in recent_comments
-                if not self.github_client.is_comment_from_ai_agent(comment["author"])
-            ]
+            # Split comments by author in one pass; comments from the AI agent
+            # itself are not acted on to avoid loops. Creation times are
+            # converted to epoch nanoseconds once for cheap integer comparisons,
+            # and only the latest AI agent reply time is kept.
+            user_comments = []
+            latest_ai_ts = -1
+            for comment in recent_comments:
+                comment["_ts"] = ts = _to_ns(comment["created_at"])
+                if self.github_client.is_comment_from_ai_agent(comment["author"]):
+                    latest_ai_ts = max(latest_ai_ts, ts)
+                else:
+                    user_comments.append(comment)
 
             if not user_comments:
                 log_info(
@@ -353,30 +967,16 @@ This is a draft pull request that was automatically created when the AI Agent st
                 )
                 continue
 
+            # Sort all comments by creation time to establish chronological order
+            all_comments_sorted = sorted(recent_comments, key=itemgetter("_ts"))
+
             # Filter out user comments that have already been addressed by the AI Agent
             # A user comment is considered "addressed" if there's an AI agent comment after it
-            unaddressed_user_comments = []
-
-            # Sort all comments by creation time to establish chronological order
-            all_comments_sorted = sorted(recent_comments, key=lambda x: x["created_at"])
-
-            for user_comment in user_comments:
-                # Check if there's an AI agent comment after this user comment
-                has_ai_response = False
-
-                for comment in all_comments_sorted:
-                    # If this comment is after the user comment and is from AI agent
-                    if comment["created_at"] > user_comment[
-                        "created_at"
-                    ] and self.github_client.is_comment_from_ai_agent(
-                        comment["author"]
-                    ):
-                        has_ai_response = True
-                        break
-
-                # If no AI response found after this user comment, it's unaddressed
-                if not has_ai_response:
-                    unaddressed_user_comments.append(user_comment)
+            unaddressed_user_comments = [
+                user_comment
+                for user_comment in user_comments
+                if user_comment["_ts"] >= latest_ai_ts
+            ]
 
             if not unaddressed_user_comments:
                 log_info(
@@ -390,9 +990,40 @@ This is a draft pull request that was automatically created when the AI Agent st
                 "PR_COMMENTS",
             )
 
+            follow_ups.append(
+                (
+                    pr_number,
+                    related_issue,
+                    all_comments_sorted,
+                    unaddressed_user_comments,
+                )
+            )
+
+        # List all agent branches once, then look up every related issue
+        # concurrently
+        agent_branches = (
+            await asyncio.to_thread(self.github_client.list_agent_branches)
+            if follow_ups
+            else None
+        )
+        targets = await asyncio.gather(
+            *(
+                asyncio.to_thread(
+                    self._get_follow_up_target, related_issue, agent_branches
+                )
+                for _, related_issue, _, _ in follow_ups
+            ),
+            return_exceptions=True,
+        )
+
+        for (pr_number, related_issue, all_comments_sorted, unaddressed), target in zip(
+            follow_ups, targets
+        ):
             try:
-                # Get the issue to re-process
-                issue = self.github_client.get_issue(related_issue)
+                if isinstance(target, BaseException):
+                    raise target
+
+                issue, branch_exists = target
                 if not issue:
                     log_info(
                         f"Could not find issue #{related_issue} for PR #{pr_number}",
@@ -400,120 +1031,216 @@ This is a draft pull request that was automatically created when the AI Agent st
                     )
                     continue
 
-                log_section_start(
-                    f"Re-processing Issue #{related_issue} due to PR #{pr_number} comments"
+                await self._run_agent_work(
+                    self._reprocess_issue_for_pr,
+                    pr_number,
+                    related_issue,
+                    all_comments_sorted,
+                    unaddressed,
+                    branch_exists,
                 )
 
-                # Create a context string with the unaddressed comments
-                comments_context = "\n\n".join(
-                    [
-                        f"**Comment by {comment['author']} on {comment['created_at']}:**\n{comment['body']}"
-                        for comment in all_comments_sorted  # use all comments, not just unaddressed
-                    ]
+            except Exception as e:
+                log_github_action(
+                    f"Unexpected error re-processing issue #{related_issue}: {e}",
+                    "ERROR",
                 )
 
-                # Get the existing branch for this issue
-                branch_name = f"ai-agent/issue-{related_issue}"
+        # Update the timestamp for next check
+        self.last_pr_comment_check = current_time
+        print_separator()
+        return len(follow_ups)
+
+    @staticmethod
+    def _follow_up_agent_context(
+        pr_number: int, unaddressed_comments: List[Dict[str, Any]]
+    ) -> str:
+        """Build the agent context from the latest unaddressed comments.
+
+        Only the last ``FOLLOW_UP_CONTEXT_COMMENTS`` unaddressed comments are
+        included, each truncated to ``MAX_CONTEXT_COMMENT_CHARS``, which keeps
+        long threads from inflating the prompt. The comments are passed as a
+        compact JSON array; the Markdown rendering is kept for PR comments.
+
+        Args:
+            pr_number: Pull request with the follow-up comments
+            unaddressed_comments: User comments without a later AI agent reply
+
+        Returns:
+            Additional context for the agent
+        """
+        comments = dumps(
+            [
+                {
+                    "author": comment["author"],
+                    "created_at": str(comment["created_at"]),
+                    "body": (comment["body"] or "")[:MAX_CONTEXT_COMMENT_CHARS],
+                }
+                for comment in unaddressed_comments[-FOLLOW_UP_CONTEXT_COMMENTS:]
+            ]
+        )
+        return f"Follow-up comments from PR #{pr_number}:\n{comments}"
 
-                # Check if branch exists
-                try:
-                    self.github_client.repo.get_branch(branch_name)
-                    branch_exists = True
-                except:
-                    branch_exists = False
+    def _get_follow_up_target(
+        self, issue_number: int, agent_branches: Optional[Set[str]] = None
+    ) -> Tuple[Optional[Any], bool]:
+        """Fetch an issue to re-process and whether its agent branch exists.
 
-                if not branch_exists:
-                    # Create new branch if it doesn't exist
-                    if not self.github_client.create_branch(branch_name):
-                        log_github_action(
-                            f"Failed to create branch for issue #{related_issue}",
-                            "FAILED",
-                        )
-                        continue
+        Args:
+            issue_number: Issue related to a PR with follow-up comments
+            agent_branches: Names of all agent branches, if already listed
 
-                # Add a comment to the issue about re-processing
-                reprocess_comment = f"""🤖 **AI Agent Re-processing Issue**
+        Returns:
+            Tuple of the issue (None if not found) and the branch existence flag
+        """
+        issue = self.github_client.get_issue(issue_number)
+        if not issue:
+            return None, False
 
-I noticed new unaddressed comments on the related pull request #{pr_number} and I'm re-processing this issue to address them.
+        branch_name = f"ai-agent/issue-{issue_number}"
+        if agent_branches is not None:
+            return issue, branch_name in agent_branches
 
-**Unaddressed Comments:**
-{comments_context}
+        # Check if branch exists
+        try:
+            self.github_client.repo.get_branch(branch_name)
+            branch_exists = True
+        except GithubException:
+            branch_exists = False
+
+        return issue, branch_exists
+
+    def _reprocess_issue_for_pr(
+        self,
+        pr_number: int,
+        related_issue: int,
+        all_comments_sorted: List[Dict[str, Any]],
+        unaddressed_comments: List[Dict[str, Any]],
+        branch_exists: bool,
+    ) -> None:
+        """Re-process an issue to address follow-up comments on its PR.
+
+        Args:
+            pr_number: Pull request with the follow-up comments
+            related_issue: Issue the pull request resolves
+            all_comments_sorted: PR comments in chronological order
+            unaddressed_comments: User comments without a later AI agent reply
+            branch_exists: Whether the issue's agent branch already exists
+        """
+        log_section_start(
+            f"Re-processing Issue #{related_issue} due to PR #{pr_number} comments"
+        )
 
-I'll update the pull request with any necessary changes."""
+        # Create a context string with the comments for the GitHub comments
+        comments_context = _format_comments(
+            all_comments_sorted  # use all comments, not just unaddressed
+        )
 
-                self.github_client.add_comment_to_issue(
-                    related_issue, reprocess_comment
-                )
+        # Get the existing branch for this issue
+        branch_name = f"ai-agent/issue-{related_issue}"
 
-                # Re-process the issue with the PR comments as context
-                result = self.agent.process_issue(
-                    related_issue,
-                    branch_name,
-                    pr_number,
-                    additional_context=f"Follow-up comments from PR #{pr_number}:\n{comments_context}",
+        if not branch_exists:
+            # Create new branch if it doesn't exist
+            if not self.github_client.create_branch(branch_name):
+                log_github_action(
+                    f"Failed to create branch for issue #{related_issue}",
+                    "FAILED",
                 )
+                return
 
-                if result.success:
-                    log_github_action(
-                        f"Issue #{related_issue} re-processed successfully! Updated PR #{result.pr_number}",
-                        "SUCCESS",
-                    )
-
-                    # Add a comment to the PR about the update
-                    pr_update_comment = f"""🤖 **AI Agent Updated PR**
-
-I've processed the recent unaddressed comments and updated this pull request accordingly.
+        # Add a comment to the issue about re-processing
+        reprocess_comment = REPROCESS_COMMENT_TEMPLATE.substitute(
+            pr_number=pr_number, comments_context=comments_context
+        )
 
-**Processed Comments:**
-{comments_context}
+        self.github_client.add_comment_to_issue(related_issue, reprocess_comment)
 
-Please review the updated changes."""
+        # Re-process the issue with the PR comments as context
+        result = self.agent.process_issue(
+            related_issue,
+            branch_name,
+            pr_number,
+            additional_context=self._follow_up_agent_context(
+                pr_number, unaddressed_comments
+            ),
+        )
 
-                    # Add comment to PR
-                    try:
-                        pr = self.github_client.repo.get_pull(pr_number)
-                        pr.create_issue_comment(pr_update_comment)
-                        log_github_action(
-                            f"Added update comment to PR #{pr_number}",
-                            "PR_UPDATE",
-                        )
-                    except Exception as e:
-                        log_error(f"Failed to add comment to PR #{pr_number}: {e}")
+        if result.success:
+            log_github_action(
+                f"Issue #{related_issue} re-processed successfully! Updated PR #{result.pr_number}",
+                "SUCCESS",
+            )
 
-                else:
-                    log_github_action(
-                        f"Re-processing failed for issue #{related_issue}: {result.error_message}",
-                        "FAILED",
-                    )
+            # Add a comment to the PR about the update
+            pr_update_comment = PR_UPDATE_COMMENT_TEMPLATE.substitute(
+                comments_context=comments_context
+            )
 
-            except Exception as e:
+            # Add comment to PR
+            try:
+                pr = self.github_client.repo.get_pull(pr_number)
+                pr.create_issue_comment(pr_update_comment)
                 log_github_action(
-                    f"Unexpected error re-processing issue #{related_issue}: {e}",
-                    "ERROR",
+                    f"Added update comment to PR #{pr_number}",
+                    "PR_UPDATE",
                 )
+            except Exception as e:
+                log_error(f"Failed to add comment to PR #{pr_number}: {e}")
 
-        # Update the timestamp for next check
-        self.last_pr_comment_check = current_time
-        print_separator()
+        else:
+            log_github_action(
+                f"Re-processing failed for issue #{related_issue}: {result.error_message}",
+                "FAILED",
+            )
 
     def cleanup(self) -> None:
         """Clean up application resources."""
         log_info("Cleaning up application resources", "CLEANUP")
-        if hasattr(self, "agent") and self.agent:
+        # Only clean up an agent that was actually created
+        agent = getattr(self, "_agent", None)
+        if agent is not None:
             try:
-                self.agent.cleanup()
+                agent.cleanup()
                 log_info("Agent cleanup completed", "CLEANUP")
             except Exception as e:
                 log_error(f"Error during agent cleanup: {e}", "CLEANUP_ERROR")
+        if hasattr(self, "processed_issues"):
+            self.processed_issues.close()
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments.
+
+    Args:
+        argv: Arguments to parse, defaults to ``sys.argv[1:]``
+
+    Returns:
+        Parsed arguments with ``daemon`` and ``force_app_auth`` flags
+    """
+    parser = argparse.ArgumentParser(
+        prog="github-ai-agent",
+        description="Automatically process GitHub issues with an AI agent",
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Run continuously, polling for new issues",
+    )
+    parser.add_argument(
+        "--force-app-auth",
+        action="store_true",
+        help="Authenticate as the configured GitHub App instead of a token",
+    )
+    return parser.parse_args(argv)
 
 
 def main() -> None:
     """Main entry point."""
-    import sys
+    args = parse_args()
 
     # Print welcome banner
     print_separator("═", 80)
-    print(
+    _print(
         f"🤖 {Colors.AGENT_BOLD}GITHUB AI AGENT{Colors.RESET} - Automated Issue Processing"
     )
     print_separator("═", 80)
@@ -522,14 +1249,10 @@ def main() -> None:
     settings = get_settings()
     logging.getLogger().setLevel(settings.log_level)
 
-    app = GitHubAIAgentApp()
+    app = GitHubAIAgentApp(args=args)
 
     try:
-        # Check command line arguments
-        if len(sys.argv) > 1 and sys.argv[1] == "--daemon":
-            app.run_daemon()
-        else:
-            app.run_once()
+        asyncio.run(app.run(daemon=args.daemon))
     finally:
         # Clean up MCP resources
         app.cleanup()
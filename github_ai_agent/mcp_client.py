@@ -9,24 +9,105 @@ harmless cleanup warnings during asyncio shutdown. This does not affect function
 """
 
 import asyncio
+import contextlib
+import functools
+import hashlib
 import json
 import logging
+import math
 import os
-import warnings
-from typing import Dict, List, Any, Optional, Callable
-from dataclasses import dataclass
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from operator import attrgetter
+from typing import Callable, Dict, FrozenSet, List, Any, Optional, TextIO, Tuple, Type
+from dataclasses import asdict, dataclass
+from datetime import timedelta
 from pathlib import Path
+from types import TracebackType
 
+import httpx
 from langchain_core.tools import Tool
 
 # MCP SDK imports
-from mcp import ClientSession, StdioServerParameters, types as mcp_types
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.session import MessageHandlerFnT
 from mcp.client.stdio import stdio_client
 from mcp.client.streamable_http import streamablehttp_client
-from mcp.shared.metadata_utils import get_display_name
+from mcp.types import ServerNotification, ToolListChangedNotification
+
+from .json_utils import dumps, loads
+
+try:  # Optional faster event loop, see the "speedups" extra
+    import uvloop
+except ImportError:  # pragma: no cover - exercised when uvloop is absent
+    uvloop = None  # type: ignore[assignment]
 
 logger = logging.getLogger(__name__)
 
+# Read-only tools of the common filesystem and GitHub MCP servers
+DEFAULT_CACHEABLE_TOOLS = frozenset(
+    {
+        "read_file",
+        "read_multiple_files",
+        "list_directory",
+        "get_file_info",
+        "get_file_contents",
+        "search_repositories",
+    }
+)
+# Maximum number of cached read-only tool results per client
+TOOL_RESULT_CACHE_SIZE = 128
+
+# Discovered tools of stdio servers, persisted across runs
+TOOLS_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "github_ai_agent"
+    / "tools"
+)
+
+# stderr of stdio servers, kept out of the agent's console output
+MCP_LOG_DIR = Path("logs") / "mcp"
+
+# Tool calls in flight per server connection; LangGraph's ToolNode runs the
+# tool calls of one agent step in parallel
+DEFAULT_MAX_CONCURRENT_CALLS = 4
+
+# Consecutive failed tool calls after which a server is skipped, and for how
+# long before a single call probes it again
+BREAKER_FAILURE_THRESHOLD = 2
+BREAKER_RESET_SECONDS = 30.0
+
+# Seconds a server has to answer the MCP handshake, and each tool call; the
+# first start of an npx server includes installing its package
+DEFAULT_CONNECT_TIMEOUT = 15.0
+DEFAULT_CALL_TIMEOUT = 30.0
+
+# Seconds the blocking wrappers wait beyond those timeouts, so the timeouts
+# inside the MCP loop fire first and report which server was too slow
+TIMEOUT_MARGIN = 5.0
+
+# Servers started at once by initialize_async, so large configs do not spawn
+# every server process or connection together
+MAX_CONCURRENT_STARTS = 5
+
+# Keep-alive pool shared by the streamable HTTP servers on one host
+HTTP_POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=16, max_connections=32, keepalive_expiry=60.0
+)
+
+# Text reported to the agent for each MCP content type; other types (such as
+# embedded resources) are not passed on
+_CONTENT_EXTRACTORS: Dict[str, Callable[[Any], str]] = {
+    "text": attrgetter("text"),
+    "image": lambda content: str(content.data),
+    "audio": lambda content: str(content.data),
+}
+
 
 @dataclass
 class MCPServerConfig:
@@ -44,6 +125,22 @@ class MCPServerConfig:
     url: Optional[str] = None
     headers: Optional[Dict[str, str]] = None
 
+    # Keep a dedicated connection instead of sharing one with other clients
+    no_share: bool = False
+
+    # Read-only tools whose results are cached until another tool is called
+    cacheable_tools: FrozenSet[str] = DEFAULT_CACHEABLE_TOOLS
+
+    # Keep the discovered tools of a stdio server on disk across runs
+    cache_tools: bool = True
+
+    # Tool calls sent to the server at once, over all clients sharing it
+    max_concurrent_calls: int = DEFAULT_MAX_CONCURRENT_CALLS
+
+    # Seconds to wait for the MCP handshake and for each tool call
+    connect_timeout: float = DEFAULT_CONNECT_TIMEOUT
+    call_timeout: float = DEFAULT_CALL_TIMEOUT
+
     def __post_init__(self):
         """Validate configuration after initialization."""
         if self.transport == "stdio":
@@ -56,6 +153,430 @@ class MCPServerConfig:
             raise ValueError(f"Unsupported transport: {self.transport}")
 
 
+def _config_hash(config: MCPServerConfig) -> str:
+    """Hash the connection settings of a server configuration.
+
+    Args:
+        config: Server configuration
+
+    Returns:
+        Hex digest that is equal for configs starting the same server
+    """
+    canonical = json.dumps(
+        {
+            "transport": config.transport,
+            "command": config.command,
+            "args": config.args or [],
+            "env": sorted((config.env or {}).items()),
+            "url": config.url,
+            "headers": sorted((config.headers or {}).items()),
+        }
+    )
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()
+
+
+@functools.lru_cache(maxsize=64)
+def _resolve_command(command: str, path: Optional[str] = None) -> Optional[str]:
+    """Resolve a server command to an executable path once.
+
+    Args:
+        command: Command name or path from the server config
+        path: PATH to search instead of the current environment's
+
+    Returns:
+        Full path to the executable, or None if it cannot be found
+    """
+    return shutil.which(command, path=path)
+
+
+def _parameter_names(input_schema: Dict[str, Any]) -> List[str]:
+    """Order a tool's parameter names, required parameters first.
+
+    Args:
+        input_schema: JSON schema of the tool input
+
+    Returns:
+        Parameter names used to map positional arguments
+    """
+    param_names = list(input_schema.get("properties", {}))
+    required_params = input_schema.get("required", [])
+    if required_params:
+        param_names = required_params + [
+            p for p in param_names if p not in required_params
+        ]
+    return param_names
+
+
+def _parameter_info(input_schema: Dict[str, Any]) -> str:
+    """Describe a tool's parameters for the agent.
+
+    Args:
+        input_schema: JSON schema of the tool input
+
+    Returns:
+        Parameter list to append to the tool description, empty if the tool
+        takes no parameters
+    """
+    properties = input_schema.get("properties")
+    if not properties:
+        return ""
+    required = input_schema.get("required", [])
+    lines = ["\n\nParameters:"]
+    for param_name, param_def in properties.items():
+        param_type = param_def.get("type", "string")
+        param_desc = param_def.get("description", param_def.get("title", param_name))
+        required_marker = " (required)" if param_name in required else ""
+        lines.append(f"- {param_name} ({param_type}){required_marker}: {param_desc}")
+    return "\n".join(lines)
+
+
+def _map_tool_args(
+    param_names: List[str], args: Tuple[Any, ...], kwargs: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Map LangChain tool arguments to MCP tool parameters.
+
+    Args:
+        param_names: Parameter names, in positional order
+        args: Positional arguments passed to the tool
+        kwargs: Keyword arguments passed to the tool
+
+    Returns:
+        Parameters for the MCP tool call
+    """
+    if args and not kwargs:
+        # Map positional arguments to parameter names
+        return dict(zip(param_names, args))
+
+    # Map generic argument names like __arg1, __arg2 to parameter names by
+    # their number, so __arg10 follows __arg9
+    if any(key.startswith("__arg") for key in kwargs):
+        parameters = {}
+        for number, name in enumerate(param_names, 1):
+            key = f"__arg{number}"
+            if key not in kwargs:
+                break
+            parameters[name] = kwargs[key]
+        return parameters
+
+    # Use kwargs directly if they have proper names
+    return kwargs
+
+
+def _tools_cache_path(config: MCPServerConfig) -> Optional[Path]:
+    """Locate the on-disk tools cache of a stdio server.
+
+    The key covers the server config and the resolved command's path and
+    modification time, so upgrading the server binary invalidates it.
+
+    Args:
+        config: Server configuration
+
+    Returns:
+        Path of the cache file, or None if the server's tools are not cached
+    """
+    if config.transport != "stdio" or not config.cache_tools:
+        return None
+    command = _resolve_command(config.command, (config.env or {}).get("PATH"))
+    if command is None:
+        return None
+    try:
+        mtime_ns = os.stat(command).st_mtime_ns
+    except OSError:
+        return None
+    key = f"{_config_hash(config)}:{command}:{mtime_ns}"
+    return TOOLS_CACHE_DIR / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.json"
+
+
+def _read_tools_cache(path: Path, server_name: str) -> Optional[List["MCPTool"]]:
+    """Load cached tools for a server, or None if there is no usable cache."""
+    try:
+        return [
+            MCPTool(**{**tool, "server_name": server_name})
+            for tool in loads(path.read_bytes())
+        ]
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def _write_tools_cache(path: Path, tools: List["MCPTool"]) -> None:
+    """Persist discovered tools atomically; failures only cost a warm start."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", dir=path.parent, suffix=".tmp", delete=False, encoding="utf-8"
+        ) as f:
+            f.write(dumps([asdict(tool) for tool in tools]))
+        os.replace(f.name, path)
+    except OSError as e:
+        logger.debug(f"Could not write MCP tools cache {path}: {e}")
+
+
+def _tools_changed_handler(pair_info: Dict[str, Any]) -> MessageHandlerFnT:
+    """Build a session message handler that tracks tool list changes.
+
+    Each ``notifications/tools/list_changed`` from the server bumps the
+    connection's ``tools_version``, which invalidates tools cached by every
+    client sharing the connection.
+
+    Args:
+        pair_info: Connection tracking info of the server
+
+    Returns:
+        Message handler for the server's ClientSession
+    """
+
+    async def handle_message(message: Any) -> None:
+        if isinstance(message, ServerNotification) and isinstance(
+            message.root, ToolListChangedNotification
+        ):
+            pair_info["tools_version"] = pair_info.get("tools_version", 0) + 1
+
+    return handle_message
+
+
+def _open_stderr_log(server_name: str) -> TextIO:
+    """Open the file a stdio server's stderr is appended to.
+
+    Args:
+        server_name: Name of the server
+
+    Returns:
+        The log file, or ``sys.stderr`` if it cannot be opened
+    """
+    try:
+        MCP_LOG_DIR.mkdir(parents=True, exist_ok=True)
+        return open(MCP_LOG_DIR / f"{server_name}.stderr.log", "a", encoding="utf-8")
+    except OSError as e:
+        logger.warning(f"Logging stderr of MCP server {server_name} to console: {e}")
+        return sys.stderr
+
+
+async def _close_connection(
+    server_name: str,
+    sessions: Dict[str, ClientSession],
+    stream_pairs: Dict[str, Any],
+    pool_keys: Dict[str, Tuple[asyncio.AbstractEventLoop, str]],
+) -> None:
+    """Close a client's connection to a server, or release it if it is shared.
+
+    Args:
+        server_name: Name of the server
+        sessions: The client's sessions by server name
+        stream_pairs: The client's connection tracking info by server name
+        pool_keys: The client's pool keys of shared sessions by server name
+    """
+    pool_key = pool_keys.pop(server_name, None)
+    if pool_key:
+        with _POOL_LOCK:
+            pooled = _SESSION_POOL[pool_key]
+            pooled.refcount -= 1
+            if pooled.refcount == 0:
+                del _SESSION_POOL[pool_key]
+        if pooled.refcount > 0:
+            # Other clients still use the connection
+            sessions.pop(server_name, None)
+            stream_pairs.pop(server_name, None)
+            logger.info(f"Released shared MCP server connection: {server_name}")
+            return
+
+    sessions.pop(server_name, None)
+    pair_info = stream_pairs.pop(server_name, None) or {}
+    task = pair_info.get("task")
+    if task is None:
+        return
+
+    # The connection's own task exits the session and transport contexts,
+    # which closes the streams and ends the server process
+    pair_info["shutdown"].set()
+    await asyncio.wait([task])
+    logger.info(f"Closed MCP server connection: {server_name}")
+
+
+def _finalize_connections(
+    loop: asyncio.AbstractEventLoop,
+    sessions: Dict[str, ClientSession],
+    stream_pairs: Dict[str, Any],
+    pool_keys: Dict[str, Tuple[asyncio.AbstractEventLoop, str]],
+) -> None:
+    """Close the connections left open by a client that was never cleaned up.
+
+    Runs when the client is garbage collected or at interpreter exit. It only
+    holds the client's connection state, not the client itself.
+    """
+    server_names = list(dict.fromkeys([*sessions, *stream_pairs]))
+    if not server_names or not loop.is_running():
+        return
+
+    async def close_all() -> None:
+        for server_name in server_names:
+            await _close_connection(server_name, sessions, stream_pairs, pool_keys)
+
+    try:
+        running_loop = asyncio.get_running_loop()
+    except RuntimeError:
+        running_loop = None
+    if running_loop is loop:
+        # Collected on the MCP loop itself, which must not block on itself
+        loop.create_task(close_all())
+        return
+
+    try:
+        asyncio.run_coroutine_threadsafe(close_all(), loop).result(timeout=5)
+    except Exception as e:
+        logger.warning(f"Error closing MCP connections of a finalized client: {e}")
+
+
+class _CallAbandoned(Exception):
+    """A shared tool call was cancelled by the caller that made it."""
+
+
+@dataclass
+class _CircuitBreaker:
+    """Tracks consecutive tool call failures of a server connection."""
+
+    failures: int = 0
+    opened_at: Optional[float] = None
+
+    def allow(self) -> bool:
+        """Return whether a call may be sent to the server.
+
+        Once the reset timeout has passed, one call is let through as a probe
+        while the others keep failing fast until it completes.
+        """
+        if self.opened_at is None:
+            return True
+        now = time.monotonic()
+        if now - self.opened_at < BREAKER_RESET_SECONDS:
+            return False
+        self.opened_at = now
+        return True
+
+    def record(self, success: bool) -> None:
+        """Record the outcome of a call."""
+        if success:
+            self.failures = 0
+            self.opened_at = None
+            return
+        self.failures += 1
+        if self.failures >= BREAKER_FAILURE_THRESHOLD:
+            self.opened_at = time.monotonic()
+
+
+@dataclass
+class _PooledSession:
+    """An MCP session shared by every client with the same server config."""
+
+    session: ClientSession
+    pair_info: Dict[str, Any]
+    refcount: int = 0
+
+
+# Sessions are bound to the event loop that opened them, so the pool is keyed
+# by loop and config hash. All clients started with initialize() share one
+# background loop and therefore one connection per distinct server config.
+_SESSION_POOL: Dict[Tuple[asyncio.AbstractEventLoop, str], _PooledSession] = {}
+_POOL_LOCK = threading.Lock()
+_shared_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+@dataclass
+class _PooledTransport:
+    """An HTTP connection pool shared by the servers on one host."""
+
+    transport: httpx.AsyncHTTPTransport
+    refcount: int = 0
+
+
+# HTTP connections are bound to the event loop that opened them as well, so
+# transports are keyed by loop, scheme and host
+_HTTP_POOL: Dict[Tuple[asyncio.AbstractEventLoop, str, str], _PooledTransport] = {}
+
+
+class _SharedTransport(httpx.AsyncBaseTransport):
+    """A client's handle on a shared transport; closing it releases the pool."""
+
+    def __init__(self, key: Tuple[asyncio.AbstractEventLoop, str, str]):
+        self._key = key
+        self._closed = False
+        with _POOL_LOCK:
+            pooled = _HTTP_POOL.get(key)
+            if pooled is None:
+                pooled = _HTTP_POOL[key] = _PooledTransport(
+                    httpx.AsyncHTTPTransport(limits=HTTP_POOL_LIMITS)
+                )
+            pooled.refcount += 1
+        self._transport = pooled.transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        with _POOL_LOCK:
+            pooled = _HTTP_POOL[self._key]
+            pooled.refcount -= 1
+            if pooled.refcount == 0:
+                del _HTTP_POOL[self._key]
+        if pooled.refcount == 0:
+            await self._transport.aclose()
+
+
+def _pooled_http_client(
+    url: str,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: Optional[httpx.Timeout] = None,
+    auth: Optional[httpx.Auth] = None,
+) -> httpx.AsyncClient:
+    """Create an HTTP client for the MCP SDK that reuses the host's connections.
+
+    Mirrors the SDK's default client factory, but the connection pool is
+    shared by every server on the same scheme and host.
+
+    Args:
+        url: URL of the MCP server
+        headers: Headers sent with every request
+        timeout: Request timeout, 30 seconds if not given
+        auth: Authentication handler
+
+    Returns:
+        An AsyncClient; closing it releases its share of the pool
+    """
+    parsed = httpx.URL(url)
+    key = (asyncio.get_running_loop(), parsed.scheme, parsed.netloc.decode())
+    return httpx.AsyncClient(
+        transport=_SharedTransport(key),
+        headers=headers,
+        timeout=timeout if timeout is not None else httpx.Timeout(30.0),
+        auth=auth,
+        follow_redirects=True,
+    )
+
+
+# Parsed config files keyed by (path, mtime_ns, size), so unchanged files are
+# not re-read when more clients are initialized. The parsed data is shared by
+# all clients; server configs take copies of its lists and dicts.
+_CONFIG_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+
+
+def _get_shared_loop() -> asyncio.AbstractEventLoop:
+    """Return the background event loop shared by all MCP clients.
+
+    The loop comes from uvloop when it is installed. Only this loop is
+    affected; the global event loop policy is left alone.
+    """
+    global _shared_loop
+    with _POOL_LOCK:
+        if _shared_loop is None or _shared_loop.is_closed():
+            new_loop = uvloop.new_event_loop if uvloop else asyncio.new_event_loop
+            _shared_loop = new_loop()
+            threading.Thread(
+                target=_shared_loop.run_forever, name="mcp-client", daemon=True
+            ).start()
+        return _shared_loop
+
+
 @dataclass
 class MCPTool:
     """Represents a tool from an MCP server."""
@@ -86,19 +607,21 @@ class MCPClient:
         self.server_configs: Dict[str, MCPServerConfig] = {}
         self.available_tools: List[MCPTool] = []
         self.sessions: Dict[str, ClientSession] = {}
-        self.stream_pairs: Dict[str, Any] = {}  # Store read/write streams
+        self.stream_pairs: Dict[str, Any] = {}  # Connection tracking info
+        # Results of read-only tool calls, least recently used first
+        self._result_cache: "OrderedDict[Tuple[str, str, str], str]" = OrderedDict()
+        # Futures of the cacheable tool calls awaiting a response
+        self._in_flight: Dict[Tuple[str, str, str], asyncio.Future] = {}
+        # Tools discovered per server with the connection's tools_version,
+        # listed once per connection until the server reports a change
+        self._tools_cache: Dict[str, Tuple[int, List[MCPTool]]] = {}
+        # Pool keys of the sessions this client shares with other clients
+        self._pool_keys: Dict[str, Tuple[asyncio.AbstractEventLoop, str]] = {}
         self._running = False
         self._cleanup_attempted = False
+        # Closes connections left open if cleanup() never runs
+        self._finalizer: Optional[weakref.finalize] = None
 
-    def __del__(self):
-        """Destructor to ensure cleanup happens."""
-        if self._running and not self._cleanup_attempted:
-            try:
-                self.cleanup()
-            except Exception as e:
-                # Use print instead of logger since logging might be shut down
-                print(f"Warning: Error in MCP client destructor: {e}")
-                
     def __enter__(self):
         """Context manager entry."""
         return self
@@ -107,17 +630,36 @@ class MCPClient:
         """Context manager exit."""
         self.cleanup()
 
+    async def __aenter__(self) -> "MCPClient":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        """Async context manager exit, closing connections on the current loop."""
+        await self.cleanup_async()
+
     def load_config(self) -> None:
         """Load MCP server configuration from JSON file."""
         config_path = Path(self.config_file)
 
-        if not config_path.exists():
+        # Stat the file directly rather than checking that it exists first
+        try:
+            stat = config_path.stat()
+        except FileNotFoundError:
             logger.warning(f"MCP config file not found: {config_path}")
             return
 
         try:
-            with open(config_path, "r", encoding="utf-8") as f:
-                config_data = json.load(f)
+            cache_key = (str(config_path.absolute()), stat.st_mtime_ns, stat.st_size)
+            config_data = _CONFIG_CACHE.get(cache_key)
+            if config_data is None:
+                config_data = loads(config_path.read_bytes())
+                _CONFIG_CACHE[cache_key] = config_data
 
             mcp_servers = config_data.get("mcpServers", {})
 
@@ -134,8 +676,26 @@ class MCPClient:
                         name=server_name,
                         transport="stdio",
                         command=command,
-                        args=server_config.get("args", []),
-                        env=server_config.get("env"),
+                        args=list(server_config.get("args", [])),
+                        env=(
+                            dict(server_config["env"])
+                            if server_config.get("env")
+                            else None
+                        ),
+                        no_share=server_config.get("no_share", False),
+                        cache_tools=server_config.get("cache_tools", True),
+                        cacheable_tools=frozenset(
+                            server_config.get("cacheable_tools", DEFAULT_CACHEABLE_TOOLS)
+                        ),
+                        max_concurrent_calls=server_config.get(
+                            "max_concurrent_calls", DEFAULT_MAX_CONCURRENT_CALLS
+                        ),
+                        connect_timeout=server_config.get(
+                            "connect_timeout", DEFAULT_CONNECT_TIMEOUT
+                        ),
+                        call_timeout=server_config.get(
+                            "call_timeout", DEFAULT_CALL_TIMEOUT
+                        ),
                     )
                     
                 elif transport == "streamable_http":
@@ -148,7 +708,24 @@ class MCPClient:
                         name=server_name,
                         transport="streamable_http",
                         url=url,
-                        headers=server_config.get("headers"),
+                        headers=(
+                            dict(server_config["headers"])
+                            if server_config.get("headers")
+                            else None
+                        ),
+                        no_share=server_config.get("no_share", False),
+                        cacheable_tools=frozenset(
+                            server_config.get("cacheable_tools", DEFAULT_CACHEABLE_TOOLS)
+                        ),
+                        max_concurrent_calls=server_config.get(
+                            "max_concurrent_calls", DEFAULT_MAX_CONCURRENT_CALLS
+                        ),
+                        connect_timeout=server_config.get(
+                            "connect_timeout", DEFAULT_CONNECT_TIMEOUT
+                        ),
+                        call_timeout=server_config.get(
+                            "call_timeout", DEFAULT_CALL_TIMEOUT
+                        ),
                     )
                 else:
                     logger.error(f"Unsupported transport '{transport}' for server {server_name}")
@@ -163,6 +740,10 @@ class MCPClient:
         """
         Start an MCP server connection.
 
+        Clients on the same event loop share one connection per distinct
+        server configuration, unless the server is configured with
+        ``no_share``. The connection is closed when its last client stops it.
+
         Args:
             server_name: Name of the server to start
 
@@ -179,11 +760,25 @@ class MCPClient:
 
         config = self.server_configs[server_name]
 
+        pool_key = None
+        if not config.no_share:
+            pool_key = (asyncio.get_running_loop(), _config_hash(config))
+            with _POOL_LOCK:
+                pooled = _SESSION_POOL.get(pool_key)
+                if pooled:
+                    pooled.refcount += 1
+            if pooled:
+                self.sessions[server_name] = pooled.session
+                self.stream_pairs[server_name] = pooled.pair_info
+                self._pool_keys[server_name] = pool_key
+                logger.info(f"Reusing shared MCP server connection: {server_name}")
+                return True
+
         try:
             if config.transport == "stdio":
-                return await self._start_stdio_server(server_name, config)
+                started = await self._start_stdio_server(server_name, config)
             elif config.transport == "streamable_http":
-                return await self._start_http_server(server_name, config)
+                started = await self._start_http_server(server_name, config)
             else:
                 logger.error(f"Unsupported transport: {config.transport}")
                 return False
@@ -192,31 +787,53 @@ class MCPClient:
             logger.error(f"Failed to start MCP server {server_name}: {e}")
             return False
 
+        if started and pool_key:
+            with _POOL_LOCK:
+                # A concurrent start of the same config keeps its own session
+                if pool_key not in _SESSION_POOL:
+                    _SESSION_POOL[pool_key] = _PooledSession(
+                        session=self.sessions[server_name],
+                        pair_info=self.stream_pairs[server_name],
+                        refcount=1,
+                    )
+                    self._pool_keys[server_name] = pool_key
+        return started
+
     async def _start_stdio_server(self, server_name: str, config: MCPServerConfig) -> bool:
         """Start connection to a stdio-based MCP server."""
         try:
+            # Resolve the command up front so a missing executable fails fast
+            # with a clear error instead of a failed spawn
+            command = _resolve_command(config.command, (config.env or {}).get("PATH"))
+            if command is None:
+                logger.error(
+                    f"Command for stdio server {server_name} not found: {config.command}"
+                )
+                return False
+
             # Create server parameters
             server_params = StdioServerParameters(
-                command=config.command,
+                command=command,
                 args=config.args or [],
                 env=config.env,
             )
 
-            # Establish stdio connection
-            stdio_context = stdio_client(server_params)
-            read_stream, write_stream = await stdio_context.__aenter__()
-            
-            # Store the context for cleanup
-            self.stream_pairs[server_name] = {
-                'context': stdio_context,
-                'safe_cleanup': True
+            # Establish stdio connection, sending the server's stderr to a
+            # log file rather than the agent's console
+            errlog = _open_stderr_log(server_name)
+            pair_info = {
+                'errlog': errlog,
+                'call_limit': asyncio.Semaphore(config.max_concurrent_calls),
+                'breaker': _CircuitBreaker(),
             }
-            
-            # Create and initialize session
-            session = ClientSession(read_stream, write_stream)
-            await session.__aenter__()
-            await session.initialize()
-            
+            session = await self._open_connection(
+                server_name,
+                config,
+                stdio_client(server_params, errlog=errlog),
+                pair_info,
+            )
+
+            self.stream_pairs[server_name] = pair_info
             self.sessions[server_name] = session
             logger.info(f"Connected to stdio MCP server: {server_name}")
             return True
@@ -227,77 +844,141 @@ class MCPClient:
 
     async def _start_http_server(self, server_name: str, config: MCPServerConfig) -> bool:
         """Start connection to a streamable HTTP-based MCP server."""
+        url = config.url
+        if not url:
+            logger.error(f"streamable_http server {server_name} missing 'url'")
+            return False
+
         try:
-            logger.info(f"Connecting to MCP server {server_name} at {config.url}")
+            logger.info(f"Connecting to MCP server {server_name} at {url}")
             
-            # Prepare headers for SSE connection
-            headers = config.headers or {}
+            # Prepare headers for SSE connection, leaving the config (and so
+            # its pool key) untouched
+            headers = {**(config.headers or {})}
             
             # Add SSE-specific headers
             headers.setdefault('Accept', 'text/event-stream')
             headers.setdefault('Cache-Control', 'no-cache')
             headers.setdefault('Connection', 'keep-alive')
             
-            logger.info(f"Request headers: {headers}")
+            logger.debug("Request headers: %s", headers)
             
-            # Try to establish HTTP connection
+            # Establish the HTTP connection
             # Note: streamablehttp_client should make a GET request for SSE
-            try:
-                http_context = streamablehttp_client(config.url, headers=headers)
-                read_stream, write_stream, _ = await http_context.__aenter__()
-                
-                logger.info(f"HTTP connection established for {server_name}")
-                
-                # Store the context for cleanup, but with a flag to avoid problematic cleanup
-                self.stream_pairs[server_name] = {
-                    'context': http_context,
-                    'safe_cleanup': True  # Flag to control cleanup behavior
-                }
-                
-                # Create and initialize session
-                session = ClientSession(read_stream, write_stream)
-                await session.__aenter__()
-                
-                logger.info(f"Initializing MCP session for {server_name}")
-                await session.initialize()
-                
-                self.sessions[server_name] = session
-                logger.info(f"Connected to streamable HTTP MCP server: {server_name}")
-                return True
-                
-            except Exception as connection_error:
-                logger.error(f"Connection error for {server_name}: {connection_error}")
-                logger.info(f"Full connection error: {connection_error}", exc_info=True)
-                raise
+            http_context = streamablehttp_client(
+                url,
+                headers=headers,
+                httpx_client_factory=functools.partial(_pooled_http_client, url),
+            )
+            pair_info = {
+                'call_limit': asyncio.Semaphore(config.max_concurrent_calls),
+                'breaker': _CircuitBreaker(),
+            }
+            session = await self._open_connection(
+                server_name, config, http_context, pair_info
+            )
+
+            self.stream_pairs[server_name] = pair_info
+            self.sessions[server_name] = session
+            logger.info(f"Connected to streamable HTTP MCP server: {server_name}")
+            return True
 
         except Exception as e:
             logger.error(f"Failed to connect to HTTP server {server_name}: {e}")
-            logger.info(f"Full error details: {e}", exc_info=True)
+            logger.debug("Connection error details", exc_info=True)
             return False
 
-    async def stop_server(self, server_name: str) -> None:
-        """Stop an MCP server connection."""
-        # Store references to avoid dictionary modification during iteration
-        session = self.sessions.get(server_name)
-        pair_info = self.stream_pairs.get(server_name)
-        
-        # First close the session
-        if session:
-            try:
-                await session.__aexit__(None, None, None)
-                del self.sessions[server_name]
-                logger.info(f"Closed MCP server session: {server_name}")
-            except Exception as e:
-                logger.error(f"Error closing session for {server_name}: {e}")
+    async def _open_connection(
+        self,
+        server_name: str,
+        config: MCPServerConfig,
+        transport: Any,
+        pair_info: Dict[str, Any],
+    ) -> ClientSession:
+        """
+        Open a server connection in a task that owns it until it is stopped.
 
-        # Clear stream pair tracking (don't force context cleanup)
-        if pair_info:
-            try:
-                del self.stream_pairs[server_name]
-                logger.info(f"Removed MCP server connection tracking: {server_name}")
-                # Let the context cleanup naturally to avoid task group issues
-            except Exception as e:
-                logger.error(f"Error cleaning up streams for {server_name}: {e}")
+        anyio requires the transport and session contexts to be exited by the
+        task that entered them, so both live in one task per connection;
+        stopping the server sets the connection's ``shutdown`` event.
+
+        Args:
+            server_name: Name of the server
+            config: Server configuration
+            transport: Unentered transport context of the MCP SDK
+            pair_info: Connection tracking info, gains ``task`` and ``shutdown``
+
+        Returns:
+            The initialized session
+
+        Raises:
+            TimeoutError: If the server did not answer within connect_timeout
+        """
+        loop = asyncio.get_running_loop()
+        ready: asyncio.Future[ClientSession] = loop.create_future()
+        pair_info["shutdown"] = asyncio.Event()
+        task = loop.create_task(
+            self._run_connection(server_name, config, transport, pair_info, ready),
+            name=f"mcp-{server_name}",
+        )
+        pair_info["task"] = task
+        try:
+            return await ready
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
+
+    @staticmethod
+    async def _run_connection(
+        server_name: str,
+        config: MCPServerConfig,
+        transport: Any,
+        pair_info: Dict[str, Any],
+        ready: asyncio.Future[ClientSession],
+    ) -> None:
+        """Hold a server connection open until its shutdown event is set."""
+        try:
+            async with transport as streams:
+                session = ClientSession(
+                    streams[0],
+                    streams[1],
+                    message_handler=_tools_changed_handler(pair_info),
+                )
+                async with session:
+                    try:
+                        await asyncio.wait_for(
+                            session.initialize(), config.connect_timeout
+                        )
+                    except TimeoutError:
+                        raise TimeoutError(
+                            f"no response within {config.connect_timeout:g} seconds"
+                        ) from None
+                    ready.set_result(session)
+                    await pair_info["shutdown"].wait()
+        except asyncio.CancelledError:
+            ready.cancel()
+            raise
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                logger.error(f"MCP server connection {server_name} failed: {e}")
+        finally:
+            if not ready.done():
+                ready.set_exception(
+                    ConnectionError(f"{server_name} closed during startup")
+                )
+            errlog = pair_info.get("errlog")
+            if errlog and errlog is not sys.stderr:
+                errlog.close()
+
+    async def stop_server(self, server_name: str) -> None:
+        """Stop an MCP server connection, or release it if it is shared."""
+        self._tools_cache.pop(server_name, None)
+        self._invalidate_results(server_name)
+        await _close_connection(
+            server_name, self.sessions, self.stream_pairs, self._pool_keys
+        )
 
     async def stop_all_servers(self) -> None:
         """Stop all running MCP servers."""
@@ -316,6 +997,11 @@ class MCPClient:
         """
         Discover available tools from an MCP server.
 
+        The tool list is fetched once per connection and cached until the
+        server is stopped or notifies that its tools changed. Tools of stdio
+        servers are also kept on disk, so later runs skip the ``tools/list``
+        request while the server's config and command are unchanged.
+
         Args:
             server_name: Name of the server to query
 
@@ -326,11 +1012,29 @@ class MCPClient:
             logger.error(f"MCP server {server_name} is not connected")
             return []
 
+        version = self.stream_pairs.get(server_name, {}).get("tools_version", 0)
+        cached = self._tools_cache.get(server_name)
+        if cached and cached[0] == version:
+            return cached[1]
+
+        config = self.server_configs.get(server_name)
+        cache_path = _tools_cache_path(config) if config else None
+        # Once the server reported a change, the tools on disk are outdated
+        if cache_path and version == 0:
+            tools = _read_tools_cache(cache_path, server_name)
+            if tools is not None:
+                logger.info(f"Loaded {len(tools)} cached tools for {server_name}")
+                self._tools_cache[server_name] = (version, tools)
+                return tools
+
         try:
             session = self.sessions[server_name]
             
             # List available tools
-            tools_response = await session.list_tools()
+            tools_response = await asyncio.wait_for(
+                session.list_tools(),
+                config.call_timeout if config else DEFAULT_CALL_TIMEOUT,
+            )
             
             tools = []
             for tool in tools_response.tools:
@@ -344,6 +1048,9 @@ class MCPClient:
                 tools.append(mcp_tool)
             
             logger.info(f"Discovered {len(tools)} tools from {server_name}")
+            self._tools_cache[server_name] = (version, tools)
+            if cache_path:
+                _write_tools_cache(cache_path, tools)
             return tools
 
         except Exception as e:
@@ -356,6 +1063,11 @@ class MCPClient:
         """
         Call a tool on an MCP server.
 
+        Successful results of the server's ``cacheable_tools`` are cached per
+        parameters until the next call of any other tool on that server, which
+        may have changed what they read. Identical concurrent calls of those
+        tools share one request.
+
         Args:
             tool_name: Name of the tool to call
             server_name: Name of the server hosting the tool
@@ -364,33 +1076,131 @@ class MCPClient:
         Returns:
             JSON string with the tool execution result
         """
+        cache_key = self._result_cache_key(tool_name, server_name, parameters)
+        if cache_key is None:
+            self._invalidate_results(server_name)
+            result = dumps(await self._call_tool(tool_name, server_name, parameters))
+            # Reads that overlapped with this call may have cached stale results
+            self._invalidate_results(server_name)
+            return result
+
+        cached = self._result_cache.get(cache_key)
+        if cached is not None:
+            self._result_cache.move_to_end(cache_key)
+            return cached
+        in_flight = self._in_flight.get(cache_key)
+        if in_flight is not None:
+            try:
+                return await asyncio.shield(in_flight)
+            except _CallAbandoned:
+                # Only the caller that made the call was cancelled, not this one
+                return await self.call_tool(tool_name, server_name, parameters)
+
+        pending: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        self._in_flight[cache_key] = pending
+        try:
+            response = await self._call_tool(tool_name, server_name, parameters)
+        except BaseException as e:
+            cancelled = isinstance(e, asyncio.CancelledError)
+            pending.set_exception(_CallAbandoned() if cancelled else e)
+            # Mark the exception retrieved, there may be no other caller waiting
+            pending.exception()
+            raise
+        finally:
+            if self._in_flight.get(cache_key) is pending:
+                del self._in_flight[cache_key]
+        result = dumps(response)
+        pending.set_result(result)
+
+        if response.get("success") and not response.get("isError"):
+            self._result_cache[cache_key] = result
+            if len(self._result_cache) > TOOL_RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+        return result
+
+    def _result_cache_key(
+        self, tool_name: str, server_name: str, parameters: Dict[str, Any]
+    ) -> Optional[Tuple[str, str, str]]:
+        """Return the result cache key of a call, or None if it is not cacheable."""
+        config = self.server_configs.get(server_name)
+        if config is None or tool_name not in config.cacheable_tools:
+            return None
+        return (
+            server_name,
+            tool_name,
+            dumps(parameters, sort_keys=True, default=str),
+        )
+
+    def _peek_result(
+        self, tool_name: str, server_name: str, parameters: Dict[str, Any]
+    ) -> Optional[str]:
+        """Return a cached result without scheduling work on the MCP loop."""
+        cache_key = self._result_cache_key(tool_name, server_name, parameters)
+        return self._result_cache.get(cache_key) if cache_key else None
+
+    def _invalidate_results(self, server_name: str) -> None:
+        """Drop the cached tool results of a server.
+
+        Calls still in flight complete for their callers, but later calls no
+        longer join them.
+        """
+        for key in [key for key in self._result_cache if key[0] == server_name]:
+            del self._result_cache[key]
+        for key in [key for key in self._in_flight if key[0] == server_name]:
+            del self._in_flight[key]
+
+    async def _call_tool(
+        self, tool_name: str, server_name: str, parameters: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Call a tool on an MCP server and return the formatted result."""
         if server_name not in self.sessions:
-            return json.dumps(
-                {"success": False, "error": f"Server {server_name} is not connected"}
-            )
+            return {"success": False, "error": f"Server {server_name} is not connected"}
+
+        # Fail fast instead of waiting on a server that keeps failing
+        breaker = self.stream_pairs.get(server_name, {}).get("breaker")
+        if breaker and not breaker.allow():
+            return {
+                "success": False,
+                "error": f"Server {server_name} is failing, try again later",
+            }
 
         try:
             session = self.sessions[server_name]
             
-            # Log the tool call for debugging
-            logger.info(f"Calling tool '{tool_name}' on server '{server_name}' with parameters: {parameters}")
-            
-            # Call the tool
-            result = await session.call_tool(tool_name, parameters)
-            
+            # Log the tool call for debugging; arguments are only formatted
+            # when the record is emitted
+            logger.info(
+                "Calling tool '%s' on server '%s' with parameters: %s",
+                tool_name,
+                server_name,
+                parameters,
+            )
+
+            # Call the tool, waiting for a slot if the server is busy
+            config = self.server_configs.get(server_name)
+            call_timeout = timedelta(
+                seconds=config.call_timeout if config else DEFAULT_CALL_TIMEOUT
+            )
+            call_limit = self.stream_pairs.get(server_name, {}).get("call_limit")
+            async with call_limit or contextlib.nullcontext():
+                result = await session.call_tool(
+                    tool_name, parameters, read_timeout_seconds=call_timeout
+                )
+            if breaker:
+                breaker.record(True)
+
             # Log the result for debugging
-            logger.info(f"Tool call result type: {type(result)}")
-            logger.info(f"Tool call result attributes: {dir(result)}")
+            logger.debug("Tool call result type: %s", type(result).__name__)
             
             # Format the result
             if hasattr(result, 'content') and result.content:
-                # Extract content from the result
+                # Extract content from the result, dispatching on its type
                 content_items = []
                 for content in result.content:
-                    if hasattr(content, 'text'):
-                        content_items.append(content.text)
-                    elif hasattr(content, 'data'):
-                        content_items.append(str(content.data))
+                    content_type: str = getattr(content, "type", "")
+                    extract = _CONTENT_EXTRACTORS.get(content_type)
+                    if extract:
+                        content_items.append(extract(content))
                 
                 response = {
                     "success": True,
@@ -402,7 +1212,7 @@ class MCPClient:
                 if hasattr(result, 'structuredData') and result.structuredData:
                     response["structuredData"] = result.structuredData
                 
-                return json.dumps(response)
+                return response
             else:
                 # Check if there's an error in the result
                 if hasattr(result, 'isError') and result.isError:
@@ -413,15 +1223,95 @@ class MCPClient:
                             if hasattr(content, 'text'):
                                 error_msg = content.text
                                 break
-                    return json.dumps({"success": False, "error": error_msg})
+                    return {"success": False, "error": error_msg}
                 else:
-                    return json.dumps({"success": True, "content": [], "isError": False})
+                    return {"success": True, "content": [], "isError": False}
 
         except Exception as e:
-            logger.error(f"Error calling tool {tool_name} on {server_name}: {e}")
-            logger.error(f"Exception type: {type(e)}")
-            logger.error(f"Exception details: {e}", exc_info=True)
-            return json.dumps({"success": False, "error": str(e)})
+            if breaker:
+                breaker.record(False)
+            logger.error(
+                f"Error calling tool {tool_name} on {server_name}: "
+                f"{type(e).__name__}: {e}"
+            )
+            logger.debug("Tool call error details", exc_info=True)
+            return {"success": False, "error": str(e)}
+
+    def _run_tool(
+        self,
+        tool_name: str,
+        server_name: str,
+        param_names: List[str],
+        /,
+        *args: Any,
+        **kwargs: Any,
+    ) -> str:
+        """Call an MCP tool from synchronous LangChain code."""
+        parameters = _map_tool_args(param_names, args, kwargs)
+
+        # Answer cached results inline, skipping the hop to the MCP loop
+        cached = self._peek_result(tool_name, server_name, parameters)
+        if cached is not None:
+            return cached
+
+        # Run the async call in the background event loop; clients that were
+        # not initialized through it use the shared loop rather than paying
+        # for a new loop per call
+        loop = getattr(self, '_loop', None) or _get_shared_loop()
+        future = asyncio.run_coroutine_threadsafe(
+            self.call_tool(tool_name, server_name, parameters), loop
+        )
+        try:
+            return future.result(timeout=self._call_deadline(server_name))
+        except TimeoutError:
+            future.cancel()
+            raise
+
+    async def _arun_tool(
+        self,
+        tool_name: str,
+        server_name: str,
+        param_names: List[str],
+        /,
+        *args: Any,
+        **kwargs: Any,
+    ) -> str:
+        """Call an MCP tool from async LangChain code without blocking a thread."""
+        parameters = _map_tool_args(param_names, args, kwargs)
+
+        # Answer cached results inline, skipping the hop to the MCP loop
+        cached = self._peek_result(tool_name, server_name, parameters)
+        if cached is not None:
+            return cached
+
+        call = self.call_tool(tool_name, server_name, parameters)
+        loop = getattr(self, '_loop', None)
+        if loop is None or loop is asyncio.get_running_loop():
+            return await call
+        future = asyncio.run_coroutine_threadsafe(call, loop)
+        return await asyncio.wait_for(
+            asyncio.wrap_future(future), timeout=self._call_deadline(server_name)
+        )
+
+    def _call_deadline(self, server_name: str) -> float:
+        """Seconds to wait for a tool call made from another thread."""
+        config = self.server_configs.get(server_name)
+        call_timeout = config.call_timeout if config else DEFAULT_CALL_TIMEOUT
+        return call_timeout + TIMEOUT_MARGIN
+
+    def _startup_deadline(self) -> float:
+        """Seconds to wait for initialize_async to bring up every server.
+
+        Servers start at most MAX_CONCURRENT_STARTS at a time, and each one
+        has its handshake and its tools/list request to answer.
+        """
+        configs = list(self.server_configs.values())
+        rounds = math.ceil(len(configs) / MAX_CONCURRENT_STARTS)
+        per_server = max(
+            (config.connect_timeout + config.call_timeout for config in configs),
+            default=0.0,
+        )
+        return rounds * per_server + TIMEOUT_MARGIN
 
     def create_langchain_tools(self) -> List[Tool]:
         """
@@ -433,91 +1323,46 @@ class MCPClient:
         langchain_tools = []
 
         for mcp_tool in self.available_tools:
-
-            def create_tool_func(
-                tool_name: str, server_name: str, input_schema: Dict[str, Any]
-            ):
-                def tool_func(*args, **kwargs) -> str:
-                    # Handle both positional and keyword arguments
-                    schema_properties = input_schema.get("properties", {})
-                    required_params = input_schema.get("required", [])
-                    
-                    # Get parameter names in order (required first, then others)
-                    param_names = list(schema_properties.keys())
-                    if required_params:
-                        param_names = required_params + [
-                            p for p in param_names if p not in required_params
-                        ]
-                    
-                    mapped_kwargs = {}
-                    
-                    if args and not kwargs:
-                        # Map positional arguments to parameter names
-                        for i, arg in enumerate(args):
-                            if i < len(param_names):
-                                mapped_kwargs[param_names[i]] = arg
-                    elif kwargs:
-                        # Check if we have generic argument names like __arg1, __arg2
-                        generic_args = {k: v for k, v in kwargs.items() if k.startswith('__arg')}
-                        if generic_args:
-                            # Map generic arguments to proper parameter names
-                            sorted_generic = sorted(generic_args.items())
-                            for i, (_, value) in enumerate(sorted_generic):
-                                if i < len(param_names):
-                                    mapped_kwargs[param_names[i]] = value
-                        else:
-                            # Use kwargs directly if they have proper names
-                            mapped_kwargs = kwargs
-                    else:
-                        # No arguments provided
-                        mapped_kwargs = {}
-
-                    # Run the async call in the background event loop
-                    if hasattr(self, '_loop') and self._loop:
-                        future = asyncio.run_coroutine_threadsafe(
-                            self.call_tool(tool_name, server_name, mapped_kwargs), 
-                            self._loop
-                        )
-                        return future.result(timeout=30)  # 30 second timeout
-                    else:
-                        # Fallback to creating a new event loop
-                        return asyncio.run(
-                            self.call_tool(tool_name, server_name, mapped_kwargs)
-                        )
-
-                return tool_func
-
-            # Create a more descriptive tool description with parameter info
-            param_info = ""
-            if mcp_tool.input_schema.get("properties"):
-                properties = mcp_tool.input_schema["properties"]
-                required = mcp_tool.input_schema.get("required", [])
-                param_descriptions = []
-                
-                for param_name, param_def in properties.items():
-                    param_type = param_def.get("type", "string")
-                    param_desc = param_def.get("description", param_def.get("title", param_name))
-                    required_marker = " (required)" if param_name in required else ""
-                    param_descriptions.append(f"{param_name} ({param_type}){required_marker}: {param_desc}")
-                
-                if param_descriptions:
-                    param_info = f"\n\nParameters:\n" + "\n".join(f"- {desc}" for desc in param_descriptions)
-            
-            # Use get_display_name for better naming
-            display_name = get_display_name(mcp_tool) if hasattr(mcp_tool, 'title') else mcp_tool.name
-            
+            # Bind the tool and its parameter order once, at definition time
+            bound = (
+                mcp_tool.name,
+                mcp_tool.server_name,
+                _parameter_names(mcp_tool.input_schema),
+            )
             langchain_tool = Tool(
                 name=f"mcp_{mcp_tool.server_name}_{mcp_tool.name}",
-                description=f"[MCP {mcp_tool.server_name}] {mcp_tool.description}{param_info}",
-                func=create_tool_func(
-                    mcp_tool.name, mcp_tool.server_name, mcp_tool.input_schema
+                description=(
+                    f"[MCP {mcp_tool.server_name}] {mcp_tool.description}"
+                    f"{_parameter_info(mcp_tool.input_schema)}"
                 ),
+                func=functools.partial(self._run_tool, *bound),
+                coroutine=functools.partial(self._arun_tool, *bound),
             )
 
             langchain_tools.append(langchain_tool)
 
         return langchain_tools
 
+    async def _bring_up(
+        self, server_name: str, limit: asyncio.Semaphore
+    ) -> List[MCPTool]:
+        """
+        Start an MCP server and discover its tools.
+
+        Args:
+            server_name: Name of the server to start
+            limit: Bounds the number of servers being brought up at once
+
+        Returns:
+            Tools of the server, empty if it could not be started
+        """
+        async with limit:
+            if not await self.start_server(server_name):
+                return []
+            tools = await self.discover_tools(server_name)
+        logger.info(f"Discovered {len(tools)} tools from MCP server: {server_name}")
+        return tools
+
     async def initialize_async(self) -> List[Tool]:
         """
         Initialize the MCP client asynchronously and return available tools.
@@ -527,20 +1372,39 @@ class MCPClient:
         """
         self.load_config()
 
-        # Start servers and discover tools
-        for server_name in self.server_configs:
-            if await self.start_server(server_name):
-                tools = await self.discover_tools(server_name)
-                self.available_tools.extend(tools)
-                logger.info(
-                    f"Discovered {len(tools)} tools from MCP server: {server_name}"
-                )
+        # Registered up front, so servers started before a failure or a
+        # cancellation are still closed with the client
+        if self._finalizer is None:
+            self._finalizer = weakref.finalize(
+                self,
+                _finalize_connections,
+                asyncio.get_running_loop(),
+                self.sessions,
+                self.stream_pairs,
+                self._pool_keys,
+            )
+        self._running = True
+
+        # Start servers and discover their tools concurrently, so startup takes
+        # as long as the slowest server rather than the sum of all of them
+        limit = asyncio.Semaphore(MAX_CONCURRENT_STARTS)
+        server_tools = await asyncio.gather(
+            *(
+                self._bring_up(server_name, limit)
+                for server_name in self.server_configs
+            ),
+            return_exceptions=True,
+        )
+        for server_name, tools in zip(self.server_configs, server_tools):
+            if isinstance(tools, BaseException):
+                # One failing server must not cost the tools of the others
+                logger.error(f"Failed to bring up MCP server {server_name}: {tools}")
+                continue
+            self.available_tools.extend(tools)
 
         # Create LangChain tools
         langchain_tools = self.create_langchain_tools()
         logger.info(f"Created {len(langchain_tools)} MCP tools for the agent")
-
-        self._running = True
         return langchain_tools
 
     def initialize(self) -> List[Tool]:
@@ -556,57 +1420,32 @@ class MCPClient:
         """
         # We need to run the async initialization in a way that keeps
         # the event loop and connections alive
-        import threading
-        import asyncio
-        
-        # Create a new event loop for the MCP client
-        self._loop = asyncio.new_event_loop()
-        self._loop_thread = threading.Thread(target=self._run_event_loop, daemon=True)
-        self._loop_thread.start()
-        
-        # Wait for the loop to be ready
-        import time
-        time.sleep(0.1)
-        
+        # Run on the background loop shared by all MCP clients, so clients
+        # with identical server configs share their connections
+        self._loop = _get_shared_loop()
+        # Loaded here too, so the wait below is sized to the configured servers
+        self.load_config()
+
         # Initialize the MCP client in the background loop
         future = asyncio.run_coroutine_threadsafe(self.initialize_async(), self._loop)
-        tools = future.result(timeout=30)  # 30 second timeout
+        try:
+            tools = future.result(timeout=self._startup_deadline())
+        except TimeoutError:
+            # Stops the servers still starting; started ones stay with the
+            # client and are closed by cleanup or its finalizer
+            future.cancel()
+            raise
         
         return tools
     
-    def _run_event_loop(self):
-        """Run the event loop in a background thread."""
-        asyncio.set_event_loop(self._loop)
-        self._loop.run_forever()
-        
     async def cleanup_async(self) -> None:
         """Clean up resources and stop all servers asynchronously."""
         if self._running:
             try:
-                # Close sessions first
-                for server_name in list(self.sessions.keys()):
-                    try:
-                        session = self.sessions[server_name]
-                        await session.__aexit__(None, None, None)
-                        del self.sessions[server_name]
-                        logger.info(f"Closed MCP server session: {server_name}")
-                    except Exception as e:
-                        logger.warning(f"Error closing session for {server_name}: {e}")
-                
-                # Clear the stream pairs without forcing cleanup
-                # The HTTP context will be cleaned up naturally by Python's GC
-                # avoiding the task group context issues
-                stream_pairs_copy = dict(self.stream_pairs)
-                self.stream_pairs.clear()
-                
-                for server_name, pair_info in stream_pairs_copy.items():
-                    try:
-                        logger.info(f"Removed MCP server connection tracking: {server_name}")
-                        # Don't attempt to clean up the context - let it be handled naturally
-                        # This avoids the "Attempted to exit cancel scope in a different task" error
-                    except Exception as e:
-                        logger.warning(f"Error during stream cleanup for {server_name}: {e}")
-                
+                # Close or release the connections; each one is closed by
+                # the task that opened it
+                await self.stop_all_servers()
+
                 self._running = False
                 logger.info("MCP client cleanup completed")
             except Exception as e:
@@ -619,17 +1458,11 @@ class MCPClient:
             self._cleanup_attempted = True
             try:
                 if hasattr(self, '_loop') and self._loop:
-                    # Schedule cleanup in the background loop
+                    # Schedule cleanup in the background loop, which keeps
+                    # running for other clients
                     future = asyncio.run_coroutine_threadsafe(self.cleanup_async(), self._loop)
                     future.result(timeout=10)  # 10 second timeout
-                    
-                    # Stop the event loop
-                    self._loop.call_soon_threadsafe(self._loop.stop)
-                    
-                    # Wait for thread to finish
-                    if hasattr(self, '_loop_thread') and self._loop_thread:
-                        self._loop_thread.join(timeout=5)
-                        
+
                 else:
                     # Fallback to old method
                     try:
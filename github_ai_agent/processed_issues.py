@@ -0,0 +1,98 @@
+"""Bookkeeping of issues the AI Agent has already processed."""
+
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Iterator, Optional
+
+# Enough to cover the lifetime of a busy daemon while bounding memory use
+DEFAULT_MAX_PROCESSED_ISSUES = 50_000
+
+_CREATE_TABLE = (
+    "CREATE TABLE IF NOT EXISTS done("
+    "repo TEXT, num INTEGER, ts REAL, PRIMARY KEY(repo, num))"
+)
+_SELECT_DONE = "SELECT 1 FROM done WHERE repo = ? AND num = ?"
+_INSERT_DONE = "INSERT OR REPLACE INTO done(repo, num, ts) VALUES (?, ?, ?)"
+
+
+class ProcessedIssues:
+    """Size-bounded set of processed issue numbers with LRU eviction.
+
+    Membership checks and additions are O(1). Once ``max_size`` issues are
+    tracked, adding another evicts the least recently added one.
+
+    When ``db_path`` is given, processed issues are also persisted to a local
+    SQLite database so they survive daemon restarts. Issues evicted from (or
+    never loaded into) the in-memory set are still found in the database.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_MAX_PROCESSED_ISSUES,
+        db_path: Optional[str] = None,
+        repo: str = "",
+    ):
+        """Initialize the processed issue set.
+
+        Args:
+            max_size: Maximum number of issue numbers to remember in memory
+            db_path: Path of the SQLite database, or None to keep no history
+            repo: Repository the issues belong to, as "owner/repo"
+        """
+        self.max_size = max_size
+        self.repo = repo
+        self._issues: "OrderedDict[int, None]" = OrderedDict()
+        self._db: Optional[sqlite3.Connection] = None
+        # Shared by the event loop and the worker threads filtering issues
+        self._lock = threading.Lock()
+
+        if db_path:
+            self._db = sqlite3.connect(
+                db_path, isolation_level=None, check_same_thread=False
+            )
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(_CREATE_TABLE)
+
+    def add(self, issue_number: int) -> None:
+        """Mark an issue as processed, evicting the oldest entry if full."""
+        with self._lock:
+            self._remember(issue_number)
+            if self._db is not None:
+                self._db.execute(_INSERT_DONE, (self.repo, issue_number, time.time()))
+
+    def _remember(self, issue_number: int) -> None:
+        # Callers hold self._lock
+        self._issues[issue_number] = None
+        self._issues.move_to_end(issue_number)
+        if len(self._issues) > self.max_size:
+            self._issues.popitem(last=False)
+
+    def close(self) -> None:
+        """Close the backing database, if any."""
+        if self._db is not None:
+            with self._lock:
+                self._db.close()
+                self._db = None
+
+    def __contains__(self, issue_number: object) -> bool:
+        if issue_number in self._issues:
+            return True
+        if self._db is None:
+            return False
+
+        with self._lock:
+            row = self._db.execute(_SELECT_DONE, (self.repo, issue_number)).fetchone()
+            if row is None:
+                return False
+
+            # Cache the hit so later checks for this issue skip the database
+            self._remember(issue_number)  # type: ignore[arg-type]
+        return True
+
+    def __len__(self) -> int:
+        return len(self._issues)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._issues)
@@ -0,0 +1,142 @@
+"""GitHub webhook receiver for event-driven issue processing."""
+
+import asyncio
+import hashlib
+import hmac
+import json
+import logging
+from typing import Any, Dict, Optional
+
+from aiohttp import web
+
+from .json_utils import loads
+from .logging_utils import log_error, log_github_action
+
+logger = logging.getLogger(__name__)
+
+# Issue actions that can make an issue eligible for processing
+PROCESSABLE_ACTIONS = frozenset({"opened", "labeled", "assigned"})
+
+
+def verify_signature(secret: str, body: bytes, signature_header: Optional[str]) -> bool:
+    """Validate the X-Hub-Signature-256 header of a webhook delivery.
+
+    Args:
+        secret: Webhook secret configured on GitHub
+        body: Raw request body
+        signature_header: Value of the X-Hub-Signature-256 header
+
+    Returns:
+        True if the signature matches the body, False otherwise
+    """
+    if not signature_header or not signature_header.startswith("sha256="):
+        return False
+
+    expected = hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, signature_header[len("sha256=") :])
+
+
+class WebhookServer:
+    """HTTP endpoint that queues issue numbers from GitHub ``issues`` events."""
+
+    def __init__(
+        self,
+        secret: str,
+        queue: "asyncio.Queue[int]",
+        label: str,
+        assignee: str,
+        host: str = "0.0.0.0",
+        port: int = 8080,
+        path: str = "/webhook",
+    ):
+        """Initialize the webhook server.
+
+        Args:
+            secret: Webhook secret used to validate deliveries
+            queue: Queue receiving the numbers of issues to process
+            label: Issue label that marks issues for the AI Agent
+            assignee: GitHub username that marks issues for the AI Agent
+            host: Interface to bind to
+            port: Port to listen on
+            path: URL path of the webhook endpoint
+        """
+        self.secret = secret
+        self.queue = queue
+        self.label = label
+        self.assignee = assignee
+        self.host = host
+        self.port = port
+        self.path = path
+        self._runner: Optional[web.AppRunner] = None
+
+    def get_issue_number(self, event: str, payload: Dict[str, Any]) -> Optional[int]:
+        """Return the issue number if the event should trigger processing.
+
+        Args:
+            event: Value of the X-GitHub-Event header
+            payload: Decoded webhook payload
+
+        Returns:
+            Issue number for relevant open issues, None otherwise
+        """
+        if event != "issues" or payload.get("action") not in PROCESSABLE_ACTIONS:
+            return None
+
+        issue = payload.get("issue") or {}
+        if issue.get("state") != "open" or "pull_request" in issue:
+            return None
+
+        labels = {label.get("name") for label in issue.get("labels", [])}
+        assignees = {user.get("login") for user in issue.get("assignees", [])}
+        if self.label in labels or self.assignee in assignees:
+            return issue.get("number")
+
+        return None
+
+    async def handle(self, request: web.Request) -> web.Response:
+        """Handle a single webhook delivery."""
+        body = await request.read()
+
+        if not verify_signature(
+            self.secret, body, request.headers.get("X-Hub-Signature-256")
+        ):
+            log_error("Rejected webhook delivery with invalid signature")
+            return web.Response(status=401, text="invalid signature")
+
+        event = request.headers.get("X-GitHub-Event", "")
+        if event == "ping":
+            return web.Response(text="pong")
+
+        try:
+            # Parse the raw bytes directly, without decoding them to str first
+            payload = loads(body)
+        except json.JSONDecodeError:  # Also raised by orjson
+            return web.Response(status=400, text="invalid payload")
+
+        issue_number = self.get_issue_number(event, payload)
+        if issue_number is not None:
+            log_github_action(
+                f"Webhook: issue #{issue_number} {payload.get('action')}", "WEBHOOK"
+            )
+            self.queue.put_nowait(issue_number)
+
+        return web.Response(status=202, text="accepted")
+
+    async def start(self) -> None:
+        """Start listening for webhook deliveries."""
+        app = web.Application()
+        app.router.add_post(self.path, self.handle)
+
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        log_github_action(
+            f"Listening for webhooks on {self.host}:{self.port}{self.path}", "WEBHOOK"
+        )
+
+    async def stop(self) -> None:
+        """Stop the webhook server."""
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
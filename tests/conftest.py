@@ -0,0 +1,12 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_mcp_dirs(tmp_path, monkeypatch):
+    """Keep server logs and the tools cache out of the working tree and home."""
+    monkeypatch.setattr("github_ai_agent.mcp_client.MCP_LOG_DIR", tmp_path / "logs")
+    monkeypatch.setattr(
+        "github_ai_agent.mcp_client.TOOLS_CACHE_DIR", tmp_path / "tools"
+    )
@@ -4,7 +4,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from github_ai_agent.config import Settings
+from github_ai_agent.config import Settings, get_settings
 from github_ai_agent.github_client import GitHubClient
 
 
@@ -22,6 +22,20 @@ def test_settings_creation():
         assert settings.issue_assignee == "Test-AI-Agent"
 
 
+def test_get_settings_is_cached():
+    """Test that settings are parsed once and reused."""
+    get_settings.cache_clear()
+    try:
+        with patch.dict(
+            "os.environ",
+            {"GITHUB_TOKEN": "test_token", "OPENAI_API_KEY": "test_openai_key"},
+        ):
+            settings = get_settings()
+            assert get_settings() is settings
+    finally:
+        get_settings.cache_clear()
+
+
 def test_github_client_initialization():
     """Test that GitHub client can be initialized."""
     client = GitHubClient(
@@ -0,0 +1,437 @@
+"""Tests for the async GitHub API client."""
+
+import asyncio
+import json
+import time
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from github_ai_agent.github_async_client import MAX_RETRIES, AsyncGitHubClient
+
+REPO = "/repos/test_owner/test_repo"
+
+
+def _client(handler) -> AsyncGitHubClient:
+    return AsyncGitHubClient(
+        token="test_token",
+        target_owner="test_owner",
+        target_repo="test_repo",
+        transport=httpx.MockTransport(handler),
+    )
+
+
+def _issue(number: int, **extra) -> dict:
+    return {"number": number, "title": f"Issue {number}", "labels": [], **extra}
+
+
+def test_get_issues_assigned_to_fetches_all_pages_and_skips_pull_requests():
+    """Test that pages up to rel="last" are fetched and PRs are filtered out."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.headers["Authorization"] == "Bearer test_token"
+        assert request.url.params["assignee"] == "Test-AI-Agent"
+        page = request.url.params["page"]
+        if page != "1":
+            return httpx.Response(200, json=[_issue(int(page) + 1)])
+        base = f"https://api.github.com{REPO}/issues?assignee=Test-AI-Agent"
+        return httpx.Response(
+            200,
+            json=[_issue(1), _issue(2, pull_request={"url": "..."})],
+            headers={
+                "Link": f'<{base}&page=2>; rel="next", <{base}&page=3>; rel="last"'
+            },
+        )
+
+    async def run():
+        client = _client(handler)
+        try:
+            return await client.get_issues_assigned_to("Test-AI-Agent")
+        finally:
+            await client.aclose()
+
+    issues = asyncio.run(run())
+
+    assert sorted(issue.number for issue in issues) == [1, 3, 4]
+    assert issues[0].title == "Issue 1"
+
+
+def test_get_issues_assigned_to_returns_empty_on_error():
+    """Test that HTTP errors are logged and an empty list returned."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.params["assignee"] == "Test-AI-Agent"
+        return httpx.Response(500)
+
+    issues = asyncio.run(_client(handler).get_issues_assigned_to("Test-AI-Agent"))
+
+    assert issues == []
+
+
+def test_iter_issues_assigned_to_raises_after_partial_results():
+    """Test that a failed later page is raised after the earlier issues."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.params["page"] != "1":
+            return httpx.Response(500)
+        base = f"https://api.github.com{REPO}/issues?assignee=Test-AI-Agent"
+        return httpx.Response(
+            200, json=[_issue(1)], headers={"Link": f'<{base}&page=2>; rel="last"'}
+        )
+
+    async def run():
+        client = _client(handler)
+        seen = []
+        try:
+            with pytest.raises(httpx.HTTPStatusError):
+                async for issue in client.iter_issues_assigned_to("Test-AI-Agent"):
+                    seen.append(issue.number)
+        finally:
+            await client.aclose()
+        return seen
+
+    assert asyncio.run(run()) == [1]
+
+
+def _graphql_handler(posted: list, create_ref_errors=None):
+    """Mock GitHub API serving the label query, commits and createRef."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == f"{REPO}/git/commits":
+            posted.append(("commit", json.loads(request.content)))
+            return httpx.Response(201, json={"sha": "wip"})
+
+        assert request.url.path == "/graphql"
+        body = json.loads(request.content)
+        posted.append(("graphql", body["variables"]))
+        if "createRef" in body["query"]:
+            if create_ref_errors:
+                return httpx.Response(200, json={"errors": create_ref_errors})
+            return httpx.Response(200, json={"data": {"createRef": {"ref": {}}}})
+
+        repository = {
+            "id": "R_1",
+            "ref": {"target": {"oid": "base", "tree": {"oid": "tree"}}},
+        }
+        if "issues(" in body["query"]:
+            repository["issues"] = {
+                "pageInfo": {"hasNextPage": False, "endCursor": None},
+                "nodes": [
+                    {
+                        "number": 5,
+                        "title": "Issue 5",
+                        "body": None,
+                        "labels": {"nodes": [{"name": "AI Agent"}]},
+                        "assignees": {"nodes": []},
+                    }
+                ],
+            }
+        return httpx.Response(200, json={"data": {"repository": repository}})
+
+    return handler
+
+
+def test_get_issues_with_label_uses_graphql_and_caches_base_commit():
+    """Test that labeled issues and the base head come from one query."""
+    posted = []
+
+    async def run():
+        client = _client(_graphql_handler(posted))
+        issues = await client.get_issues_with_label("AI Agent")
+        assert await client.create_branch("ai-agent/issue-5") is True
+        assert await client.create_branch("ai-agent/issue-6") is True
+        return issues
+
+    issues = asyncio.run(run())
+
+    assert [(issue.number, issue.labels) for issue in issues] == [(5, ["AI Agent"])]
+    kinds = [kind for kind, _ in posted]
+    # One issue query, one shared WIP commit, then one createRef per branch
+    assert kinds == ["graphql", "commit", "graphql", "graphql"]
+    assert posted[1][1] == {
+        "message": "AI Agent WIP",
+        "tree": "tree",
+        "parents": ["base"],
+    }
+    assert posted[2][1] == {
+        "repositoryId": "R_1",
+        "name": "refs/heads/ai-agent/issue-5",
+        "oid": "wip",
+    }
+
+
+def test_create_branch_looks_up_base_commit_without_cache():
+    """Test that the base head is queried when no issue query cached it."""
+    posted = []
+
+    assert asyncio.run(_client(_graphql_handler(posted)).create_branch("b")) is True
+    assert [kind for kind, _ in posted] == ["graphql", "commit", "graphql"]
+
+
+def test_create_branch_existing_branch_is_success():
+    """Test that an 'already exists' createRef error counts as success."""
+    posted = []
+    errors = [{"message": 'A ref named "refs/heads/b" already exists.'}]
+
+    client = _client(_graphql_handler(posted, create_ref_errors=errors))
+
+    assert asyncio.run(client.create_branch("b")) is True
+
+
+def test_create_branch_other_errors_fail():
+    """Test that other createRef errors are reported as failure."""
+    posted = []
+    errors = [{"message": "Resource not accessible by integration"}]
+
+    client = _client(_graphql_handler(posted, create_ref_errors=errors))
+
+    assert asyncio.run(client.create_branch("b")) is False
+
+
+def test_concurrent_create_branch_calls_share_one_mutation():
+    """Test that concurrent branch creations are batched into one createRef call."""
+    posted = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == f"{REPO}/git/commits":
+            return httpx.Response(201, json={"sha": "wip"})
+        body = json.loads(request.content)
+        posted.append(body)
+        if "createRef" not in body["query"]:
+            repository = {
+                "id": "R_1",
+                "ref": {"target": {"oid": "base", "tree": {"oid": "tree"}}},
+            }
+            return httpx.Response(200, json={"data": {"repository": repository}})
+        if "b0:" not in body["query"]:
+            # Per-branch retry of the failed alias
+            return httpx.Response(200, json={"data": {"createRef": {"ref": {}}}})
+        return httpx.Response(
+            200,
+            json={
+                "data": {"b0": {"ref": {}}, "b1": None, "b2": None},
+                "errors": [
+                    {"path": ["b1"], "message": 'A ref named "x" already exists.'},
+                    {"path": ["b2"], "message": "Something went wrong"},
+                ],
+            },
+        )
+
+    async def run():
+        client = _client(handler)
+        return await asyncio.gather(
+            client.create_branch("a"),
+            client.create_branch("b"),
+            client.create_branch("c"),
+        )
+
+    assert asyncio.run(run()) == [True, True, True]
+
+    mutations = [body for body in posted if "createRef" in body["query"]]
+    assert len(mutations) == 2
+    assert mutations[0]["variables"] == {
+        "repositoryId": "R_1",
+        "oid": "wip",
+        "name0": "refs/heads/a",
+        "name1": "refs/heads/b",
+        "name2": "refs/heads/c",
+    }
+    # Only the branch that failed for another reason is retried on its own
+    assert mutations[1]["variables"]["name"] == "refs/heads/c"
+
+
+@patch("github_ai_agent.github_async_client.asyncio.sleep", new_callable=AsyncMock)
+def test_request_retries_rate_limited_responses(mock_sleep):
+    """Test that 429/403 rate-limit responses are retried with backoff."""
+    responses = [
+        httpx.Response(429, headers={"Retry-After": "3"}),
+        httpx.Response(403, headers={"X-RateLimit-Remaining": "0"}),
+        httpx.Response(200, json=[_issue(1)]),
+    ]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return responses.pop(0)
+
+    issues = asyncio.run(_client(handler).get_issues_assigned_to("Test-AI-Agent"))
+
+    assert [issue.number for issue in issues] == [1]
+    delays = [call.args[0] for call in mock_sleep.await_args_list]
+    assert delays[0] == 3.0
+    assert 2 <= delays[1] < 3
+
+
+@patch("github_ai_agent.github_async_client.asyncio.sleep", new_callable=AsyncMock)
+def test_request_gives_up_after_max_retries(mock_sleep):
+    """Test that retries stop after MAX_RETRIES attempts."""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(429)
+
+    issues = asyncio.run(_client(handler).get_issues_assigned_to("Test-AI-Agent"))
+
+    assert issues == []
+    assert len(calls) == MAX_RETRIES + 1
+
+
+@patch("github_ai_agent.github_async_client.asyncio.sleep", new_callable=AsyncMock)
+def test_request_does_not_retry_permission_errors(mock_sleep):
+    """Test that a plain 403 is returned without retrying."""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(403, headers={"X-RateLimit-Remaining": "4000"})
+
+    asyncio.run(_client(handler).get_issues_assigned_to("Test-AI-Agent"))
+
+    assert len(calls) == 1
+    mock_sleep.assert_not_awaited()
+
+
+@patch("github_ai_agent.github_async_client.asyncio.sleep", new_callable=AsyncMock)
+def test_request_waits_for_reset_when_budget_is_low(mock_sleep):
+    """Test that requests pause until reset once the budget runs low."""
+    reset = time.time() + 60
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            json=[],
+            headers={
+                "X-RateLimit-Remaining": "10",
+                "X-RateLimit-Reset": str(reset),
+            },
+        )
+
+    async def run():
+        client = _client(handler)
+        await client.get_issues_assigned_to("Test-AI-Agent")
+        await client.get_issues_assigned_to("Test-AI-Agent")
+
+    asyncio.run(run())
+
+    mock_sleep.assert_awaited_once()
+    assert 55 < mock_sleep.await_args.args[0] <= 60
+
+
+def test_get_issues_assigned_to_passes_since():
+    """Test that the since watermark is sent and updated_at is parsed."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.params["since"] == "2024-01-01T00:00:00Z"
+        return httpx.Response(200, json=[_issue(1, updated_at="2024-01-02T00:00:00Z")])
+
+    issues = asyncio.run(
+        _client(handler).get_issues_assigned_to(
+            "Test-AI-Agent", since="2024-01-01T00:00:00Z"
+        )
+    )
+
+    assert issues[0].updated_at == "2024-01-02T00:00:00Z"
+
+
+def test_unchanged_issue_pages_are_revalidated_with_etag():
+    """Test that repeated polls send If-None-Match and reuse the 304 body."""
+    seen_etags = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_etags.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json=[_issue(1)], headers={"ETag": '"v1"'})
+
+    async def run():
+        client = _client(handler)
+        first = await client.get_issues_assigned_to("Test-AI-Agent")
+        second = await client.get_issues_assigned_to("Test-AI-Agent")
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert seen_etags == [None, '"v1"']
+    assert [issue.number for issue in first] == [1]
+    assert [issue.number for issue in second] == [1]
+
+
+def test_get_open_prs_with_recent_comments_uses_one_graphql_query():
+    """Test that PRs, comments and related issues come from one query."""
+
+    def comment(login: str, created_at: str) -> dict:
+        return {
+            "databaseId": 1,
+            "body": "text",
+            "createdAt": created_at,
+            "updatedAt": created_at,
+            "author": {"login": login},
+        }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/graphql"
+        nodes = [
+            {
+                "number": 10,
+                "title": "Processing Issue #3",
+                "body": "",
+                "closingIssuesReferences": {"nodes": []},
+                "comments": {
+                    "nodes": [
+                        comment("user", "2024-01-01T00:00:00Z"),
+                        comment("user", "2024-01-03T00:00:00Z"),
+                    ]
+                },
+            },
+            {
+                "number": 11,
+                "title": "Old PR",
+                "body": "Closes #4",
+                "closingIssuesReferences": {"nodes": [{"number": 4}]},
+                "comments": {"nodes": [comment("user", "2024-01-01T00:00:00Z")]},
+            },
+        ]
+        pull_requests = {
+            "pageInfo": {"hasNextPage": False, "endCursor": None},
+            "nodes": nodes,
+        }
+        return httpx.Response(
+            200, json={"data": {"repository": {"pullRequests": pull_requests}}}
+        )
+
+    prs = asyncio.run(
+        _client(handler).get_open_prs_with_recent_comments("2024-01-02T00:00:00Z")
+    )
+
+    # PR #11 has no comments after the timestamp
+    assert [(pr["pr_number"], pr["related_issue"]) for pr in prs] == [(10, 3)]
+    assert [c["author"] for c in prs[0]["recent_comments"]] == ["user"]
+
+
+def test_get_open_prs_with_recent_comments_returns_none_on_graphql_error():
+    """Test that GraphQL errors signal the caller to fall back to REST."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"errors": [{"message": "Forbidden"}]})
+
+    assert asyncio.run(_client(handler).get_open_prs_with_recent_comments()) is None
+
+
+def test_get_processing_issue_numbers_reads_agent_pr_branches():
+    """Test that open PR head branches map to the issues being processed."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nodes = [
+            {"headRefName": "ai-agent/issue-3"},
+            {"headRefName": "ai-agent/issue-x"},
+            {"headRefName": "feature/other"},
+        ]
+        pull_requests = {
+            "pageInfo": {"hasNextPage": False, "endCursor": None},
+            "nodes": nodes,
+        }
+        return httpx.Response(
+            200, json={"data": {"repository": {"pullRequests": pull_requests}}}
+        )
+
+    assert asyncio.run(_client(handler).get_processing_issue_numbers()) == {3}
@@ -0,0 +1,70 @@
+"""Tests for GitHub client file reads."""
+
+from unittest.mock import MagicMock, Mock, patch
+
+from github_ai_agent.github_client import RAW_CHUNK_SIZE, GitHubClient
+
+
+def _make_client() -> GitHubClient:
+    """Build a token-authenticated client without network access."""
+    with patch("github_ai_agent.github_client.Github"):
+        return GitHubClient(target_owner="owner", target_repo="repo", token="t")
+
+
+def _raw_response(
+    status_code=200, content_type="application/vnd.github.raw", chunks=()
+):
+    response = MagicMock(
+        status_code=status_code, headers={"Content-Type": content_type}
+    )
+    response.__enter__.return_value = response
+    response.iter_content.return_value = iter(chunks)
+    return response
+
+
+def test_get_file_content_streams_raw_content():
+    """Test that file contents are streamed raw, without the contents API."""
+    client = _make_client()
+    client._repo = Mock()
+    response = _raw_response(chunks=[b"h\xc3", b"\xa9llo"])
+
+    with patch(
+        "github_ai_agent.github_client.requests.get", return_value=response
+    ) as get:
+        assert client.get_file_content("docs/a b.md", "feature") == "héllo"
+
+    args, kwargs = get.call_args
+    assert args[0].endswith("/repos/owner/repo/contents/docs/a%20b.md")
+    assert kwargs["params"] == {"ref": "feature"}
+    assert kwargs["stream"] is True
+    response.iter_content.assert_called_once_with(RAW_CHUNK_SIZE)
+    client._repo.get_contents.assert_not_called()
+
+
+def test_get_file_content_missing_file_skips_fallback():
+    """Test that a 404 on the raw download is not retried."""
+    client = _make_client()
+    client._repo = Mock()
+
+    with patch(
+        "github_ai_agent.github_client.requests.get",
+        return_value=_raw_response(status_code=404),
+    ):
+        assert client.get_file_content("missing.md") is None
+
+    client._repo.get_contents.assert_not_called()
+
+
+def test_get_file_content_falls_back_for_directories():
+    """Test that JSON responses fall back to the contents API checks."""
+    client = _make_client()
+    client._repo = Mock()
+    client._repo.get_contents.return_value = Mock(type="dir")
+
+    with patch(
+        "github_ai_agent.github_client.requests.get",
+        return_value=_raw_response(content_type="application/json; charset=utf-8"),
+    ):
+        assert client.get_file_content("docs") is None
+
+    client._repo.get_contents.assert_called_once_with("docs", ref="main")
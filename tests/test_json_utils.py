@@ -0,0 +1,38 @@
+"""Tests for the JSON helpers."""
+
+from unittest.mock import patch
+
+import pytest
+
+from github_ai_agent import json_utils
+
+VALUE = {"author": "user", "body": 'Fix "it" ✓', "ids": [1, 2]}
+
+
+@pytest.mark.parametrize("fast", [True, False])
+def test_dumps_is_compact_and_round_trips(fast):
+    """Test compact encoding with and without orjson."""
+    orjson = json_utils.orjson if fast else None
+    with patch.object(json_utils, "orjson", orjson):
+        encoded = json_utils.dumps(VALUE)
+        decoded = json_utils.loads(encoded)
+        decoded_bytes = json_utils.loads(encoded.encode("utf-8"))
+
+    assert ", " not in encoded and ": " not in encoded
+    assert "✓" in encoded
+    assert decoded == decoded_bytes == VALUE
+
+
+def test_dumps_falls_back_for_values_orjson_rejects():
+    """Test that integers wider than 64 bits still serialize."""
+    assert json_utils.dumps({"n": 2**70}) == '{"n":1180591620717411303424}'
+
+
+@pytest.mark.parametrize("fast", [True, False])
+def test_dumps_sorts_keys_and_applies_default(fast):
+    """Test canonical encoding with and without orjson."""
+    orjson = json_utils.orjson if fast else None
+    with patch.object(json_utils, "orjson", orjson):
+        encoded = json_utils.dumps({"b": object, "a": 1}, sort_keys=True, default=str)
+
+    assert encoded == '{"a":1,"b":"<class \'object\'>"}'
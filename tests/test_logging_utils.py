@@ -0,0 +1,59 @@
+"""Tests for the console logging helpers."""
+
+import logging
+
+from github_ai_agent.logging_utils import BufferedConsole, console_logger, log_info
+
+
+class _Recorder(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class _Exploding:
+    def __str__(self):
+        raise AssertionError("formatted while INFO was disabled")
+
+
+def test_log_info_formats_lazily():
+    """Test that %-style arguments are only formatted when INFO is enabled."""
+    recorder = _Recorder()
+    console_logger.addHandler(recorder)
+    previous_level = console_logger.level
+    try:
+        console_logger.setLevel(logging.WARNING)
+        log_info("Discovered %s issues", "NEW_ISSUES", _Exploding())
+        assert recorder.records == []
+
+        console_logger.setLevel(logging.INFO)
+        log_info("Discovered %d issues", "NEW_ISSUES", 3)
+        assert [r.getMessage() for r in recorder.records] == ["Discovered 3 issues"]
+    finally:
+        console_logger.setLevel(previous_level)
+        console_logger.removeHandler(recorder)
+
+
+def test_buffered_console_coalesces_writes(capsys):
+    """Test that buffered output is written in one go once the limit is hit."""
+    buffered = BufferedConsole(buffered=True, max_buffer=10)
+
+    buffered.write("abc\n")
+    assert capsys.readouterr().out == ""
+
+    buffered.write("defghij\n")
+    assert capsys.readouterr().out == "abc\ndefghij\n"
+
+    buffered.write("tail\n")
+    buffered.flush()
+    assert capsys.readouterr().out == "tail\n"
+
+
+def test_unbuffered_console_writes_immediately(capsys):
+    """Test that interactive consoles see each line right away."""
+    BufferedConsole(buffered=False).write("line\n")
+
+    assert capsys.readouterr().out == "line\n"
@@ -0,0 +1,510 @@
+"""Tests for the main application's issue processing loop."""
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+
+from github_ai_agent.logging_utils import BufferedConsole
+from github_ai_agent.main import (
+    DRAFT_COMMENT_TEMPLATE,
+    MAX_CONTEXT_COMMENT_CHARS,
+    GitHubAIAgentApp,
+    LangGraphFilter,
+    _ns_to_iso,
+    _to_ns,
+    main,
+    parse_args,
+)
+from github_ai_agent.processed_issues import ProcessedIssues
+
+
+def _make_app(max_concurrency: int = 2) -> GitHubAIAgentApp:
+    """Build an app with mocked settings and clients, bypassing __init__."""
+    app = GitHubAIAgentApp.__new__(GitHubAIAgentApp)
+    app.settings = Mock(
+        issue_assignee="Test-AI-Agent",
+        issue_label="AI Agent",
+        max_concurrency=max_concurrency,
+        setup_concurrency=4,
+    )
+    app.github_client = Mock()
+    app.github_client.is_issue_being_processed.return_value = False
+    app.async_github_client = Mock()
+    app.async_github_client.get_issues_assigned_to = AsyncMock(return_value=[])
+    # GraphQL unavailable: fall back to the per-issue and REST checks
+    app.async_github_client.get_processing_issue_numbers = AsyncMock(return_value=None)
+    app.async_github_client.get_open_prs_with_recent_comments = AsyncMock(
+        return_value=None
+    )
+    app.async_github_client.iter_issues_assigned_to = Mock(
+        side_effect=lambda *args, **kwargs: _aiter(
+            app.async_github_client.get_issues_assigned_to.return_value
+        )
+    )
+    app.async_github_client.get_issues_with_label = AsyncMock(return_value=[])
+    app._agent = Mock()
+    app._agent_lock = threading.Lock()
+    app.agent_executor = ThreadPoolExecutor(
+        max_workers=max_concurrency + 1, thread_name_prefix="agent"
+    )
+    app.processed_issues = ProcessedIssues()
+    app._setup_semaphore = asyncio.Semaphore(4)
+    app._agent_semaphore = asyncio.Semaphore(max_concurrency)
+    app._issues_in_progress = set()
+    app._processed_issues_lock = asyncio.Lock()
+    app.last_pr_comment_check = None
+    app._issue_watermarks = {"assigned": None, "labeled": None}
+    return app
+
+
+async def _aiter(items):
+    for item in items:
+        yield item
+
+
+def _issue(number: int, updated_at: str = "2024-01-01T00:00:00Z") -> Mock:
+    issue = Mock()
+    issue.number = number
+    issue.title = f"Issue {number}"
+    issue.updated_at = updated_at
+    return issue
+
+
+def test_poll_processes_issues_concurrently_with_limit():
+    """Test that issues are set up together while agent work is bounded."""
+    app = _make_app(max_concurrency=2)
+    app.async_github_client.get_issues_assigned_to.return_value = [
+        _issue(n) for n in range(1, 5)
+    ]
+    app.async_github_client.create_branch = AsyncMock(return_value=True)
+    app.github_client.create_pull_request.side_effect = lambda **kwargs: Mock(
+        number=100
+    )
+
+    lock = threading.Lock()
+    active = 0
+    peak = 0
+
+    def apply_changes(context, branch_name, pr_number):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+        return Mock(success=context != 3, pr_number=pr_number)
+
+    app.agent.setup_context.side_effect = lambda number: number
+    app.agent.apply_changes.side_effect = apply_changes
+
+    asyncio.run(app.poll_and_process_issues())
+
+    assert peak == 2
+    assert app.async_github_client.create_branch.await_count == 4
+    assert set(app.processed_issues) == {1, 2, 4}
+    assert app._issues_in_progress == set()
+
+
+def test_poll_captures_exceptions_per_issue():
+    """Test that one failing issue does not abort the others."""
+    app = _make_app()
+    app.async_github_client.get_issues_assigned_to.return_value = [_issue(1), _issue(2)]
+
+    async def fake_process(issue):
+        if issue.number == 1:
+            raise RuntimeError("boom")
+        return True
+
+    app.process_new_issue = fake_process
+
+    asyncio.run(app.poll_and_process_issues())
+
+    assert set(app.processed_issues) == {2}
+
+
+def test_process_issue_async_skips_claimed_issue():
+    """Test that an issue already being processed is not claimed twice."""
+    app = _make_app()
+    app.process_new_issue = AsyncMock(return_value=True)
+    app._issues_in_progress.add(7)
+
+    assert asyncio.run(app.process_issue_async(_issue(7))) is False
+    app.process_new_issue.assert_not_called()
+
+
+def test_run_daemon_polls_without_blocking_and_stops_on_cancel():
+    """Test that the daemon loop yields to the event loop between polls."""
+    app = _make_app()
+    app.settings.webhook_enabled = False
+    app.settings.poll_interval = 0.01
+    app.settings.max_poll_interval = 0.02
+    app.async_github_client.get_issues_assigned_to.return_value = []
+    app.github_client.get_issues_with_label.return_value = []
+    app.check_pr_follow_up_comments = AsyncMock(return_value=0)
+
+    async def run() -> None:
+        daemon = asyncio.create_task(app.run_daemon())
+        await asyncio.sleep(0.1)
+        daemon.cancel()
+        await daemon
+
+    asyncio.run(run())
+
+    assert app.async_github_client.iter_issues_assigned_to.call_count > 1
+    assert app.check_pr_follow_up_comments.call_count > 1
+
+
+def test_process_new_issue_overlaps_branch_creation_with_setup():
+    """Test that branch creation and agent setup run concurrently."""
+    app = _make_app()
+    started = []
+
+    async def create_branch(branch_name):
+        started.append("branch")
+        await asyncio.sleep(0.05)
+        assert "setup" in started
+        return True
+
+    def setup_context(issue_number):
+        started.append("setup")
+        return "context"
+
+    app.async_github_client.create_branch = create_branch
+    app.agent.setup_context = setup_context
+    app.agent.apply_changes.return_value = Mock(success=True, pr_number=10)
+    app.github_client.create_pull_request.return_value = Mock(number=10)
+
+    assert asyncio.run(app.process_new_issue(_issue(3))) is True
+    app.agent.apply_changes.assert_called_once_with("context", "ai-agent/issue-3", 10)
+
+
+def test_poll_uses_since_watermark_after_successful_poll():
+    """Test that the next poll only asks for issues updated since the last."""
+    app = _make_app()
+    app.async_github_client.get_issues_assigned_to.return_value = [
+        _issue(1, "2024-01-02T00:00:00Z"),
+        _issue(2, "2024-01-03T00:00:00Z"),
+    ]
+    app.process_new_issue = AsyncMock(return_value=True)
+
+    asyncio.run(app.poll_and_process_issues())
+    assert app.async_github_client.iter_issues_assigned_to.call_args.kwargs == {
+        "since": None
+    }
+
+    asyncio.run(app.poll_and_process_issues())
+    assert app.async_github_client.iter_issues_assigned_to.call_args.kwargs == {
+        "since": "2024-01-03T00:00:00Z"
+    }
+
+
+def test_poll_keeps_watermark_when_an_issue_fails():
+    """Test that failed issues remain visible to the next poll."""
+    app = _make_app()
+    app.async_github_client.get_issues_assigned_to.return_value = [
+        _issue(1, "2024-01-02T00:00:00Z")
+    ]
+    app.process_new_issue = AsyncMock(return_value=False)
+
+    asyncio.run(app.poll_and_process_issues())
+
+    assert app._issue_watermarks["assigned"] is None
+
+
+def test_poll_keeps_watermark_when_issue_stream_is_truncated():
+    """Test that a failed page leaves the watermark for the next full poll."""
+    app = _make_app()
+
+    async def truncated(*args, **kwargs):
+        yield _issue(1, "2024-01-05T00:00:00Z")
+        raise httpx.ConnectError("page 2 failed")
+
+    app.async_github_client.iter_issues_assigned_to = Mock(side_effect=truncated)
+    app.process_new_issue = AsyncMock(return_value=True)
+
+    assert asyncio.run(app.poll_and_process_issues()) == 1
+
+    app.process_new_issue.assert_awaited_once()
+    assert app._issue_watermarks["assigned"] is None
+
+
+def test_agent_work_runs_on_dedicated_executor():
+    """Test that blocking agent work does not use the default executor."""
+    app = _make_app()
+
+    thread_name = asyncio.run(
+        app._run_agent_work(lambda: threading.current_thread().name)
+    )
+
+    assert thread_name.startswith("agent")
+
+
+def test_check_pr_follow_up_comments_reprocesses_unaddressed_prs():
+    """Test that PRs with unaddressed user comments are re-processed."""
+    app = _make_app()
+    app.last_pr_comment_check = None
+    app.github_client.is_comment_from_ai_agent.side_effect = (
+        lambda author: author == "Test-AI-Agent"
+    )
+    app.github_client.get_open_prs_with_recent_comments.return_value = [
+        {
+            "pr_number": 10,
+            "related_issue": 1,
+            "recent_comments": [
+                {"author": "user", "created_at": "2024-01-02", "body": "Fix it"},
+                {"author": "Test-AI-Agent", "created_at": "2024-01-01", "body": ""},
+            ],
+        },
+        {
+            "pr_number": 11,
+            "related_issue": 2,
+            "recent_comments": [
+                {"author": "user", "created_at": "2024-01-01", "body": "Done?"},
+                {"author": "Test-AI-Agent", "created_at": "2024-01-02", "body": ""},
+            ],
+        },
+    ]
+    app.github_client.list_agent_branches.return_value = {"ai-agent/issue-1"}
+    app._reprocess_issue_for_pr = Mock()
+
+    asyncio.run(app.check_pr_follow_up_comments())
+
+    # Only PR #10 has a user comment without a later AI agent response
+    app.github_client.get_open_prs_with_recent_comments.assert_called_once_with(
+        since_timestamp=None
+    )
+    app.github_client.get_issue.assert_called_once_with(1)
+    app._reprocess_issue_for_pr.assert_called_once()
+    assert app._reprocess_issue_for_pr.call_args.args[:2] == (10, 1)
+    # Branch existence comes from the single agent branch listing
+    assert app._reprocess_issue_for_pr.call_args.args[-1] is True
+    app.github_client.repo.get_branch.assert_not_called()
+    assert isinstance(app.last_pr_comment_check, int)
+
+
+def test_is_unprocessed_remembers_issues_being_processed():
+    """Test that a remote "being processed" hit is not re-checked later."""
+    app = _make_app()
+    app.github_client.is_issue_being_processed.return_value = True
+
+    assert app._is_unprocessed(_issue(5)) is False
+    assert app._is_unprocessed(_issue(5)) is False
+
+    app.github_client.is_issue_being_processed.assert_called_once_with(5)
+    assert 5 in app.processed_issues
+
+
+def test_parse_args_flags():
+    """Test that command line flags are parsed independently of their order."""
+    args = parse_args(["--force-app-auth", "--daemon"])
+
+    assert args.daemon is True
+    assert args.force_app_auth is True
+    assert parse_args([]).daemon is False
+
+
+def test_draft_comment_marks_issue_as_being_processed():
+    """Test that the draft comment contains the "being processed" marker."""
+    comment = DRAFT_COMMENT_TEMPLATE.substitute(pr_number=12, branch_name="b")
+
+    assert "#12" in comment
+    assert "started processing this issue" in comment
+
+
+def test_comment_timestamps_round_trip_through_epoch_ns():
+    """Test conversion between comment timestamps and epoch nanoseconds."""
+    ns = _to_ns("2024-01-02T03:04:05.000006Z")
+
+    assert ns == _to_ns(datetime(2024, 1, 2, 3, 4, 5, 6))
+    assert ns > _to_ns("2024-01-02T03:04:05Z")
+    assert _ns_to_iso(ns) == "2024-01-02T03:04:05.000006+00:00"
+
+
+def test_poll_uses_open_agent_prs_instead_of_per_issue_checks():
+    """Test that one PR listing replaces the per-issue "being processed" probes."""
+    app = _make_app()
+    app.async_github_client.get_processing_issue_numbers.return_value = {2}
+    app.async_github_client.get_issues_assigned_to.return_value = [
+        _issue(1),
+        _issue(2),
+    ]
+    app.process_new_issue = AsyncMock(return_value=True)
+
+    asyncio.run(app.poll_and_process_issues())
+
+    app.github_client.is_issue_being_processed.assert_not_called()
+    assert [call.args[0].number for call in app.process_new_issue.await_args_list] == [
+        1
+    ]
+
+
+def test_follow_up_agent_context_keeps_latest_truncated_comments():
+    """Test that only the latest unaddressed comments reach the agent, truncated."""
+    comments = [
+        {"author": "user", "created_at": f"2024-01-{day:02d}", "body": str(day)}
+        for day in range(1, 13)
+    ]
+    comments[-1]["body"] = "x" * (MAX_CONTEXT_COMMENT_CHARS + 100)
+
+    context = GitHubAIAgentApp._follow_up_agent_context(10, comments)
+
+    assert context.startswith("Follow-up comments from PR #10:")
+    assert "2024-01-02" not in context
+    assert "2024-01-03" in context
+    assert "x" * MAX_CONTEXT_COMMENT_CHARS in context
+    assert "x" * (MAX_CONTEXT_COMMENT_CHARS + 1) not in context
+
+
+def test_run_daemon_stop_interrupts_sleep():
+    """Test that stop() ends the daemon without waiting out the interval."""
+    app = _make_app()
+    app.settings.webhook_enabled = False
+    app.settings.poll_interval = 60
+    app.settings.max_poll_interval = 60
+    app.check_pr_follow_up_comments = AsyncMock(return_value=0)
+
+    async def run() -> None:
+        daemon = asyncio.create_task(app.run_daemon())
+        await asyncio.sleep(0.05)
+        app.stop()
+        await asyncio.wait_for(daemon, timeout=1)
+
+    asyncio.run(run())
+
+    assert app.check_pr_follow_up_comments.await_count == 1
+
+
+def test_follow_up_agent_context_is_json():
+    """Test that the agent context carries the comments as a JSON array."""
+    comments = [{"author": "user", "created_at": "2024-01-01", "body": 'Fix "it"'}]
+
+    context = GitHubAIAgentApp._follow_up_agent_context(7, comments)
+
+    header, payload = context.split("\n", 1)
+    assert header == "Follow-up comments from PR #7:"
+    assert json.loads(payload) == comments
+
+
+def test_langgraph_filter_hides_state_messages():
+    """Test that LangGraph state messages are dropped, raw or formatted."""
+
+    def record(msg, *args):
+        return logging.LogRecord("langgraph", logging.INFO, "", 0, msg, args, None)
+
+    log_filter = LangGraphFilter()
+
+    assert not log_filter.filter(record("[values] %s", {"a": 1}))
+    assert not log_filter.filter(record("%s state", "[updates]"))
+    assert log_filter.filter(record("Processing %s", "[values]"))
+    assert log_filter.filter(record("Issue #%d done", 1))
+
+
+def test_webhook_workers_process_deliveries_concurrently():
+    """Test that a slow webhook delivery does not block the next one."""
+    app = _make_app(max_concurrency=2)
+    app.settings.webhook_secret = "secret"
+    app.github_client.get_issue.side_effect = lambda number: Mock(number=number)
+    app._issues_in_progress = set()
+
+    async def scenario():
+        second_started = asyncio.Event()
+
+        async def process(issue):
+            if issue.number == 1:
+                # Only completes if issue #2 is picked up meanwhile
+                await second_started.wait()
+            else:
+                second_started.set()
+            return True
+
+        app.process_issue_async = process
+        with patch("github_ai_agent.main.WebhookServer") as server_cls:
+            server_cls.return_value.start = AsyncMock()
+            _, workers = await app._start_webhook_server()
+        queue = server_cls.call_args.kwargs["queue"]
+        queue.put_nowait(1)
+        queue.put_nowait(2)
+        try:
+            await asyncio.wait_for(queue.join(), timeout=5)
+        finally:
+            for worker in workers:
+                worker.cancel()
+        return workers
+
+    workers = asyncio.run(scenario())
+
+    assert len(workers) == 2
+
+
+def test_agent_created_once_on_first_use():
+    """Test that the agent is built lazily and shared across threads."""
+    app = _make_app()
+    app._agent = None
+
+    with patch("github_ai_agent.agent.GitHubIssueAgent") as agent_cls:
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            agents = list(pool.map(lambda _: app.agent, range(8)))
+        app.cleanup()
+
+    agent_cls.assert_called_once()
+    assert all(agent is agent_cls.return_value for agent in agents)
+    agent_cls.return_value.cleanup.assert_called_once()
+
+
+def test_agent_is_built_on_the_agent_executor():
+    """Test that the first agent call builds the agent off the event loop."""
+    app = _make_app()
+    app._agent = None
+    threads = []
+
+    def build(**kwargs):
+        threads.append(threading.current_thread().name)
+        return Mock()
+
+    with patch("github_ai_agent.agent.GitHubIssueAgent", side_effect=build):
+        asyncio.run(app._run_agent_work(app._call_agent, "setup_context", 1))
+
+    assert len(threads) == 1 and threads[0].startswith("agent")
+    app._agent.setup_context.assert_called_once_with(1)
+
+
+def test_cleanup_skips_agent_never_created():
+    """Test that cleanup does not create the agent just to close it."""
+    app = _make_app()
+    app._agent = None
+
+    with patch("github_ai_agent.agent.GitHubIssueAgent") as agent_cls:
+        app.cleanup()
+
+    agent_cls.assert_not_called()
+
+
+def test_main_banner_is_written_through_the_console(capsys):
+    """Test that the banner keeps its place in buffered console output."""
+    buffered = BufferedConsole(buffered=True)
+
+    with (
+        patch("github_ai_agent.logging_utils.console", buffered),
+        patch("github_ai_agent.main.parse_args", return_value=Mock(daemon=False)),
+        patch(
+            "github_ai_agent.main.get_settings",
+            return_value=Mock(log_level=logging.getLogger().level),
+        ),
+        patch("github_ai_agent.main.GitHubAIAgentApp"),
+        patch("github_ai_agent.main.asyncio.run"),
+    ):
+        main()
+        assert capsys.readouterr().out == ""
+        buffered.flush()
+
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 3
+    assert "GITHUB AI AGENT" in lines[1]
@@ -1,12 +1,21 @@
 """Tests for MCP client functionality."""
 
+import asyncio
+import gc
 import json
+import logging
+import sys
 import tempfile
+import threading
+from datetime import timedelta
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
+import httpx
 import pytest
+from mcp.types import ServerNotification, ToolListChangedNotification
 
+from github_ai_agent import json_utils, mcp_client
 from github_ai_agent.mcp_client import MCPClient, MCPServerConfig, MCPTool
 
 
@@ -97,6 +106,39 @@ def test_load_config_with_valid_file():
         Path(temp_file).unlink()
 
 
+def test_http_start_does_not_change_the_cached_config(tmp_path):
+    """Test that started HTTP servers keep the pool key of later clients."""
+    config_file = tmp_path / "mcp_config.json"
+    config_file.write_text(
+        json.dumps(
+            {
+                "mcpServers": {
+                    "remote": {
+                        "transport": "streamable_http",
+                        "url": "http://example.test/mcp",
+                        "headers": {"Authorization": "Bearer x"},
+                    }
+                }
+            }
+        )
+    )
+    first = MCPClient(str(config_file))
+    first.load_config()
+    config_hash = mcp_client._config_hash(first.server_configs["remote"])
+    first._open_connection = AsyncMock(return_value=Mock())
+
+    with patch("github_ai_agent.mcp_client.streamablehttp_client") as http_client:
+        assert asyncio.run(
+            first._start_http_server("remote", first.server_configs["remote"])
+        )
+
+    assert "Accept" in http_client.call_args.kwargs["headers"]
+    second = MCPClient(str(config_file))
+    second.load_config()
+    assert second.server_configs["remote"].headers == {"Authorization": "Bearer x"}
+    assert mcp_client._config_hash(second.server_configs["remote"]) == config_hash
+
+
 def test_load_config_with_missing_file():
     """Test loading MCP configuration when file doesn't exist."""
     client = MCPClient("nonexistent_file.json")
@@ -288,3 +330,939 @@ def test_stop_server(mock_popen):
     assert "test_server" not in client.server_processes
     mock_process.terminate.assert_called_once()
     mock_process.wait.assert_called_once_with(timeout=5)
+
+
+def test_stdio_session_reused_across_tool_calls():
+    """Test that one stdio session per server serves every tool call."""
+    client = MCPClient()
+    client.server_configs["fs"] = MCPServerConfig(name="fs", command=sys.executable)
+
+    stdio_context = Mock()
+    stdio_context.__aenter__ = AsyncMock(return_value=(Mock(), Mock()))
+    stdio_context.__aexit__ = AsyncMock(return_value=False)
+    session = Mock()
+    session.__aenter__ = AsyncMock(return_value=session)
+    session.__aexit__ = AsyncMock(return_value=False)
+    session.initialize = AsyncMock()
+    session.call_tool = AsyncMock(return_value=Mock(content=[], isError=False))
+
+    async def scenario():
+        with (
+            patch(
+                "github_ai_agent.mcp_client.stdio_client", return_value=stdio_context
+            ) as spawn,
+            patch("github_ai_agent.mcp_client.ClientSession", return_value=session),
+        ):
+            assert await client.start_server("fs")
+            assert await client.start_server("fs")
+            await client.call_tool("read_file", "fs", {"path": "a"})
+            await client.call_tool("read_file", "fs", {"path": "b"})
+        return spawn
+
+    spawn = asyncio.run(scenario())
+
+    spawn.assert_called_once()
+    session.initialize.assert_awaited_once()
+    assert session.call_tool.await_count == 2
+
+
+def test_identical_server_configs_share_one_session():
+    """Test that clients with the same server config share one connection."""
+    clients = [MCPClient(), MCPClient()]
+    for client in clients:
+        client.server_configs["fs"] = MCPServerConfig(
+            name="fs", command=sys.executable, env={"A": "1", "B": "2"}
+        )
+
+    stdio_context = Mock()
+    stdio_context.__aenter__ = AsyncMock(return_value=(Mock(), Mock()))
+    stdio_context.__aexit__ = AsyncMock(return_value=False)
+    session = Mock()
+    session.__aenter__ = AsyncMock(return_value=session)
+    session.__aexit__ = AsyncMock()
+    session.initialize = AsyncMock()
+
+    async def scenario():
+        with (
+            patch(
+                "github_ai_agent.mcp_client.stdio_client", return_value=stdio_context
+            ) as spawn,
+            patch("github_ai_agent.mcp_client.ClientSession", return_value=session),
+        ):
+            for client in clients:
+                assert await client.start_server("fs")
+            assert clients[1].sessions["fs"] is clients[0].sessions["fs"]
+
+            await clients[0].stop_server("fs")
+            session.__aexit__.assert_not_awaited()
+            await clients[1].stop_server("fs")
+            session.__aexit__.assert_awaited_once()
+        return spawn
+
+    spawn = asyncio.run(scenario())
+
+    spawn.assert_called_once()
+
+
+def test_no_share_server_gets_own_session():
+    """Test that no_share servers are never pooled."""
+    client = MCPClient()
+    client.server_configs["fs"] = MCPServerConfig(
+        name="fs", command="npx", no_share=True
+    )
+    client._start_stdio_server = AsyncMock(return_value=True)
+
+    async def scenario():
+        assert await client.start_server("fs")
+        client.sessions.pop("fs", None)
+        assert await client.start_server("fs")
+
+    asyncio.run(scenario())
+
+    assert client._start_stdio_server.await_count == 2
+    assert client._pool_keys == {}
+
+
+def test_load_config_reuses_parsed_file_until_it_changes(tmp_path):
+    """Test that an unchanged config file is parsed only once."""
+    config_file = tmp_path / "mcp_config.json"
+    config_file.write_text(json.dumps({"mcpServers": {"a": {"command": "npx"}}}))
+
+    with patch("github_ai_agent.mcp_client.loads", wraps=json_utils.loads) as load:
+        for _ in range(2):
+            client = MCPClient(str(config_file))
+            client.load_config()
+            assert list(client.server_configs) == ["a"]
+        assert load.call_count == 1
+
+        config_file.write_text(
+            json.dumps(
+                {"mcpServers": {"a": {"command": "npx"}, "b": {"command": "uvx"}}}
+            )
+        )
+        client = MCPClient(str(config_file))
+        client.load_config()
+
+    assert load.call_count == 2
+    assert list(client.server_configs) == ["a", "b"]
+
+
+def test_discover_tools_lists_once_per_connection():
+    """Test that discovered tools are cached until the server stops."""
+    client = MCPClient()
+    session = Mock()
+    session.__aexit__ = AsyncMock()
+    tool = Mock(inputSchema={}, outputSchema=None, description="Read")
+    tool.name = "read_file"
+    session.list_tools = AsyncMock(return_value=Mock(tools=[tool]))
+    client.sessions["fs"] = session
+
+    async def scenario():
+        first = await client.discover_tools("fs")
+        second = await client.discover_tools("fs")
+        await client.stop_server("fs")
+        return first, second
+
+    first, second = asyncio.run(scenario())
+
+    assert [t.name for t in first] == ["read_file"]
+    assert second is first
+    session.list_tools.assert_awaited_once()
+    assert client._tools_cache == {}
+
+
+def test_discover_tools_relists_after_tools_list_changed():
+    """Test that a tools/list_changed notification invalidates cached tools."""
+    client = MCPClient()
+    session = Mock()
+    tool = Mock(inputSchema={}, outputSchema=None, description="Read")
+    tool.name = "read_file"
+    session.list_tools = AsyncMock(return_value=Mock(tools=[tool]))
+    pair_info = {}
+    client.sessions["fs"] = session
+    client.stream_pairs["fs"] = pair_info
+    handle_message = mcp_client._tools_changed_handler(pair_info)
+
+    async def scenario():
+        await client.discover_tools("fs")
+        await handle_message(
+            ServerNotification(
+                ToolListChangedNotification(method="notifications/tools/list_changed")
+            )
+        )
+        await client.discover_tools("fs")
+        await client.discover_tools("fs")
+
+    asyncio.run(scenario())
+
+    assert session.list_tools.await_count == 2
+
+
+def test_start_stdio_server_with_missing_command():
+    """Test that an unresolvable command fails without spawning."""
+    client = MCPClient()
+    client.server_configs["fs"] = MCPServerConfig(
+        name="fs", command="no-such-mcp-server-binary"
+    )
+
+    with patch("github_ai_agent.mcp_client.stdio_client") as spawn:
+        assert not asyncio.run(client.start_server("fs"))
+
+    spawn.assert_not_called()
+
+
+def test_langchain_tool_ainvoke_awaits_call_on_mcp_loop():
+    """Test that async tool calls are awaited on the MCP client's loop."""
+    client = MCPClient()
+    client.available_tools = [
+        MCPTool(
+            name="read_file",
+            description="Read a file",
+            server_name="filesystem",
+            input_schema={"properties": {"path": {"type": "string"}}},
+        )
+    ]
+    calls = []
+
+    async def call_tool(tool_name, server_name, parameters):
+        calls.append((tool_name, server_name, parameters, asyncio.get_running_loop()))
+        return "ok"
+
+    client.call_tool = call_tool
+    client._loop = asyncio.new_event_loop()
+    loop_thread = threading.Thread(target=client._loop.run_forever, daemon=True)
+    loop_thread.start()
+    try:
+        (tool,) = client.create_langchain_tools()
+        assert asyncio.run(tool.ainvoke("README.md")) == "ok"
+    finally:
+        client._loop.call_soon_threadsafe(client._loop.stop)
+        loop_thread.join(timeout=5)
+
+    assert calls == [("read_file", "filesystem", {"path": "README.md"}, client._loop)]
+
+
+def test_initialize_async_brings_servers_up_concurrently():
+    """Test that servers start concurrently and keep their config order."""
+    client = MCPClient()
+    client.load_config = Mock()
+    for name in ("slow", "fast"):
+        client.server_configs[name] = MCPServerConfig(name=name, command="npx")
+    started = []
+
+    async def start_server(server_name):
+        started.append(server_name)
+        if server_name == "slow":
+            # Only finishes once the other server has started too
+            while len(started) < 2:
+                await asyncio.sleep(0)
+        return True
+
+    async def discover_tools(server_name):
+        return [MCPTool(server_name, "", server_name, {})]
+
+    client.start_server = start_server
+    client.discover_tools = discover_tools
+
+    tools = asyncio.run(asyncio.wait_for(client.initialize_async(), timeout=5))
+
+    assert started == ["slow", "fast"]
+    assert [tool.name for tool in tools] == ["mcp_slow_slow", "mcp_fast_fast"]
+
+
+def test_initialize_async_keeps_tools_of_servers_that_came_up():
+    """Test that one server failing unexpectedly does not drop the others."""
+    client = MCPClient()
+    client.load_config = Mock()
+    for name in ("broken", "fs"):
+        client.server_configs[name] = MCPServerConfig(name=name, command="npx")
+    client.start_server = AsyncMock(return_value=True)
+
+    async def discover_tools(server_name):
+        if server_name == "broken":
+            raise RuntimeError("session closed")
+        return [MCPTool("read_file", "", server_name, {})]
+
+    client.discover_tools = discover_tools
+
+    tools = asyncio.run(client.initialize_async())
+
+    assert [tool.name for tool in tools] == ["mcp_fs_read_file"]
+
+
+def test_initialize_async_skips_a_cancelled_server_start():
+    """Test that a cancelled bring-up is reported like any other failure."""
+    client = MCPClient()
+    client.load_config = Mock()
+    for name in ("cancelled", "fs"):
+        client.server_configs[name] = MCPServerConfig(name=name, command="npx")
+    client.start_server = AsyncMock(return_value=True)
+
+    async def discover_tools(server_name):
+        if server_name == "cancelled":
+            raise asyncio.CancelledError()
+        return [MCPTool("read_file", "", server_name, {})]
+
+    client.discover_tools = discover_tools
+
+    tools = asyncio.run(client.initialize_async())
+
+    assert [tool.name for tool in tools] == ["mcp_fs_read_file"]
+
+
+def test_langchain_tool_maps_positional_and_generic_args():
+    """Test that tool arguments map to parameters, required ones first."""
+    client = MCPClient()
+    client.available_tools = [
+        MCPTool(
+            name="write_file",
+            description="Write a file",
+            server_name="filesystem",
+            input_schema={
+                "properties": {"content": {}, "path": {}},
+                "required": ["path"],
+            },
+        )
+    ]
+    client.call_tool = AsyncMock(return_value="ok")
+
+    (tool,) = client.create_langchain_tools()
+
+    assert tool.func("a.txt", "hi") == "ok"
+    assert tool.func(__arg1="a.txt", __arg2="hi") == "ok"
+    assert tool.func(path="a.txt", tool_name="x") == "ok"
+    assert [c.args for c in client.call_tool.await_args_list] == [
+        ("write_file", "filesystem", {"path": "a.txt", "content": "hi"}),
+        ("write_file", "filesystem", {"path": "a.txt", "content": "hi"}),
+        ("write_file", "filesystem", {"path": "a.txt", "tool_name": "x"}),
+    ]
+
+
+def test_call_tool_caches_read_only_results_until_a_write():
+    """Test that read-only tool results are reused until another tool runs."""
+    client = MCPClient()
+    client.server_configs["fs"] = MCPServerConfig(name="fs", command="npx")
+    client._call_tool = AsyncMock(
+        return_value={"success": True, "content": ["data"], "isError": False}
+    )
+
+    async def scenario():
+        first = await client.call_tool("read_file", "fs", {"path": "a"})
+        assert await client.call_tool("read_file", "fs", {"path": "a"}) == first
+        await client.call_tool("read_file", "fs", {"path": "b"})
+        await client.call_tool("write_file", "fs", {"path": "a"})
+        await client.call_tool("read_file", "fs", {"path": "a"})
+
+    asyncio.run(scenario())
+
+    assert [c.args[0] for c in client._call_tool.await_args_list] == [
+        "read_file",
+        "read_file",
+        "write_file",
+        "read_file",
+    ]
+
+
+def test_call_tool_does_not_cache_failures_or_disabled_tools():
+    """Test that errors and tools outside cacheable_tools always hit the server."""
+    client = MCPClient()
+    client.server_configs["fs"] = MCPServerConfig(
+        name="fs", command="npx", cacheable_tools=frozenset()
+    )
+    client.server_configs["gh"] = MCPServerConfig(name="gh", command="npx")
+    client._call_tool = AsyncMock(return_value={"success": False, "error": "boom"})
+
+    async def scenario():
+        for _ in range(2):
+            await client.call_tool("read_file", "fs", {"path": "a"})
+            await client.call_tool("get_file_contents", "gh", {"path": "a"})
+
+    asyncio.run(scenario())
+
+    assert client._call_tool.await_count == 4
+    assert not client._result_cache
+
+
+def test_call_tool_formats_content_by_type():
+    """Test that result content is reported according to its MCP type."""
+    from mcp import types
+
+    client = MCPClient()
+    session = Mock()
+    session.call_tool = AsyncMock(
+        return_value=types.CallToolResult(
+            content=[
+                types.TextContent(type="text", text="hello"),
+                types.ImageContent(type="image", data="AAAA", mimeType="image/png"),
+                types.EmbeddedResource(
+                    type="resource",
+                    resource=types.TextResourceContents(uri="file:///a", text="a"),
+                ),
+            ]
+        )
+    )
+    client.sessions["fs"] = session
+
+    result = json.loads(asyncio.run(client.call_tool("read_file", "fs", {})))
+
+    assert result == {"success": True, "content": ["hello", "AAAA"], "isError": False}
+
+
+def test_discover_tools_persists_stdio_tools_across_clients(tmp_path):
+    """Test that a later client reuses tools cached on disk by an earlier one."""
+
+    def make_client(name, args):
+        client = MCPClient()
+        client.server_configs[name] = MCPServerConfig(
+            name=name, command=sys.executable, args=args
+        )
+        tool = Mock(inputSchema={"type": "object"}, outputSchema=None, description="")
+        tool.name = "read_file"
+        session = Mock()
+        session.list_tools = AsyncMock(return_value=Mock(tools=[tool]))
+        client.sessions[name] = session
+        return client, session
+
+    with patch("github_ai_agent.mcp_client.TOOLS_CACHE_DIR", tmp_path):
+        first, first_session = make_client("fs", ["server.py"])
+        asyncio.run(first.discover_tools("fs"))
+
+        second, second_session = make_client("files", ["server.py"])
+        tools = asyncio.run(second.discover_tools("files"))
+
+        changed, changed_session = make_client("fs", ["other.py"])
+        asyncio.run(changed.discover_tools("fs"))
+
+    first_session.list_tools.assert_awaited_once()
+    second_session.list_tools.assert_not_awaited()
+    changed_session.list_tools.assert_awaited_once()
+    assert tools == [
+        MCPTool(
+            name="read_file",
+            description="",
+            server_name="files",
+            input_schema={"type": "object"},
+        )
+    ]
+
+
+def test_stdio_server_stderr_goes_to_log_file(tmp_path):
+    """Test that server stderr is logged to a file that closes with the server."""
+    client = MCPClient()
+    client.server_configs["fs"] = MCPServerConfig(
+        name="fs", command=sys.executable, no_share=True
+    )
+    stdio_context = Mock()
+    stdio_context.__aenter__ = AsyncMock(return_value=(Mock(), Mock()))
+    stdio_context.__aexit__ = AsyncMock(return_value=False)
+    session = Mock()
+    session.__aenter__ = AsyncMock(return_value=session)
+    session.__aexit__ = AsyncMock()
+    session.initialize = AsyncMock()
+
+    async def scenario():
+        with (
+            patch(
+                "github_ai_agent.mcp_client.stdio_client", return_value=stdio_context
+            ) as spawn,
+            patch("github_ai_agent.mcp_client.ClientSession", return_value=session),
+        ):
+            assert await client.start_server("fs")
+            errlog = spawn.call_args.kwargs["errlog"]
+            assert not errlog.closed
+            await client.stop_server("fs")
+        return errlog
+
+    errlog = asyncio.run(scenario())
+
+    assert errlog.name == str(tmp_path / "logs" / "fs.stderr.log")
+    assert errlog.closed
+    stdio_context.__aexit__.assert_awaited_once()
+
+
+def test_langchain_tool_answers_cached_results_without_the_loop():
+    """Test that cached read-only results skip the hop to the MCP loop."""
+    client = MCPClient()
+    client.server_configs["fs"] = MCPServerConfig(name="fs", command="npx")
+    client.available_tools = [
+        MCPTool(
+            name="read_file",
+            description="Read a file",
+            server_name="fs",
+            input_schema={"properties": {"path": {}}},
+        )
+    ]
+    cache_key = client._result_cache_key("read_file", "fs", {"path": "a"})
+    client._result_cache[cache_key] = "cached"
+    client._loop = Mock()
+
+    (tool,) = client.create_langchain_tools()
+
+    with patch("github_ai_agent.mcp_client.asyncio.run_coroutine_threadsafe") as hop:
+        assert tool.func("a") == "cached"
+        assert asyncio.run(tool.ainvoke("a")) == "cached"
+
+    hop.assert_not_called()
+
+
+def test_call_tool_does_not_format_logs_eagerly():
+    """Test that tool calls do not build debug strings that are not emitted."""
+    client = MCPClient()
+    result = Mock(content=[], isError=False)
+    session = Mock()
+    session.call_tool = AsyncMock(return_value=result)
+    client.sessions["fs"] = session
+
+    with patch("github_ai_agent.mcp_client.logger") as logger:
+        asyncio.run(client.call_tool("write_file", "fs", {"path": "a"}))
+
+    logger.info.assert_called_once_with(
+        "Calling tool '%s' on server '%s' with parameters: %s",
+        "write_file",
+        "fs",
+        {"path": "a"},
+    )
+
+
+def test_unreferenced_client_closes_its_sessions():
+    """Test that a client dropped without cleanup still closes its sessions."""
+    stdio_context = Mock()
+    stdio_context.__aenter__ = AsyncMock(return_value=(Mock(), Mock()))
+    stdio_context.__aexit__ = AsyncMock(return_value=False)
+    session = Mock()
+    session.__aenter__ = AsyncMock(return_value=session)
+    session.__aexit__ = AsyncMock(return_value=False)
+    session.initialize = AsyncMock()
+    client = MCPClient()
+    client.load_config = Mock()
+    client.server_configs["fs"] = MCPServerConfig(
+        name="fs", command=sys.executable, no_share=True
+    )
+    client.discover_tools = AsyncMock(return_value=[])
+    loop = asyncio.new_event_loop()
+    loop_thread = threading.Thread(target=loop.run_forever, daemon=True)
+    loop_thread.start()
+    try:
+        with (
+            patch(
+                "github_ai_agent.mcp_client.stdio_client", return_value=stdio_context
+            ),
+            patch("github_ai_agent.mcp_client.ClientSession", return_value=session),
+        ):
+            asyncio.run_coroutine_threadsafe(client.initialize_async(), loop).result(5)
+        del client
+        gc.collect()
+        session.__aexit__.assert_awaited_once()
+        stdio_context.__aexit__.assert_awaited_once()
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        loop_thread.join(timeout=5)
+        loop.close()
+
+
+def test_async_context_manager_cleans_up_on_exit():
+    """Test that async with closes the client's connections on exit."""
+    client = MCPClient()
+    client.load_config = Mock()
+    client.server_configs["fs"] = MCPServerConfig(name="fs", command="npx")
+    client.start_server = AsyncMock(return_value=True)
+    client.discover_tools = AsyncMock(return_value=[])
+    client.stop_all_servers = AsyncMock()
+
+    async def scenario():
+        async with client as entered:
+            assert entered is client
+            await client.initialize_async()
+
+    asyncio.run(scenario())
+
+    client.stop_all_servers.assert_awaited_once()
+    assert not client._running
+
+
+def test_http_servers_on_one_host_share_a_connection_pool():
+    """Test that HTTP clients for one host reuse a single transport."""
+    requests = []
+
+    def handler(request):
+        requests.append(str(request.url))
+        return httpx.Response(200, json={})
+
+    async def scenario():
+        with patch(
+            "github_ai_agent.mcp_client.httpx.AsyncHTTPTransport",
+            side_effect=lambda **kwargs: httpx.MockTransport(handler),
+        ) as make_transport:
+            first = mcp_client._pooled_http_client("https://mcp.example.com/a")
+            second = mcp_client._pooled_http_client("https://mcp.example.com/b")
+            other = mcp_client._pooled_http_client("https://other.example.com/mcp")
+            async with first, second, other:
+                await first.get("https://mcp.example.com/a")
+                await second.get("https://mcp.example.com/b")
+                assert make_transport.call_count == 2
+                await first.aclose()
+                assert len(mcp_client._HTTP_POOL) == 2
+
+    asyncio.run(scenario())
+
+    assert requests == ["https://mcp.example.com/a", "https://mcp.example.com/b"]
+    assert mcp_client._HTTP_POOL == {}
+
+
+def test_call_tool_caps_concurrent_calls_per_server():
+    """Test that parallel tool calls wait for a slot on the server."""
+    client = MCPClient()
+    client.server_configs["fs"] = MCPServerConfig(name="fs", command="npx")
+    in_flight = []
+    peak = []
+
+    async def call_tool(tool_name, parameters, read_timeout_seconds=None):
+        in_flight.append(tool_name)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.remove(tool_name)
+        return Mock(content=[], isError=False)
+
+    session = Mock()
+    session.call_tool = call_tool
+    client.sessions["fs"] = session
+
+    async def scenario():
+        client.stream_pairs["fs"] = {"call_limit": asyncio.Semaphore(2)}
+        return await asyncio.gather(
+            *(client.call_tool("write_file", "fs", {"n": n}) for n in range(5))
+        )
+
+    results = asyncio.run(scenario())
+
+    assert len(results) == 5
+    assert max(peak) == 2
+
+
+def test_langchain_tool_without_loop_runs_on_shared_loop():
+    """Test that sync tool calls never start a new event loop per call."""
+    client = MCPClient()
+    client.available_tools = [MCPTool("write_file", "Write", "fs", {})]
+    loops = []
+
+    async def call_tool(tool_name, server_name, parameters):
+        loops.append(asyncio.get_running_loop())
+        return "ok"
+
+    client.call_tool = call_tool
+    (tool,) = client.create_langchain_tools()
+
+    with patch("github_ai_agent.mcp_client.asyncio.run") as run:
+        assert tool.func() == "ok"
+        assert tool.func() == "ok"
+
+    run.assert_not_called()
+    assert loops == [mcp_client._get_shared_loop()] * 2
+
+
+def test_shared_loop_uses_uvloop_when_installed():
+    """Test that the shared loop is created by uvloop when it is available."""
+    fake_uvloop = Mock()
+    fake_uvloop.new_event_loop.side_effect = asyncio.new_event_loop
+
+    with (
+        patch.object(mcp_client, "_shared_loop", None),
+        patch.object(mcp_client, "uvloop", fake_uvloop),
+    ):
+        loop = mcp_client._get_shared_loop()
+        try:
+            assert (
+                asyncio.run_coroutine_threadsafe(asyncio.sleep(0, "ok"), loop).result(
+                    timeout=5
+                )
+                == "ok"
+            )
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+
+    fake_uvloop.new_event_loop.assert_called_once_with()
+
+
+def test_initialize_async_caps_concurrent_server_starts():
+    """Test that only a bounded number of servers start at once."""
+    client = MCPClient()
+    client.load_config = Mock()
+    for n in range(8):
+        client.server_configs[f"s{n}"] = MCPServerConfig(name=f"s{n}", command="npx")
+    starting = []
+    peak = []
+
+    async def start_server(server_name):
+        starting.append(server_name)
+        peak.append(len(starting))
+        await asyncio.sleep(0.01)
+        starting.remove(server_name)
+        return True
+
+    client.start_server = start_server
+    client.discover_tools = AsyncMock(return_value=[])
+
+    with patch("github_ai_agent.mcp_client.MAX_CONCURRENT_STARTS", 3):
+        asyncio.run(client.initialize_async())
+
+    assert len(peak) == 8
+    assert max(peak) == 3
+
+
+def test_call_tool_fails_fast_while_a_server_keeps_failing():
+    """Test that repeated call failures open the server's circuit breaker."""
+    client = MCPClient()
+    client.server_configs["fs"] = MCPServerConfig(name="fs", command="npx")
+    session = Mock()
+    session.call_tool = AsyncMock(side_effect=TimeoutError("timed out"))
+    client.sessions["fs"] = session
+    client.stream_pairs["fs"] = {"breaker": mcp_client._CircuitBreaker()}
+
+    def call():
+        return json.loads(asyncio.run(client.call_tool("write_file", "fs", {})))
+
+    with patch("github_ai_agent.mcp_client.time.monotonic", return_value=100.0):
+        call()
+        call()
+        assert "try again later" in call()["error"]
+    assert session.call_tool.await_count == 2
+
+    session.call_tool = AsyncMock(return_value=Mock(content=[], isError=False))
+    with patch("github_ai_agent.mcp_client.time.monotonic", return_value=131.0):
+        assert call()["success"]
+        assert call()["success"]
+    assert session.call_tool.await_count == 2
+
+
+def test_slow_server_handshake_times_out_and_closes_connection():
+    """Test that a server missing connect_timeout is disconnected."""
+    client = MCPClient()
+    client.server_configs["fs"] = MCPServerConfig(
+        name="fs", command=sys.executable, connect_timeout=0.01
+    )
+    stdio_context = Mock()
+    stdio_context.__aenter__ = AsyncMock(return_value=(Mock(), Mock()))
+    stdio_context.__aexit__ = AsyncMock(return_value=False)
+    session = Mock()
+    session.__aenter__ = AsyncMock(return_value=session)
+    session.__aexit__ = AsyncMock(return_value=False)
+
+    async def initialize():
+        await asyncio.sleep(1)
+
+    session.initialize = initialize
+
+    async def scenario():
+        with (
+            patch(
+                "github_ai_agent.mcp_client.stdio_client", return_value=stdio_context
+            ),
+            patch("github_ai_agent.mcp_client.ClientSession", return_value=session),
+        ):
+            return await client.start_server("fs")
+
+    assert asyncio.run(scenario()) is False
+    session.__aexit__.assert_awaited_once()
+    stdio_context.__aexit__.assert_awaited_once()
+    assert client.sessions == {} and client.stream_pairs == {}
+
+
+def test_call_tool_passes_the_server_call_timeout():
+    """Test that tool calls are bounded by the server's call_timeout."""
+    client = MCPClient()
+    client.server_configs["fs"] = MCPServerConfig(
+        name="fs", command="npx", call_timeout=5
+    )
+    session = Mock()
+    session.call_tool = AsyncMock(return_value=Mock(content=[], isError=False))
+    client.sessions["fs"] = session
+
+    asyncio.run(client.call_tool("write_file", "fs", {"path": "a"}))
+
+    session.call_tool.assert_awaited_once_with(
+        "write_file", {"path": "a"}, read_timeout_seconds=timedelta(seconds=5)
+    )
+
+
+def test_wrapper_timeouts_follow_the_configured_timeouts():
+    """Test that the blocking waits are sized from the server timeouts."""
+    client = MCPClient()
+    for n in range(6):
+        client.server_configs[f"s{n}"] = MCPServerConfig(
+            name=f"s{n}", command="npx", connect_timeout=20, call_timeout=90
+        )
+
+    assert client._call_deadline("s0") == 90 + mcp_client.TIMEOUT_MARGIN
+    assert client._call_deadline("unknown") == (
+        mcp_client.DEFAULT_CALL_TIMEOUT + mcp_client.TIMEOUT_MARGIN
+    )
+    # Six servers start in two rounds of MAX_CONCURRENT_STARTS
+    assert client._startup_deadline() == 2 * (20 + 90) + mcp_client.TIMEOUT_MARGIN
+
+
+def test_sync_tool_call_timeout_cancels_the_call():
+    """Test that a sync call giving up also stops the call on the MCP loop."""
+    client = MCPClient()
+    client.server_configs["fs"] = MCPServerConfig(
+        name="fs", command="npx", call_timeout=0.05
+    )
+    cancelled = threading.Event()
+
+    async def call_tool(tool_name, server_name, parameters):
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    client.call_tool = call_tool
+
+    with patch.object(mcp_client, "TIMEOUT_MARGIN", 0):
+        with pytest.raises(TimeoutError):
+            client._run_tool("write_file", "fs", [])
+
+    assert cancelled.wait(timeout=5)
+
+
+def test_identical_concurrent_reads_share_one_call():
+    """Test that concurrent identical read-only calls are coalesced."""
+    client = MCPClient()
+    client.server_configs["fs"] = MCPServerConfig(name="fs", command="npx")
+    calls = []
+
+    async def call_tool(tool_name, server_name, parameters):
+        calls.append((tool_name, parameters))
+        await asyncio.sleep(0.01)
+        return {"success": True, "content": [parameters["path"]], "isError": False}
+
+    client._call_tool = call_tool
+
+    async def scenario():
+        return await asyncio.gather(
+            client.call_tool("read_file", "fs", {"path": "a"}),
+            client.call_tool("read_file", "fs", {"path": "a"}),
+            client.call_tool("read_file", "fs", {"path": "b"}),
+            client.call_tool("write_file", "fs", {"path": "a"}),
+            client.call_tool("write_file", "fs", {"path": "a"}),
+        )
+
+    results = asyncio.run(scenario())
+
+    assert results[0] == results[1]
+    assert calls == [
+        ("read_file", {"path": "a"}),
+        ("read_file", {"path": "b"}),
+        ("write_file", {"path": "a"}),
+        ("write_file", {"path": "a"}),
+    ]
+    assert client._in_flight == {}
+
+
+def test_joined_read_survives_cancellation_of_the_first_caller():
+    """Test that cancelling the caller of a shared read does not cancel others."""
+    client = MCPClient()
+    client.server_configs["fs"] = MCPServerConfig(name="fs", command="npx")
+    calls = []
+
+    async def call_tool(tool_name, server_name, parameters):
+        calls.append(tool_name)
+        await asyncio.sleep(0.01)
+        return {"success": True, "content": ["a"], "isError": False}
+
+    client._call_tool = call_tool
+
+    async def scenario():
+        first = asyncio.ensure_future(client.call_tool("read_file", "fs", {}))
+        await asyncio.sleep(0)
+        joined = asyncio.ensure_future(client.call_tool("read_file", "fs", {}))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await joined, first.cancelled()
+
+    result, first_cancelled = asyncio.run(scenario())
+
+    assert first_cancelled
+    assert json.loads(result)["content"] == ["a"]
+    assert calls == ["read_file", "read_file"]
+    assert client._in_flight == {}
+
+
+def test_reads_after_a_write_do_not_join_earlier_reads():
+    """Test that a write stops later reads from sharing an older request."""
+    client = MCPClient()
+    client.server_configs["fs"] = MCPServerConfig(name="fs", command="npx")
+    calls = []
+
+    async def call_tool(tool_name, server_name, parameters):
+        calls.append(tool_name)
+        await asyncio.sleep(0.01)
+        return {"success": True, "content": [len(calls)], "isError": False}
+
+    client._call_tool = call_tool
+
+    async def scenario():
+        first = asyncio.ensure_future(client.call_tool("read_file", "fs", {}))
+        await asyncio.sleep(0)
+        await client.call_tool("write_file", "fs", {})
+        return await first, await client.call_tool("read_file", "fs", {})
+
+    before, after = asyncio.run(scenario())
+
+    assert calls == ["read_file", "write_file", "read_file"]
+    assert before != after
+
+
+def test_generic_args_map_by_number():
+    """Test that generic arguments map in numeric rather than string order."""
+    param_names = [f"p{n}" for n in range(1, 12)]
+    kwargs = {f"__arg{n}": n for n in range(1, 12)}
+
+    parameters = mcp_client._map_tool_args(param_names, (), kwargs)
+
+    assert parameters == {f"p{n}": n for n in range(1, 12)}
+
+
+def test_failed_tool_call_logs_one_error_without_traceback(caplog):
+    """Test that tracebacks of failed tool calls are only logged at debug level."""
+    client = MCPClient()
+    session = Mock()
+    session.call_tool = AsyncMock(side_effect=ValueError("bad input"))
+    client.sessions["fs"] = session
+
+    with caplog.at_level(logging.INFO, logger="github_ai_agent.mcp_client"):
+        asyncio.run(client.call_tool("write_file", "fs", {}))
+
+    errors = [r for r in caplog.records if r.levelno >= logging.ERROR]
+    assert [r.getMessage() for r in errors] == [
+        "Error calling tool write_file on fs: ValueError: bad input"
+    ]
+    assert not any(r.exc_info for r in caplog.records)
+
+
+def test_langchain_tool_description_lists_parameters():
+    """Test that tool descriptions list parameters, marking required ones."""
+    client = MCPClient()
+    client.available_tools = [
+        MCPTool(
+            name="write_file",
+            description="Write a file",
+            server_name="fs",
+            input_schema={
+                "properties": {
+                    "path": {"type": "string", "description": "Target path"},
+                    "content": {"title": "Content"},
+                },
+                "required": ["path"],
+            },
+        ),
+        MCPTool("list_roots", "List roots", "fs", {}),
+    ]
+
+    write_tool, list_tool = client.create_langchain_tools()
+
+    assert write_tool.description == (
+        "[MCP fs] Write a file\n\nParameters:\n"
+        "- path (string) (required): Target path\n"
+        "- content (string): Content"
+    )
+    assert list_tool.description == "[MCP fs] List roots"
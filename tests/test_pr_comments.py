@@ -177,3 +177,27 @@ class TestPRComments:
 
                     mock_get_comments.assert_called_once_with(123, None)
                     mock_find_issue.assert_called_once_with(123)
+
+    def test_is_comment_from_ai_agent_classifies_logins(self):
+        """Test AI agent login detection by username pattern."""
+        with patch("github_ai_agent.github_client.Github"):
+            client = GitHubClient(
+                target_owner="test", target_repo="test", token="fake_token"
+            )
+
+        assert client.is_comment_from_ai_agent("Test-AI-Agent")
+        assert client.is_comment_from_ai_agent("renovate[bot]")
+        assert not client.is_comment_from_ai_agent("octocat")
+
+    def test_is_comment_from_ai_agent_matches_configured_logins(self):
+        """Test configured agent logins are recognised regardless of case."""
+        with patch("github_ai_agent.github_client.Github"):
+            client = GitHubClient(
+                target_owner="test",
+                target_repo="test",
+                token="fake_token",
+                agent_logins=["Helper-Account"],
+            )
+
+        assert client.is_comment_from_ai_agent("helper-account")
+        assert not client.is_comment_from_ai_agent("octocat")
@@ -0,0 +1,41 @@
+"""Tests for processed issue bookkeeping."""
+
+from github_ai_agent.processed_issues import ProcessedIssues
+
+
+def test_processed_issues_membership():
+    """Test that added issues are reported as processed."""
+    processed = ProcessedIssues()
+    processed.add(1)
+    processed.add(2)
+
+    assert 1 in processed
+    assert 3 not in processed
+    assert len(processed) == 2
+
+
+def test_processed_issues_evicts_oldest_when_full():
+    """Test that the least recently added issue is evicted at capacity."""
+    processed = ProcessedIssues(max_size=2)
+    processed.add(1)
+    processed.add(2)
+    processed.add(1)  # refreshes issue 1
+    processed.add(3)
+
+    assert list(processed) == [1, 3]
+    assert 2 not in processed
+
+
+def test_processed_issues_persist_across_instances(tmp_path):
+    """Test that processed issues survive a restart when backed by SQLite."""
+    db_path = str(tmp_path / "processed.db")
+    processed = ProcessedIssues(db_path=db_path, repo="owner/repo")
+    processed.add(7)
+    processed.close()
+
+    restarted = ProcessedIssues(db_path=db_path, repo="owner/repo")
+    other_repo = ProcessedIssues(db_path=db_path, repo="owner/other")
+
+    assert 7 in restarted
+    assert 8 not in restarted
+    assert 7 not in other_repo
@@ -0,0 +1,114 @@
+"""Tests for the GitHub webhook receiver."""
+
+import asyncio
+import hashlib
+import hmac
+import json
+from unittest.mock import AsyncMock, Mock
+
+from github_ai_agent.webhook import WebhookServer, verify_signature
+
+
+def _sign(secret: str, body: bytes) -> str:
+    return "sha256=" + hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+
+
+def _server() -> WebhookServer:
+    return WebhookServer(
+        secret="s3cret",
+        queue=asyncio.Queue(),
+        label="AI Agent",
+        assignee="Test-AI-Agent",
+    )
+
+
+def test_verify_signature_valid():
+    """Test that a correctly signed body is accepted."""
+    body = b'{"action": "opened"}'
+    assert verify_signature("s3cret", body, _sign("s3cret", body)) is True
+
+
+def test_verify_signature_invalid():
+    """Test that wrong or missing signatures are rejected."""
+    body = b'{"action": "opened"}'
+    assert verify_signature("s3cret", body, _sign("other", body)) is False
+    assert verify_signature("s3cret", body, None) is False
+    assert verify_signature("s3cret", body, "sha1=abc") is False
+
+
+def test_get_issue_number_for_labeled_issue():
+    """Test that labeling an open issue with the agent label queues it."""
+    payload = {
+        "action": "labeled",
+        "issue": {
+            "number": 42,
+            "state": "open",
+            "labels": [{"name": "AI Agent"}],
+            "assignees": [],
+        },
+    }
+    assert _server().get_issue_number("issues", payload) == 42
+
+
+def test_get_issue_number_for_assigned_issue():
+    """Test that assigning an issue to the agent queues it."""
+    payload = {
+        "action": "assigned",
+        "issue": {
+            "number": 7,
+            "state": "open",
+            "labels": [],
+            "assignees": [{"login": "Test-AI-Agent"}],
+        },
+    }
+    assert _server().get_issue_number("issues", payload) == 7
+
+
+def test_get_issue_number_ignores_irrelevant_events():
+    """Test that unrelated events and issues are ignored."""
+    server = _server()
+    issue = {"number": 1, "state": "open", "labels": [], "assignees": []}
+
+    assert (
+        server.get_issue_number("issues", {"action": "opened", "issue": issue}) is None
+    )
+    assert server.get_issue_number("push", {"action": "opened"}) is None
+
+    closed = dict(issue, state="closed", labels=[{"name": "AI Agent"}])
+    assert (
+        server.get_issue_number("issues", {"action": "labeled", "issue": closed})
+        is None
+    )
+
+
+def _request(body: bytes, event: str = "issues") -> Mock:
+    request = Mock(headers={"X-GitHub-Event": event})
+    request.headers["X-Hub-Signature-256"] = _sign("s3cret", body)
+    request.read = AsyncMock(return_value=body)
+    return request
+
+
+def test_handle_queues_issue_from_payload():
+    """Test that a valid delivery is parsed and its issue queued."""
+    server = _server()
+    body = json.dumps(
+        {
+            "action": "opened",
+            "issue": {"number": 9, "state": "open", "labels": [{"name": "AI Agent"}]},
+        }
+    ).encode()
+
+    response = asyncio.run(server.handle(_request(body)))
+
+    assert response.status == 202
+    assert server.queue.get_nowait() == 9
+
+
+def test_handle_rejects_invalid_json():
+    """Test that a malformed body is answered with 400."""
+    server = _server()
+
+    response = asyncio.run(server.handle(_request(b"{not json")))
+
+    assert response.status == 400
+    assert server.queue.empty()